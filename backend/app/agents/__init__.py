@@ -8,6 +8,7 @@ from .greedy import GreedyAgent
 from .politician import PoliticianAgent
 from .warlord import WarlordAgent
 from .clear_agent import ClearAgent, create_clear_agent
+from .remote import BrainPool, RemoteAgent
 
 __all__ = [
     "CheaterAgent",
@@ -16,4 +17,6 @@ __all__ = [
     "WarlordAgent",
     "ClearAgent",
     "create_clear_agent",
+    "BrainPool",
+    "RemoteAgent",
 ]
\ No newline at end of file
@@ -1,13 +1,25 @@
 from __future__ import annotations
 
+from random import Random
+from typing import Sequence
+
 from ..domain.actions import Action, ActionType
-from ..domain.agent import Agent, AgentObservation
+from ..domain.agent import Agent, AgentObservation, batch_rngs
+from .targeting import ColumnCache, first_other, leaders
 
 
 class CheaterAgent(Agent):
     name = "cheater"
+    supports_batch = True
 
     def decide(self, obs: AgentObservation, rng) -> Action:
+        return self._decide(obs, rng, ColumnCache())
+
+    def decide_batch(self, observations: Sequence[AgentObservation], rng: Random | Sequence[Random]) -> list[Action]:
+        cache = ColumnCache()
+        return [self._decide(obs, r, cache) for obs, r in zip(observations, batch_rngs(rng))]
+
+    def _decide(self, obs: AgentObservation, rng, cache: ColumnCache) -> Action:
         if obs.pending_proposal is not None:
             key = obs.pending_proposal.get("key")
             if key in {"steal_amount", "steal_success_base"}:
@@ -20,9 +32,20 @@ class CheaterAgent(Agent):
             if rng.random() < 0.55:
                 return Action(actor=obs.self_id, kind=ActionType.STEAL, target=obs.last_harm_from)
 
-        targets = [aid for aid in obs.alive_ids if aid != obs.self_id and obs.token_balance_by_agent[aid] > 0]
-        if targets and obs.self_token_balance >= obs.current_rules.get("steal_min_token_balance", 0):
-            target = max(targets, key=lambda aid: obs.token_balance_by_agent[aid] + int((1 - obs.trust_by_agent[aid]) * 3))
+        balances = obs.token_balance_by_agent
+        trust = obs.trust_by_agent
+        target = first_other(
+            cache.get(
+                obs,
+                "juiciest",
+                lambda: leaders(
+                    (aid for aid in obs.alive_ids if balances[aid] > 0),
+                    key=lambda aid: -(balances[aid] + int((1 - trust[aid]) * 3)),
+                ),
+            ),
+            obs.self_id,
+        )
+        if target is not None and obs.self_token_balance >= obs.current_rules.get("steal_min_token_balance", 0):
             return Action(actor=obs.self_id, kind=ActionType.STEAL, target=target)
 
         if rng.random() < 0.08:
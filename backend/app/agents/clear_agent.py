@@ -54,43 +54,30 @@ class ClearAgent(Agent):
         if obs.pending_proposal is not None:
             return self._decide_vote(obs, rng)
         
-        # Compute utility for all possible actions
-        actions_with_utility = []
-        
-        # WORK action
-        work_utility = self._compute_work_utility(obs)
-        actions_with_utility.append((work_utility, Action(actor=obs.self_id, kind=ActionType.WORK)))
-        
-        # STEAL actions (for each potential target)
+        # Candidates are scored in the order WORK, STEAL targets, ATTACK targets,
+        # PROPOSE_RULE; the first one with the highest utility wins, and only
+        # that one is turned into an Action.
+        best_utility = self._compute_work_utility(obs)
+        best_kind, best_target = ActionType.WORK, None
+
         others = [aid for aid in obs.alive_ids if aid != obs.self_id]
-        for target_id in others:
-            if obs.token_balance_by_agent[target_id] > 0:
-                steal_utility = self._compute_steal_utility(obs, target_id)
-                actions_with_utility.append((
-                    steal_utility,
-                    Action(actor=obs.self_id, kind=ActionType.STEAL, target=target_id)
-                ))
-        
-        # ATTACK actions (for each potential target)
-        for target_id in others:
-            attack_utility = self._compute_attack_utility(obs, target_id)
-            actions_with_utility.append((
-                attack_utility,
-                Action(actor=obs.self_id, kind=ActionType.ATTACK, target=target_id)
-            ))
-        
+        if others:
+            columns = self._target_columns(obs, others)
+            for kind, utilities in (
+                (ActionType.STEAL, self._steal_utilities(obs, columns)),
+                (ActionType.ATTACK, self._attack_utilities(obs, columns)),
+            ):
+                for target_id, utility in utilities:
+                    if utility > best_utility:
+                        best_utility, best_kind, best_target = utility, kind, target_id
+
         # PROPOSE_RULE action
         if self._should_propose_rule(obs, rng):
             proposal_utility = self._compute_proposal_utility(obs)
-            proposal_action = self._generate_strategic_proposal(obs)
-            actions_with_utility.append((proposal_utility, proposal_action))
-        
-        # Select action with highest utility
-        if not actions_with_utility:
-            return Action(actor=obs.self_id, kind=ActionType.WORK)
-        
-        best_utility, best_action = max(actions_with_utility, key=lambda x: x[0])
-        return best_action
+            if proposal_utility > best_utility:
+                return self._generate_strategic_proposal(obs)
+
+        return Action(actor=obs.self_id, kind=best_kind, target=best_target)
     
     def _compute_work_utility(self, obs: AgentObservation) -> float:
         """Compute utility of working (safe, guaranteed income)."""
@@ -100,86 +87,106 @@ class ClearAgent(Agent):
         # Work is safe and reliable
         utility = expected_gain * (1.0 + self.personality.risk_tolerance * 0.2)
         return utility
-    
-    def _compute_steal_utility(self, obs: AgentObservation, target_id: int) -> float:
-        """Compute utility of stealing from a specific target."""
+
+    @staticmethod
+    def _target_columns(obs: AgentObservation, others: list[int]) -> tuple[list[int], list[int], list[int]]:
+        """Target ids with their token balances and strengths, as parallel columns."""
+        balances = obs.token_balance_by_agent
+        strengths = obs.strength_by_agent
+        return others, [balances[aid] for aid in others], [strengths[aid] for aid in others]
+
+    def _success_by_strength(self, obs: AgentObservation, table: str) -> dict[int, float]:
+        """Per-target-strength success probabilities for this observer.
+
+        Only a handful of distinct strengths exist, so each probability is
+        computed once per decision instead of once per target.
+        """
+        params = obs.resolver_params
+        if table == "steal":
+            lookup = params.steal_success if params is not None else None
+            base = obs.current_rules.get("steal_success_base", 0.45)
+            low, high, slope = 0.05, 0.9, 0.03
+        else:
+            lookup = params.attack_success if params is not None else None
+            base = obs.current_rules.get("attack_success_base", 0.12)
+            low, high, slope = 0.01, 0.75, 0.04
+
+        def success(strength: int) -> float:
+            diff = obs.self_strength - strength
+            if lookup is not None:
+                return lookup(diff)
+            return min(high, max(low, base + diff * slope))
+
+        return _KeyedCache(success)
+
+    def _steal_utilities(self, obs: AgentObservation, columns: tuple[list[int], list[int], list[int]]) -> list[tuple[int, float]]:
+        """Utility of stealing from each target with a positive balance.
+
+        Utility = α × expected_gain - β × retaliation_risk
+                  + γ × governance_gain - δ × reputation_loss, per target.
+        """
+        ids, balances, strengths = columns
+        eligible = [(aid, bal, strength) for aid, bal, strength in zip(ids, balances, strengths) if bal > 0]
         # Check if we can afford to steal
-        min_balance = obs.current_rules.get("steal_min_token_balance", 0)
-        if obs.self_token_balance < min_balance:
-            return -1000.0  # Cannot afford
-        
-        # Expected token gain
-        steal_amount = min(
-            obs.current_rules.get("steal_amount", 3),
-            obs.token_balance_by_agent[target_id]
-        )
-        success_base = obs.current_rules.get("steal_success_base", 0.45)
-        strength_edge = (obs.self_strength - obs.strength_by_agent[target_id]) * 0.03
-        success_prob = min(0.9, max(0.05, success_base + strength_edge))
-        
-        expected_gain = steal_amount * success_prob
-        
-        # Retaliation risk
-        target_aggression = obs.aggression_by_agent.get(target_id, 0.5)
-        retaliation_risk = target_aggression * obs.token_balance_by_agent[target_id] * 0.1
-        
-        # Reputation loss
-        target_trust = obs.trust_by_agent.get(target_id, 0.5)
-        reputation_loss = (1.0 - target_trust) * 2.0
-        
-        # Governance influence (stealing doesn't help governance)
-        governance_gain = 0.0
-        
-        # Compute utility
-        utility = (
-            self.personality.risk_tolerance * expected_gain
-            - (1.0 - self.personality.aggression) * retaliation_risk
-            + self.personality.governance_bias * governance_gain
-            - (1.0 - self.personality.corruption_threshold) * reputation_loss
-        )
-        
-        return utility
-    
-    def _compute_attack_utility(self, obs: AgentObservation, target_id: int) -> float:
-        """Compute utility of attacking a specific target."""
+        if obs.self_token_balance < obs.current_rules.get("steal_min_token_balance", 0):
+            return [(aid, -1000.0) for aid, _, _ in eligible]  # Cannot afford
+
+        p = self.personality
+        steal_amount = obs.current_rules.get("steal_amount", 3)
+        success = self._success_by_strength(obs, "steal")
+        aggression = obs.aggression_by_agent
+        trust = obs.trust_by_agent
+        retaliation_coef = 1.0 - p.aggression
+        reputation_coef = 1.0 - p.corruption_threshold
+        # Stealing doesn't help governance
+        governance_term = p.governance_bias * 0.0
+        return [
+            (
+                aid,
+                p.risk_tolerance * (min(steal_amount, bal) * success[strength])
+                - retaliation_coef * (aggression.get(aid, 0.5) * bal * 0.1)
+                + governance_term
+                - reputation_coef * ((1.0 - trust.get(aid, 0.5)) * 2.0),
+            )
+            for aid, bal, strength in eligible
+        ]
+
+    def _attack_utilities(self, obs: AgentObservation, columns: tuple[list[int], list[int], list[int]]) -> list[tuple[int, float]]:
+        """Utility of attacking each target (same weighting as stealing)."""
+        ids, balances, strengths = columns
         attack_cost = obs.current_rules.get("attack_cost", 8)
-        
         # Check if we can afford to attack
         if obs.self_token_balance < attack_cost:
-            return -1000.0  # Cannot afford
-        
-        # Expected token gain
-        success_base = obs.current_rules.get("attack_success_base", 0.12)
-        strength_edge = (obs.self_strength - obs.strength_by_agent[target_id]) * 0.04
-        success_prob = min(0.75, max(0.01, success_base + strength_edge))
-        
+            return [(aid, -1000.0) for aid in ids]  # Cannot afford
+
+        p = self.personality
+        success = self._success_by_strength(obs, "attack")
         loot_ratio = obs.current_rules.get("attack_loot_ratio", 0.4)
-        expected_loot = obs.token_balance_by_agent[target_id] * loot_ratio * success_prob
-        expected_gain = expected_loot - attack_cost
-        
-        # Retaliation risk (eliminated targets can't retaliate)
-        retaliation_risk = (1.0 - success_prob) * obs.strength_by_agent[target_id] * 0.5
-        
-        # Reputation loss (attacking is aggressive)
-        reputation_loss = 5.0
-        
-        # Governance influence (eliminating competitors helps)
         alive_count = len(obs.alive_ids)
-        governance_gain = (obs.token_balance_by_agent[target_id] / alive_count) * success_prob
-        
-        # Compute utility
-        utility = (
-            self.personality.risk_tolerance * expected_gain
-            - (1.0 - self.personality.aggression) * retaliation_risk
-            + self.personality.governance_bias * governance_gain
-            - (1.0 - self.personality.corruption_threshold) * reputation_loss
+        retaliation_coef = 1.0 - p.aggression
+        # Attacking is aggressive: a flat reputation loss of 5
+        reputation_term = (1.0 - p.corruption_threshold) * 5.0
+        # Eliminated targets can't retaliate
+        retaliation_by_strength = _KeyedCache(
+            lambda strength: retaliation_coef * ((1.0 - success[strength]) * strength * 0.5)
         )
-        
+
+        utilities = []
+        for aid, bal, strength in zip(ids, balances, strengths):
+            prob = success[strength]
+            utility = (
+                p.risk_tolerance * (bal * loot_ratio * prob - attack_cost)
+                - retaliation_by_strength[strength]
+                # Eliminating competitors helps governance
+                + p.governance_bias * ((bal / alive_count) * prob)
+                - reputation_term
+            )
+            utilities.append((aid, utility))
+
         # Bonus for late game elimination
         if alive_count <= 4:
-            utility *= 1.5
-        
-        return utility
+            utilities = [(aid, utility * 1.5) for aid, utility in utilities]
+        return utilities
     
     def _compute_proposal_utility(self, obs: AgentObservation) -> float:
         """Compute utility of proposing a rule change."""
@@ -303,6 +310,18 @@ class ClearAgent(Agent):
         return proposer_trust > 0.5
 
 
+class _KeyedCache(dict):
+    """Dict that fills missing keys from ``compute(key)`` on first access."""
+
+    def __init__(self, compute):
+        super().__init__()
+        self._compute = compute
+
+    def __missing__(self, key):
+        value = self[key] = self._compute(key)
+        return value
+
+
 # Factory function to create agents with different personalities
 def create_clear_agent(agent_type: str) -> ClearAgent:
     """Create a ClearAgent with predefined personality based on type."""
@@ -1,13 +1,25 @@
 from __future__ import annotations
 
+from random import Random
+from typing import Sequence
+
 from ..domain.actions import Action, ActionType
-from ..domain.agent import Agent, AgentObservation
+from ..domain.agent import Agent, AgentObservation, batch_rngs
+from .targeting import ColumnCache, first_other, leaders
 
 
 class GreedyAgent(Agent):
     name = "greedy"
+    supports_batch = True
 
     def decide(self, obs: AgentObservation, rng) -> Action:
+        return self._decide(obs, rng, ColumnCache())
+
+    def decide_batch(self, observations: Sequence[AgentObservation], rng: Random | Sequence[Random]) -> list[Action]:
+        cache = ColumnCache()
+        return [self._decide(obs, r, cache) for obs, r in zip(observations, batch_rngs(rng))]
+
+    def _decide(self, obs: AgentObservation, rng, cache: ColumnCache) -> Action:
         if obs.pending_proposal is not None:
             key = obs.pending_proposal.get("key")
             value = obs.pending_proposal.get("value")
@@ -17,11 +29,14 @@ class GreedyAgent(Agent):
                 return Action(actor=obs.self_id, kind=ActionType.VOTE_RULE, payload={"vote": "no"})
             return Action(actor=obs.self_id, kind=ActionType.VOTE_RULE, payload={"vote": "yes"})
 
-        others = [aid for aid in obs.alive_ids if aid != obs.self_id]
-        if not others:
+        balances = obs.token_balance_by_agent
+        richest = first_other(
+            cache.get(obs, "richest", lambda: leaders(obs.alive_ids, key=lambda aid: -balances[aid])),
+            obs.self_id,
+        )
+        if richest is None:
             return Action(actor=obs.self_id, kind=ActionType.WORK)
 
-        richest = max(others, key=lambda aid: obs.token_balance_by_agent[aid])
         if (
             obs.token_balance_by_agent[richest] > obs.self_token_balance + 2
             and obs.self_token_balance >= obs.current_rules.get("steal_min_token_balance", 0)
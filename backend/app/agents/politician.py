@@ -6,6 +6,7 @@ from ..domain.agent import Agent, AgentObservation
 
 class PoliticianAgent(Agent):
     name = "politician"
+    supports_batch = True
 
     def decide(self, obs: AgentObservation, rng) -> Action:
         if obs.pending_proposal is not None:
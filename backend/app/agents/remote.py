@@ -0,0 +1,338 @@
+"""
+Out-of-process agent brains for The Cheater's Dilemma.
+Hosts strategies in worker subprocesses so a slow or crashing brain cannot
+stall or take down the engine; each decide_batch call sends one message per
+worker (in simultaneous turns, one per worker per turn) and falls back to a
+default action when a worker misses the deadline.
+"""
+
+from __future__ import annotations
+
+import itertools
+import multiprocessing
+import time
+from multiprocessing.connection import Connection, wait
+from random import Random
+from typing import Any, Sequence
+
+from ..domain.actions import Action, ActionType
+from ..domain.agent import Agent, AgentObservation, batch_rngs
+
+
+def _decide_share(
+    brains: dict[int, Agent],
+    observations: Sequence[AgentObservation],
+    rng: Random | Sequence[Random],
+) -> list[Action | None]:
+    """Decide a worker's share, one decide_batch call per brain class where possible.
+
+    With per-agent generators the share is split by class wherever its
+    members sit, since no draw depends on another. A shared generator must be
+    drawn in slot order, so only consecutive members of one class are batched.
+    """
+    if isinstance(rng, Random):
+        groups, i = [], 0
+        while i < len(observations):
+            brain = brains[observations[i].self_id]
+            j = i + 1
+            if brain.supports_batch:
+                while j < len(observations) and type(brains[observations[j].self_id]) is type(brain):
+                    j += 1
+            groups.append(list(range(i, j)))
+            i = j
+    else:
+        by_class: dict[type, list[int]] = {}
+        singles = []
+        for pos, obs in enumerate(observations):
+            brain = brains[obs.self_id]
+            if brain.supports_batch:
+                by_class.setdefault(type(brain), []).append(pos)
+            else:
+                singles.append([pos])
+        groups = [*by_class.values(), *singles]
+
+    rngs = list(itertools.islice(batch_rngs(rng), len(observations)))
+    actions: list[Action | None] = [None] * len(observations)
+    for positions in groups:
+        brain = brains[observations[positions[0]].self_id]
+        try:
+            if len(positions) > 1:
+                shared = rng if isinstance(rng, Random) else [rngs[p] for p in positions]
+                decided = brain.decide_batch([observations[p] for p in positions], shared)
+            else:
+                decided = [brain.decide(observations[positions[0]], rngs[positions[0]])]
+        except Exception:
+            continue
+        for pos, action in zip(positions, decided):
+            actions[pos] = action
+    return actions
+
+
+def _worker_main(conn: Connection, brains: dict[int, Agent]) -> None:
+    """Worker loop: answer each request with its actions, None for a failed brain."""
+    while True:
+        try:
+            request = conn.recv()
+        except (EOFError, OSError):
+            return
+        if request is None:
+            return
+        observations, rng = request
+        actions = _decide_share(brains, observations, rng)
+        # A shared legacy generator goes back so the caller can continue it.
+        conn.send((actions, rng if isinstance(rng, Random) else None))
+
+
+class _Worker:
+    def __init__(self, brains: dict[int, Agent], context: Any) -> None:
+        self.brains = brains
+        self._context = context
+        self.process: Any = None
+        self.conn: Connection | None = None
+
+    def start(self) -> None:
+        parent, child = self._context.Pipe()
+        self.process = self._context.Process(target=_worker_main, args=(child, self.brains), daemon=True)
+        self.process.start()
+        child.close()
+        self.conn = parent
+
+    def stop(self, timeout: float = 1.0) -> None:
+        if self.process is None:
+            return
+        try:
+            self.conn.send(None)
+        except (OSError, ValueError):
+            pass
+        self.process.join(timeout)
+        if self.process.is_alive():
+            self.process.kill()
+            self.process.join()
+        self.conn.close()
+        self.process = self.conn = None
+
+
+class BrainPool:
+    """Pool of worker subprocesses that each host a fixed share of the brains.
+
+    Brains are split between workers in contiguous blocks of agent ids and
+    pickled into the worker when it starts, so they should not rely on state
+    kept between turns (a restarted worker starts again from the original
+    brains).
+
+    ``decide`` takes the observations of one decide_batch call and sends each
+    worker a single message with the observations of its agents. With a
+    sequence of per-agent generators (stream RNG mode) all workers run at
+    once. With one shared generator (legacy mode) workers are asked one after
+    another in slot order and the generator state is passed along, so the
+    draws are exactly those of in-process sequential decisions.
+
+    A worker that has not answered within ``deadline`` seconds of the start of
+    the call, or that dies, is restarted and its agents get ``fallback``
+    actions for that call; a brain that raises gets the fallback too. A legacy
+    generator is left as it was before the failed worker's share.
+    """
+
+    def __init__(
+        self,
+        workers: int = 2,
+        deadline: float | None = 1.0,
+        fallback: ActionType = ActionType.WORK,
+        context: str | None = None,
+    ) -> None:
+        if workers < 1:
+            raise ValueError("workers must be at least 1")
+        self.workers = workers
+        self.deadline = deadline
+        self.fallback = fallback
+        self._context = multiprocessing.get_context(context)
+        self._brains: dict[int, Agent] = {}
+        self._pool: list[_Worker] = []
+        self.stats = {"requests": 0, "fallbacks": 0, "timeouts": 0, "crashes": 0, "restarts": 0}
+
+    def wrap_all(self, brains: Sequence[Agent]) -> list[RemoteAgent]:
+        """Host a World roster; ``brains[i]`` becomes agent id ``i``."""
+        if self._pool:
+            raise RuntimeError("brains must be registered before the pool starts")
+        wrapped = []
+        for agent_id, brain in enumerate(brains):
+            self._brains[agent_id] = brain
+            wrapped.append(_remote_class(type(brain))(self, agent_id, brain.name))
+        return wrapped
+
+    def _worker_of(self, agent_id: int) -> int:
+        return min(self.workers - 1, agent_id * self.workers // max(1, len(self._brains)))
+
+    def start(self) -> None:
+        if self._pool:
+            return
+        for index in range(self.workers):
+            share = {aid: brain for aid, brain in self._brains.items() if self._worker_of(aid) == index}
+            worker = _Worker(share, self._context)
+            worker.start()
+            self._pool.append(worker)
+
+    def close(self) -> None:
+        for worker in self._pool:
+            worker.stop()
+        self._pool = []
+
+    def __enter__(self) -> BrainPool:
+        # Workers start on the first decide, after wrap_all has run.
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+    def _restart(self, index: int) -> None:
+        worker = self._pool[index]
+        if worker.process is not None:
+            worker.process.kill()
+            worker.process.join()
+            worker.conn.close()
+            worker.process = worker.conn = None
+        worker.start()
+        self.stats["restarts"] += 1
+
+    def _remaining(self, started: float) -> float | None:
+        if self.deadline is None:
+            return None
+        return max(0.0, self.deadline - (time.perf_counter() - started))
+
+    def _receive(self, index: int, started: float) -> tuple[list[Action | None], Random | None] | None:
+        conn = self._pool[index].conn
+        try:
+            if not wait([conn], self._remaining(started)):
+                self.stats["timeouts"] += 1
+                self._restart(index)
+                return None
+            return conn.recv()
+        except (EOFError, OSError):
+            self.stats["crashes"] += 1
+            self._restart(index)
+            return None
+
+    def _send(self, index: int, payload: tuple) -> bool:
+        try:
+            self._pool[index].conn.send(payload)
+            return True
+        except (OSError, ValueError):
+            self.stats["crashes"] += 1
+            self._restart(index)
+            return False
+
+    def decide(self, observations: Sequence[AgentObservation], rng: Random | Sequence[Random]) -> list[Action]:
+        self.start()
+        self.stats["requests"] += 1
+        started = time.perf_counter()
+
+        groups: dict[int, list[int]] = {}
+        for pos, obs in enumerate(observations):
+            groups.setdefault(self._worker_of(obs.self_id), []).append(pos)
+        results: list[Action | None] = [None] * len(observations)
+
+        if isinstance(rng, Random):
+            # Shared generator: draws must follow slot order, so each run of
+            # consecutive observations on one worker is a request of its own.
+            start = 0
+            while start < len(observations):
+                index = self._worker_of(observations[start].self_id)
+                end = start + 1
+                while end < len(observations) and self._worker_of(observations[end].self_id) == index:
+                    end += 1
+                self._run_legacy(index, list(range(start, end)), observations, rng, results, started)
+                start = end
+        else:
+            sent = []
+            for index, positions in groups.items():
+                payload = ([observations[p] for p in positions], [rng[p] for p in positions])
+                if self._send(index, payload):
+                    sent.append(index)
+            for index in sent:
+                reply = self._receive(index, started)
+                if reply is not None:
+                    for pos, action in zip(groups[index], reply[0]):
+                        results[pos] = action
+
+        actions = []
+        for obs, action in zip(observations, results):
+            if action is None:
+                self.stats["fallbacks"] += 1
+                action = Action(actor=obs.self_id, kind=self.fallback)
+            actions.append(action)
+        return actions
+
+    def _run_legacy(
+        self,
+        index: int,
+        positions: list[int],
+        observations: Sequence[AgentObservation],
+        rng: Random,
+        results: list[Action | None],
+        started: float,
+    ) -> None:
+        if not self._send(index, ([observations[p] for p in positions], rng)):
+            return
+        reply = self._receive(index, started)
+        if reply is None:
+            return
+        actions, state_rng = reply
+        rng.setstate(state_rng.getstate())
+        for pos, action in zip(positions, actions):
+            results[pos] = action
+
+
+class RemoteAgent(Agent):
+    """Stand-in for a brain hosted by a BrainPool; create with ``wrap_all``.
+
+    ``wrap_all`` instantiates one subclass per hosted brain class, so sequential
+    turns form the same batch runs as they would for the brains themselves. On
+    a simultaneous snapshot every proxy of one pool shares a batch key, so the
+    whole roster is one ``decide_batch`` call and one message per worker, which
+    splits it by brain class itself.
+    """
+
+    supports_batch = True
+
+    def __init__(self, pool: BrainPool, agent_id: int, name: str) -> None:
+        self.pool = pool
+        self.agent_id = agent_id
+        self.name = name
+
+    def snapshot_batch_key(self) -> BrainPool:
+        return self.pool
+
+    def fork(self) -> RemoteAgent:
+        # The hosted brain keeps no state between turns, so a forked world shares the proxy.
+        return self
+
+    def __reduce__(self):
+        # Pipes to the pool cannot leave this process, so a proxy pickles as the
+        # brain it hosts and an unpickled world decides in-process, starting from
+        # the original brain as a restarted worker would.
+        return _hosted_brain, (self.pool._brains[self.agent_id],)
+
+    def decide(self, obs: AgentObservation, rng: Random) -> Action:
+        return self.pool.decide([obs], rng)[0]
+
+    def decide_batch(self, observations: Sequence[AgentObservation], rng: Random | Sequence[Random]) -> list[Action]:
+        return self.pool.decide(observations, rng)
+
+
+def _hosted_brain(brain: Agent) -> Agent:
+    return brain
+
+
+_REMOTE_CLASSES: dict[type, type[RemoteAgent]] = {}
+
+
+def _remote_class(brain_class: type) -> type[RemoteAgent]:
+    cls = _REMOTE_CLASSES.get(brain_class)
+    if cls is None:
+        cls = type(
+            f"Remote{brain_class.__name__}",
+            (RemoteAgent,),
+            {"supports_batch": getattr(brain_class, "supports_batch", False)},
+        )
+        _REMOTE_CLASSES[brain_class] = cls
+    return cls
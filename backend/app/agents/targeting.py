@@ -0,0 +1,55 @@
+"""
+Target selection helpers shared by the built-in strategies.
+Lets a batch of decisions made against the same world state rank the
+candidate targets once instead of rescanning them for every agent.
+"""
+
+from __future__ import annotations
+
+from heapq import nsmallest
+from typing import Any, Callable, Iterable
+
+from ..domain.agent import AgentObservation
+
+
+def leaders(ids: Iterable[int], key: Callable[[int], Any], count: int = 2) -> list[int]:
+    """The first ``count`` ids by ascending ``key``; earlier ids win ties.
+
+    ``leaders(ids, key)[0]`` is ``min(ids, key=key)``, and with a negated key it
+    is ``max(ids, key=key)``, because both builtins keep the first extreme.
+    """
+    return nsmallest(count, ids, key=key)
+
+
+def first_other(ranked: list[int], self_id: int) -> int | None:
+    """The best-ranked id that is not ``self_id`` (None if there is none)."""
+    for aid in ranked:
+        if aid != self_id:
+            return aid
+    return None
+
+
+class ColumnCache:
+    """Memoises per-state rankings across the observations of one batch.
+
+    World builds the observations of a batch from one shared set of column
+    dicts, so a ranking is keyed on the identity of those dicts and computed
+    once per batch; observations built separately simply miss the cache.
+    """
+
+    def __init__(self) -> None:
+        self._memo: dict[tuple, tuple[AgentObservation, Any]] = {}
+
+    def get(self, obs: AgentObservation, name: str, compute: Callable[[], Any]) -> Any:
+        key = (
+            name,
+            id(obs.alive_ids),
+            id(obs.token_balance_by_agent),
+            id(obs.strength_by_agent),
+            id(obs.trust_by_agent),
+        )
+        hit = self._memo.get(key)
+        if hit is None:
+            # Keep the observation referenced so the ids in the key stay unique.
+            hit = self._memo[key] = (obs, compute())
+        return hit[1]
@@ -1,13 +1,25 @@
 from __future__ import annotations
 
+from random import Random
+from typing import Sequence
+
 from ..domain.actions import Action, ActionType
-from ..domain.agent import Agent, AgentObservation
+from ..domain.agent import Agent, AgentObservation, batch_rngs
+from .targeting import ColumnCache, first_other, leaders
 
 
 class WarlordAgent(Agent):
     name = "warlord"
+    supports_batch = True
 
     def decide(self, obs: AgentObservation, rng) -> Action:
+        return self._decide(obs, rng, ColumnCache())
+
+    def decide_batch(self, observations: Sequence[AgentObservation], rng: Random | Sequence[Random]) -> list[Action]:
+        cache = ColumnCache()
+        return [self._decide(obs, r, cache) for obs, r in zip(observations, batch_rngs(rng))]
+
+    def _decide(self, obs: AgentObservation, rng, cache: ColumnCache) -> Action:
         if obs.pending_proposal is not None:
             key = obs.pending_proposal.get("key")
             if key in {"attack_cost", "attack_success_base"}:
@@ -15,17 +27,24 @@ class WarlordAgent(Agent):
                 return Action(actor=obs.self_id, kind=ActionType.VOTE_RULE, payload={"vote": vote})
             return Action(actor=obs.self_id, kind=ActionType.VOTE_RULE, payload={"vote": "no"})
 
-        others = [aid for aid in obs.alive_ids if aid != obs.self_id]
-        if not others:
+        if not any(aid != obs.self_id for aid in obs.alive_ids):
             return Action(actor=obs.self_id, kind=ActionType.WORK)
+        balances = obs.token_balance_by_agent
+        strength = obs.strength_by_agent
 
         late_game = len(obs.alive_ids) <= max(3, len(obs.token_balance_by_agent) // 3)
         if late_game and obs.self_token_balance >= obs.current_rules.get("attack_cost", 5) and rng.random() < 0.55:
-            target = min(others, key=lambda aid: obs.strength_by_agent[aid] + obs.token_balance_by_agent[aid])
+            target = first_other(
+                cache.get(obs, "weakest_total", lambda: leaders(obs.alive_ids, key=lambda aid: strength[aid] + balances[aid])),
+                obs.self_id,
+            )
             return Action(actor=obs.self_id, kind=ActionType.ATTACK, target=target)
 
         if obs.self_token_balance >= obs.current_rules.get("attack_cost", 5) * 2 and rng.random() < 0.04:
-            target = min(others, key=lambda aid: obs.strength_by_agent[aid])
+            target = first_other(
+                cache.get(obs, "weakest", lambda: leaders(obs.alive_ids, key=lambda aid: strength[aid])),
+                obs.self_id,
+            )
             return Action(actor=obs.self_id, kind=ActionType.ATTACK, target=target)
 
         if rng.random() < 0.1:
@@ -36,7 +55,10 @@ class WarlordAgent(Agent):
             )
 
         if rng.random() < 0.3:
-            target = max(others, key=lambda aid: obs.token_balance_by_agent[aid])
+            target = first_other(
+                cache.get(obs, "richest", lambda: leaders(obs.alive_ids, key=lambda aid: -balances[aid])),
+                obs.self_id,
+            )
             return Action(actor=obs.self_id, kind=ActionType.STEAL, target=target)
 
         return Action(actor=obs.self_id, kind=ActionType.WORK)
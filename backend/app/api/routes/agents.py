@@ -1,55 +1,59 @@
 from typing import List
 from fastapi import APIRouter, HTTPException
 
+from ...domain.world import World
 from ..schemas.agents import AgentSummary, AgentDetail
+from .simulation import simulation_manager
 
 router = APIRouter()
 
 
+def _agent_summary(world: World, agent_id: int) -> AgentSummary:
+    slot = world.agent_slots[agent_id]
+    return AgentSummary(
+        agent_id=agent_id,
+        strategy=slot.label,
+        resources=world.token_balances[agent_id],
+        strength=world.strength[agent_id],
+        alive=agent_id in world.alive,
+        trust=round(world.reputation.trust[agent_id], 4),
+        aggression=round(world.reputation.aggression[agent_id], 4),
+        rank=int(world.history.latest(agent_id, "rank") or 0),
+    )
+
+
 @router.get("/", response_model=List[AgentSummary])
 async def get_agents(simulation_id: str) -> List[AgentSummary]:
     """Get all agents in a simulation"""
-    # For now, return mock data - in real implementation, get from simulation service
-    return [
-        AgentSummary(
-            agent_id=0,
-            strategy="greedy",
-            resources=45,
-            strength=8,
-            alive=True,
-            trust=0.7,
-            aggression=0.2,
-            rank=1
-        ),
-        AgentSummary(
-            agent_id=1,
-            strategy="cheater",
-            resources=32,
-            strength=6,
-            alive=True,
-            trust=0.3,
-            aggression=0.8,
-            rank=2
-        )
-    ]
+    sim = simulation_manager.get_simulation(simulation_id)
+    world = sim["world"]
+    return [_agent_summary(world, slot.agent_id) for slot in world.agent_slots]
 
 
 @router.get("/{agent_id}", response_model=AgentDetail)
-async def get_agent_detail(agent_id: int, simulation_id: str) -> AgentDetail:
-    """Get detailed information about a specific agent"""
-    # Mock data - in real implementation, get from simulation service
+async def get_agent_detail(agent_id: int, simulation_id: str, max_points: int = 300) -> AgentDetail:
+    """Get detailed information about a specific agent.
+
+    Histories are downsampled server-side into at most ``max_points``
+    min/max/last buckets.
+    """
+    sim = simulation_manager.get_simulation(simulation_id)
+    world = sim["world"]
+    history = world.history
+    if agent_id not in history:
+        raise HTTPException(status_code=404, detail="Agent not found")
+
+    max_points = max(1, min(max_points, 5000))
+    buckets = {
+        metric: history.downsampled(agent_id, metric, max_points)
+        for metric in history.columns
+    }
     return AgentDetail(
-        agent_id=agent_id,
-        strategy="greedy",
-        resources=45,
-        strength=8,
-        alive=True,
-        trust=0.7,
-        aggression=0.2,
-        rank=1,
-        total_actions=25,
-        successful_actions=18,
-        failed_actions=7,
-        reputation_history=[0.5, 0.6, 0.7],
-        resource_history=[10, 25, 45]
-    )
\ No newline at end of file
+        **_agent_summary(world, agent_id).model_dump(),
+        total_actions=history.total_actions[agent_id],
+        successful_actions=history.successes[agent_id],
+        failed_actions=history.failures[agent_id],
+        reputation_history=[b["last"] for b in buckets["trust"]],
+        resource_history=[int(b["last"]) for b in buckets["token_balance"]],
+        history=buckets,
+    )
@@ -1,45 +1,32 @@
-from typing import Dict, Any, List
+from typing import List, Optional
 from fastapi import APIRouter, HTTPException
 
-from ..schemas.rules import Ruleset, RuleHistory
+from ..schemas.rules import Ruleset, RuleHistory, RuleDiff
+from .simulation import simulation_manager
 
 router = APIRouter()
 
 
 @router.get("/", response_model=Ruleset)
-async def get_current_rules(simulation_id: str) -> Ruleset:
-    """Get current ruleset for a simulation"""
-    # Mock data - in real implementation, get from simulation service
-    return Ruleset(
-        version=1,
-        rules={
-            "allow_steal": True,
-            "allow_attack": True,
-            "allow_proposals": True,
-            "allow_votes": True,
-            "work_income": [2, 4],
-            "steal_min_resources": 1,
-            "steal_amount": 3,
-            "steal_success_base": 0.45,
-            "steal_catch_prob": 0.25,
-            "steal_catch_penalty": 2,
-            "steal_fail_penalty": 1,
-            "attack_cost": 8,
-            "attack_success_base": 0.12,
-            "attack_fail_penalty": 2,
-            "attack_loot_ratio": 0.4
-        }
-    )
+async def get_current_rules(simulation_id: str, turn: Optional[int] = None) -> Ruleset:
+    """Get the ruleset for a simulation, optionally as it stood at a given turn"""
+    rule_set = simulation_manager.get_simulation(simulation_id)["world"].rule_set
+    if turn is None:
+        return Ruleset(version=rule_set.version, rules=dict(rule_set.values))
+    try:
+        return Ruleset(version=rule_set.version_at(turn), rules=rule_set.rules_at(turn), turn=turn)
+    except KeyError as e:
+        raise HTTPException(status_code=404, detail=str(e.args[0]))
 
 
 @router.get("/history", response_model=List[RuleHistory])
 async def get_rules_history(simulation_id: str) -> List[RuleHistory]:
     """Get rules change history for a simulation"""
-    # Mock data - in real implementation, get from simulation service
-    return [
+    rule_set = simulation_manager.get_simulation(simulation_id)["world"].rule_set
+    history = [
         RuleHistory(
             turn=0,
-            version=1,
+            version=rule_set.initial_version,
             change_type="initial",
             changed_by=None,
             key=None,
@@ -47,4 +34,36 @@ async def get_rules_history(simulation_id: str) -> List[RuleHistory]:
             new_value=None,
             description="Initial ruleset"
         )
-    ]
\ No newline at end of file
+    ]
+    for entry in rule_set.full_history():
+        # Negative "by" marks values set by World.fork(rules=...), not by a passed proposal.
+        if entry["by"] < 0:
+            change_type, changed_by = "fork_override", None
+            description = f"Fork override set {entry['key']} to {entry['value']}"
+        else:
+            change_type, changed_by = "proposal_passed", entry["by"]
+            description = f"Agent {entry['by']} changed {entry['key']} to {entry['value']}"
+        history.append(
+            RuleHistory(
+                turn=entry["turn"],
+                version=entry["version"],
+                change_type=change_type,
+                changed_by=changed_by,
+                key=entry["key"],
+                old_value=entry.get("old_value"),
+                new_value=entry["value"],
+                description=description,
+            )
+        )
+    return history
+
+
+@router.get("/diff", response_model=RuleDiff)
+async def get_rules_diff(simulation_id: str, from_version: int, to_version: int) -> RuleDiff:
+    """Get the rule values that differ between two versions"""
+    rule_set = simulation_manager.get_simulation(simulation_id)["world"].rule_set
+    try:
+        changes = rule_set.diff(from_version, to_version)
+    except KeyError as e:
+        raise HTTPException(status_code=404, detail=str(e.args[0]))
+    return RuleDiff(from_version=from_version, to_version=to_version, changes=changes)
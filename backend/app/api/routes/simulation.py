@@ -1,16 +1,20 @@
 from datetime import datetime, timezone
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 import asyncio
 
 from fastapi import APIRouter, HTTPException, WebSocket, WebSocketDisconnect
 
+from ...services.rollout_service import rollout_base, rollout_service
 from ...services.simulation_service import SimulationService
 from ..schemas.simulation import (
     SimulationStartRequest,
     SimulationStepRequest,
+    SimulationForkRequest,
+    SimulationRolloutRequest,
     SimulationState,
     SimulationEvents,
-    SimulationSummary
+    SimulationSummary,
+    SimulationTimeSeries,
 )
 
 router = APIRouter()
@@ -50,14 +54,50 @@ class SimulationManager:
             raise HTTPException(status_code=400, detail="Simulation is already running")
 
         world = sim["world"]
-        for _ in range(steps):
-            if not world.step():
-                break  # Simulation is complete
+        sim["is_running"] = True
+        try:
+            for _ in range(steps):
+                if not world.step():
+                    break  # Simulation is complete
 
-        # Update the result with current snapshot
-        sim["result"] = world.snapshot()
+            # Update the result with current snapshot
+            sim["result"] = world.snapshot()
+        finally:
+            sim["is_running"] = False
         return sim["result"]
 
+    def fork_simulation(
+        self,
+        sim_id: str,
+        seed: Optional[int] = None,
+        rules: Optional[Dict[str, Any]] = None,
+    ) -> str:
+        """Register a fork of a simulation at its current turn and return its id."""
+        import uuid
+        sim = self.get_simulation(sim_id)
+        if sim["is_running"]:
+            raise HTTPException(status_code=400, detail="Simulation is already running")
+        try:
+            world = sim["world"].fork(seed=seed, rules=rules)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+        fork_id = str(uuid.uuid4())
+        self.simulations[fork_id] = {
+            "world": world,
+            "result": world.snapshot(),
+            "current_turn": world.turns_completed,
+            "is_running": False,
+            "parent_id": sim_id,
+        }
+        return fork_id
+
+    def profiler_stats(self) -> Dict[str, Any]:
+        """Turn profile of every simulation, None where profiling is off."""
+        return {
+            sim_id: sim["world"].profiler.stats if sim["world"].profiler is not None else None
+            for sim_id, sim in self.simulations.items()
+        }
+
 
 simulation_manager = SimulationManager()
 
@@ -100,6 +140,50 @@ async def step_simulation(
         raise HTTPException(status_code=500, detail=f"Failed to step simulation: {str(e)}")
 
 
+@router.post("/{simulation_id}/fork", response_model=Dict[str, str])
+async def fork_simulation(
+    simulation_id: str,
+    request: SimulationForkRequest
+) -> Dict[str, str]:
+    """Fork a simulation at its current turn, optionally with a new seed or rule overrides"""
+    try:
+        fork_id = simulation_manager.fork_simulation(simulation_id, request.seed, request.rules)
+        return {"simulation_id": fork_id, "parent_id": simulation_id}
+    except HTTPException:
+        raise
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Failed to fork simulation: {str(e)}")
+
+
+@router.post("/{simulation_id}/rollouts", response_model=Dict[str, Any])
+async def estimate_outcomes(
+    simulation_id: str,
+    request: SimulationRolloutRequest
+) -> Dict[str, Any]:
+    """Per-agent win, elimination and final balance estimates from the current turn"""
+    sim = simulation_manager.get_simulation(simulation_id)
+    if sim["is_running"]:
+        raise HTTPException(status_code=400, detail="Simulation is already running")
+    try:
+        # Read the turn and fork/pickle the world here on the event loop, where
+        # /step and the stream advance it; the thread and workers only get bytes.
+        world = sim["world"]
+        turn = world.turns_completed
+        cached = rollout_service.cached(simulation_id, turn, request.rollouts)
+        if cached is not None:
+            return cached
+        base = rollout_base(world)
+        return await asyncio.to_thread(
+            rollout_service.estimate_base, simulation_id, turn, world.seed, base, request.rollouts
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Failed to estimate outcomes: {str(e)}")
+
+
 @router.get("/{simulation_id}/state", response_model=SimulationState)
 async def get_simulation_state(simulation_id: str) -> SimulationState:
     """Get current simulation state"""
@@ -160,6 +244,21 @@ async def get_simulation_summary(simulation_id: str) -> SimulationSummary:
         raise HTTPException(status_code=500, detail=f"Failed to get simulation summary: {str(e)}")
 
 
+@router.get("/{simulation_id}/timeseries", response_model=SimulationTimeSeries)
+async def get_simulation_timeseries(simulation_id: str) -> SimulationTimeSeries:
+    """Get per-turn inequality series (Gini, HHI, top-k share)"""
+    try:
+        sim = simulation_manager.get_simulation(simulation_id)
+        tracker = sim["world"].inequality
+        return SimulationTimeSeries(
+            simulation_id=simulation_id,
+            stride=tracker.series.stride,
+            points=tracker.points(),
+        )
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Failed to get simulation timeseries: {str(e)}")
+
+
 @router.websocket("/ws/health")
 async def simulation_health_socket(websocket: WebSocket) -> None:
     """Lightweight backend heartbeat channel for frontend connectivity checks."""
@@ -212,12 +311,26 @@ async def simulation_stream_socket(
         await websocket.close(code=4404)
         return
 
+    if sim["is_running"]:
+        await websocket.send_json(
+            {
+                "type": "error",
+                "message": "Simulation is already running",
+                "simulation_id": simulation_id,
+            }
+        )
+        await websocket.close(code=4409)
+        return
+
     world = sim["world"]
     delay_seconds = max(50, min(interval_ms, 5000)) / 1000.0
     start_turn = max(1, from_turn)
 
     print(f"Starting simulation stream: delay={delay_seconds}s, start_turn={start_turn}")
 
+    # The stream steps the world between awaits; hold the guard so /step, /fork
+    # and /rollouts cannot interleave with a turn in flight.
+    sim["is_running"] = True
     try:
         await websocket.send_json(
             {
@@ -266,6 +379,7 @@ async def simulation_stream_socket(
 
         # Update final result
         sim["result"] = world.snapshot()
+        sim["is_running"] = False
 
         await websocket.send_json(
             {
@@ -290,3 +404,5 @@ async def simulation_stream_socket(
                 )
     except WebSocketDisconnect:
         return
+    finally:
+        sim["is_running"] = False
@@ -1,4 +1,4 @@
-from typing import List
+from typing import Dict, List
 from pydantic import BaseModel
 
 
@@ -13,9 +13,17 @@ class AgentSummary(BaseModel):
     rank: int
 
 
+class HistoryBucket(BaseModel):
+    turn: int  # last turn covered by the bucket
+    min: float
+    max: float
+    last: float
+
+
 class AgentDetail(AgentSummary):
     total_actions: int
     successful_actions: int
     failed_actions: int
     reputation_history: List[float]
-    resource_history: List[int]
\ No newline at end of file
+    resource_history: List[int]
+    history: Dict[str, List[HistoryBucket]] = {}
@@ -5,14 +5,26 @@ from pydantic import BaseModel
 class Ruleset(BaseModel):
     version: int
     rules: Dict[str, Any]
+    turn: Optional[int] = None  # set when the ruleset was reconstructed for a past turn
 
 
 class RuleHistory(BaseModel):
     turn: int
     version: int
-    change_type: str  # "initial", "proposal_passed", etc.
+    change_type: str  # "initial", "proposal_passed" or "fork_override"
     changed_by: Optional[int]
     key: Optional[str]
     old_value: Optional[Any]
     new_value: Optional[Any]
-    description: str
\ No newline at end of file
+    description: str
+
+
+class RuleChange(BaseModel):
+    old: Optional[Any]
+    new: Optional[Any]
+
+
+class RuleDiff(BaseModel):
+    from_version: int
+    to_version: int
+    changes: Dict[str, RuleChange]
@@ -12,6 +12,15 @@ class SimulationStepRequest(BaseModel):
     steps: int = 1
 
 
+class SimulationForkRequest(BaseModel):
+    seed: Optional[int] = None  # None continues from a copy of the parent's RNG state
+    rules: Optional[Dict[str, Any]] = None  # Mutable rule overrides applied at the fork turn
+
+
+class SimulationRolloutRequest(BaseModel):
+    rollouts: int = 200  # Continuations to run at most; fewer if the estimates converge
+
+
 class AgentState(BaseModel):
     agent_id: int
     strategy: str
@@ -64,4 +73,17 @@ class SimulationSummary(BaseModel):
     leaderboard: List[AgentState]
     action_counts: Dict[str, int]
     log_digest: str
-    rules_version: int
\ No newline at end of file
+    rules_version: int
+
+class InequalityPoint(BaseModel):
+    turn: int
+    gini: float
+    hhi: float
+    top1_share: float
+    top3_share: float
+
+
+class SimulationTimeSeries(BaseModel):
+    simulation_id: str
+    stride: int  # turns between retained samples after downsampling
+    points: List[InequalityPoint]
@@ -0,0 +1,168 @@
+"""
+Alliance index for The Cheater's Dilemma.
+Keeps active alliances as per-agent adjacency maps with the connected
+components (coalitions) they form, and moves broken alliances to an archive.
+"""
+
+from __future__ import annotations
+
+from collections import deque
+from dataclasses import replace
+from typing import Iterator
+
+from ..domain.models import Alliance
+from .sharing import PrefixList
+
+
+class AllianceIndex:
+    """Active alliance graph with incrementally maintained components.
+
+    ``_partners[a]`` maps each active partner of ``a`` to the shared Alliance,
+    in formation order. Forming an alliance merges the two components (the
+    smaller one is relabelled); breaking one only searches the component it
+    belonged to, and only splits it if the two agents are no longer connected.
+    Agents without active alliances are not tracked in any component.
+    """
+
+    def __init__(self) -> None:
+        self._partners: dict[int, dict[int, Alliance]] = {}
+        self.archive: list[Alliance] = []
+        self._component_of: dict[int, int] = {}
+        self._components: dict[int, set[int]] = {}
+        self._members: dict[int, tuple[int, ...]] = {}
+        self._next_component = 0
+        self.active_count = 0
+
+    def fork(self) -> AllianceIndex:
+        """An independent index; active alliances are copied, the archive is shared."""
+        forked = AllianceIndex()
+        copies = {id(alliance): replace(alliance) for alliance in self.active()}
+        forked._partners = {
+            agent_id: {partner: copies[id(alliance)] for partner, alliance in links.items()}
+            for agent_id, links in self._partners.items()
+        }
+        forked.archive = PrefixList(self.archive)
+        forked._component_of = dict(self._component_of)
+        forked._components = {cid: set(members) for cid, members in self._components.items()}
+        forked._members = dict(self._members)
+        forked._next_component = self._next_component
+        forked.active_count = self.active_count
+        return forked
+
+    def allied(self, agent1_id: int, agent2_id: int) -> bool:
+        return agent2_id in self._partners.get(agent1_id, ())
+
+    def partners(self, agent_id: int) -> list[int]:
+        return list(self._partners.get(agent_id, ()))
+
+    def alliances_for(self, agent_id: int) -> list[Alliance]:
+        return list(self._partners.get(agent_id, {}).values())
+
+    def active(self) -> Iterator[Alliance]:
+        for agent_id, links in self._partners.items():
+            for partner, alliance in links.items():
+                if agent_id < partner:
+                    yield alliance
+
+    def form(self, alliance: Alliance) -> None:
+        a, b = alliance.agent1_id, alliance.agent2_id
+        self._partners.setdefault(a, {})[b] = alliance
+        self._partners.setdefault(b, {})[a] = alliance
+        self.active_count += 1
+        self._union(a, b)
+
+    def dissolve(self, agent1_id: int, agent2_id: int, turn: int) -> Alliance | None:
+        alliance = self._partners.get(agent1_id, {}).get(agent2_id)
+        if alliance is None:
+            return None
+        self._unlink(agent1_id, agent2_id)
+        self._unlink(agent2_id, agent1_id)
+        alliance.active = False
+        alliance.broken_turn = turn
+        self.archive.append(alliance)
+        self.active_count -= 1
+        self._split(agent1_id, agent2_id)
+        return alliance
+
+    def remove_agent(self, agent_id: int, turn: int) -> list[Alliance]:
+        """Dissolve every alliance of an agent that left the game."""
+        return [self.dissolve(agent_id, partner, turn) for partner in self.partners(agent_id)]
+
+    def coalition(self, agent_id: int) -> tuple[int, ...]:
+        """Sorted members of the agent's connected component, or just the agent."""
+        cid = self._component_of.get(agent_id)
+        if cid is None:
+            return (agent_id,)
+        members = self._members.get(cid)
+        if members is None:
+            members = self._members[cid] = tuple(sorted(self._components[cid]))
+        return members
+
+    def coalitions(self) -> list[tuple[int, ...]]:
+        return sorted(self.coalition(next(iter(group))) for group in self._components.values())
+
+    def _unlink(self, agent_id: int, partner: int) -> None:
+        links = self._partners[agent_id]
+        del links[partner]
+        if not links:
+            del self._partners[agent_id]
+
+    def _new_component(self, members: set[int]) -> None:
+        cid = self._next_component
+        self._next_component += 1
+        self._components[cid] = members
+        for agent_id in members:
+            self._component_of[agent_id] = cid
+
+    def _drop_component(self, cid: int) -> None:
+        for agent_id in self._components.pop(cid):
+            del self._component_of[agent_id]
+        self._members.pop(cid, None)
+
+    def _union(self, a: int, b: int) -> None:
+        ca = self._component_of.get(a)
+        cb = self._component_of.get(b)
+        if ca is None and cb is None:
+            self._new_component({a, b})
+            return
+        if ca == cb:
+            return
+        if ca is None or (cb is not None and len(self._components[cb]) > len(self._components[ca])):
+            a, b, ca, cb = b, a, cb, ca
+        # ca is now the larger (or only) component; fold b's side into it.
+        target = self._components[ca]
+        moved = self._components.pop(cb) if cb is not None else {b}
+        self._members.pop(cb, None)
+        for agent_id in moved:
+            self._component_of[agent_id] = ca
+        target |= moved
+        self._members.pop(ca, None)
+
+    def _reach(self, start: int, goal: int) -> set[int]:
+        seen = {start}
+        queue = deque([start])
+        while queue:
+            current = queue.popleft()
+            for partner in self._partners.get(current, ()):
+                if partner not in seen:
+                    if partner == goal:
+                        seen.add(partner)
+                        return seen
+                    seen.add(partner)
+                    queue.append(partner)
+        return seen
+
+    def _split(self, a: int, b: int) -> None:
+        cid = self._component_of[a]
+        self._members.pop(cid, None)
+        reached = self._reach(a, b)
+        if b in reached:
+            return
+        remaining = self._components[cid]
+        remaining -= reached
+        if len(remaining) < 2:
+            self._drop_component(cid)
+        if len(reached) >= 2:
+            self._new_component(reached)
+        else:
+            self._component_of.pop(a, None)
@@ -0,0 +1,33 @@
+from __future__ import annotations
+
+from typing import Callable
+
+
+BalanceListener = Callable[[int, int, int], None]
+
+
+class TrackedBalances(dict):
+    """Token balance dict that reports every item assignment to its listeners.
+
+    Listeners receive ``(agent_id, old_balance, new_balance)`` after the write.
+    Only ``balances[aid] = value`` (including ``+=``/``-=``) is reported; bulk
+    helpers such as ``update`` bypass the listeners and must not be used on
+    live world balances.
+    """
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.listeners: list[BalanceListener] = []
+
+    def __reduce__(self):
+        # Restore items before listeners so unpickling does not notify half-built listeners.
+        return (type(self), (dict(self),), {"listeners": self.listeners})
+
+    def subscribe(self, listener: BalanceListener) -> None:
+        self.listeners.append(listener)
+
+    def __setitem__(self, agent_id: int, value: int) -> None:
+        old = dict.get(self, agent_id, 0)
+        dict.__setitem__(self, agent_id, value)
+        for listener in self.listeners:
+            listener(agent_id, old, value)
@@ -0,0 +1,157 @@
+"""
+Aligned diff of two event streams for replay comparison.
+Streams are read turn by turn as canonical event bytes. Identical turns are
+skipped without decoding; only turns whose bytes differ are parsed, and their
+events are aligned by (turn, actor) so one extra or missing event does not
+shift every comparison after it. Only the first ``limit`` differences are
+kept, with totals counted over the whole stream.
+"""
+
+from __future__ import annotations
+
+import json
+from collections import Counter
+from dataclasses import dataclass, field
+from itertools import zip_longest
+from pathlib import Path
+from typing import Any, Iterable, Iterator
+
+from .logger import encode_event
+from .segments import MANIFEST_NAME, segment_lines
+from .trace import event_difference
+
+
+DEFAULT_LIMIT = 50
+DIFF_KINDS = ("changed", "only_left", "only_right")
+_TURN_KEY = b'"turn":'
+
+TurnBlock = tuple[int, list[bytes]]
+
+
+def encoded_lines(events: Iterable[dict[str, Any]]) -> Iterator[bytes]:
+    """Canonical bytes of each event, as segment files store them."""
+    return (encode_event(event) for event in events)
+
+
+def line_turn(line: bytes) -> int:
+    # Keys are sorted and "turn" sorts last, so the event's own turn closes the line.
+    return int(line[line.rindex(_TURN_KEY) + len(_TURN_KEY):-1])
+
+
+def turn_blocks(lines: Iterable[bytes]) -> Iterator[TurnBlock]:
+    """Group a turn-ordered stream of event lines into one block per turn."""
+    turn, block = None, []
+    for line in lines:
+        current = line_turn(line)
+        if current != turn and block:
+            yield turn, block
+            block = []
+        turn = current
+        block.append(line)
+    if block:
+        yield turn, block
+
+
+def _by_actor(block: list[bytes]) -> dict[int, list[dict[str, Any]]]:
+    grouped: dict[int, list[dict[str, Any]]] = {}
+    for line in block:
+        event = json.loads(line)
+        grouped.setdefault(event["actor"], []).append(event)
+    return grouped
+
+
+@dataclass
+class EventDiff:
+    """Capped list of event differences plus totals over both streams."""
+
+    limit: int = DEFAULT_LIMIT
+    differences: list[dict[str, Any]] = field(default_factory=list)
+    counts: Counter = field(default_factory=Counter)
+    fields: Counter = field(default_factory=Counter)
+    first_turn: int | None = None
+
+    @property
+    def identical(self) -> bool:
+        return self.first_turn is None
+
+    def _record(self, difference: dict[str, Any]) -> None:
+        self.counts[f"events_{difference['kind']}"] += 1
+        self.fields[difference["field"]] += 1
+        if self.first_turn is None:
+            self.first_turn = difference["turn"]
+        if len(self.differences) < self.limit:
+            self.differences.append(difference)
+
+    def _one_sided(self, turn: int, block: list[bytes], kind: str) -> None:
+        self.counts[f"turns_{kind}"] += 1
+        for _, events in sorted(_by_actor(block).items()):
+            for index, event in enumerate(events):
+                self._record(self._difference(turn, index, event, kind))
+
+    def _compare_turn(self, turn: int, left: list[bytes], right: list[bytes]) -> None:
+        if left == right:
+            self.counts["turns_identical"] += 1
+            return
+        self.counts["turns_differing"] += 1
+        left_actors, right_actors = _by_actor(left), _by_actor(right)
+        for actor in sorted(set(left_actors) | set(right_actors)):
+            pairs = zip_longest(left_actors.get(actor, ()), right_actors.get(actor, ()))
+            for index, (a, b) in enumerate(pairs):
+                if a == b:
+                    continue
+                kind = "changed" if a is not None and b is not None else "only_left" if b is None else "only_right"
+                if kind == "changed":
+                    difference = event_difference(index, a, b)
+                    difference.pop("source")
+                    self._record({"turn": turn, "kind": kind, **difference})
+                else:
+                    self._record(self._difference(turn, index, a if b is None else b, kind))
+
+    @staticmethod
+    def _difference(turn: int, index: int, event: dict[str, Any], kind: str) -> dict[str, Any]:
+        return {
+            "turn": turn,
+            "kind": kind,
+            "index": index,
+            "actor": event["actor"],
+            "action": event["action"],
+            "field": "event",
+            "values": [event, None] if kind == "only_left" else [None, event],
+        }
+
+    def summary(self) -> dict[str, Any]:
+        total = sum(self.counts[f"events_{kind}"] for kind in DIFF_KINDS)
+        return {
+            "identical": self.identical,
+            "first_divergent_turn": self.first_turn,
+            "counts": dict(sorted(self.counts.items())),
+            "fields": dict(self.fields.most_common()),
+            "differences": self.differences,
+            "truncated": total > len(self.differences),
+        }
+
+
+def diff_event_streams(left: Iterable[bytes], right: Iterable[bytes], limit: int = DEFAULT_LIMIT) -> EventDiff:
+    """Diff two turn-ordered streams of canonical event lines, holding one turn of each at a time."""
+    diff = EventDiff(limit=limit)
+    left_blocks, right_blocks = turn_blocks(left), turn_blocks(right)
+    a, b = next(left_blocks, None), next(right_blocks, None)
+    while a is not None or b is not None:
+        if b is None or (a is not None and a[0] < b[0]):
+            diff._one_sided(a[0], a[1], "only_left")
+            a = next(left_blocks, None)
+        elif a is None or b[0] < a[0]:
+            diff._one_sided(b[0], b[1], "only_right")
+            b = next(right_blocks, None)
+        else:
+            diff._compare_turn(a[0], a[1], b[1])
+            a, b = next(left_blocks, None), next(right_blocks, None)
+    return diff
+
+
+def diff_segment_dirs(left: str | Path, right: str | Path, limit: int = DEFAULT_LIMIT) -> EventDiff:
+    """Diff two flushed spill directories; equal manifest digests skip reading any segment."""
+    manifests = [json.loads((Path(d) / MANIFEST_NAME).read_text(encoding="utf-8")) for d in (left, right)]
+    if manifests[0]["log_digest"] == manifests[1]["log_digest"]:
+        return EventDiff(limit=limit)
+    return diff_event_streams(segment_lines(left), segment_lines(right), limit)
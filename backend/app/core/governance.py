@@ -1,17 +1,84 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import Any
+from typing import Any, Collection, Iterable
 
 from .rules import RuleSet
 
 
+@dataclass
+class VoteTally:
+    """Running token weights behind the pending proposal.
+
+    ``total`` is the summed balance of alive agents and ``yes``/``no`` the
+    balances of alive agents who voted that way. ``votes`` and ``balances``
+    are shared with the governance system and the world; the world keeps
+    the tally current through balance writes, votes and eliminations, so
+    deciding a proposal does not rescan every agent.
+    """
+
+    votes: dict[int, str]
+    balances: dict[int, int]
+    alive: set[int] = field(default_factory=set)
+    total: int = 0
+    yes: int = 0
+    no: int = 0
+
+    def bootstrap(self, alive_ids: Iterable[int]) -> None:
+        self.alive = set(alive_ids)
+        self.total = sum(self.balances.get(aid, 0) for aid in self.alive)
+        self.yes = sum(self.balances.get(aid, 0) for aid in self.alive if self.votes.get(aid) == "yes")
+        self.no = sum(self.balances.get(aid, 0) for aid in self.alive if self.votes.get(aid) == "no")
+
+    @property
+    def abstain(self) -> int:
+        return self.total - self.yes - self.no
+
+    def _shift(self, vote: str | None, delta: int) -> None:
+        if vote == "yes":
+            self.yes += delta
+        elif vote == "no":
+            self.no += delta
+
+    def on_balance_change(self, agent_id: int, old: int, new: int) -> None:
+        if agent_id not in self.alive:
+            return
+        self.total += new - old
+        self._shift(self.votes.get(agent_id), new - old)
+
+    def on_vote(self, agent_id: int, previous: str | None, vote: str) -> None:
+        if agent_id not in self.alive:
+            return
+        balance = self.balances.get(agent_id, 0)
+        self._shift(previous, -balance)
+        self._shift(vote, balance)
+
+    def on_removed(self, agent_id: int) -> None:
+        if agent_id not in self.alive:
+            return
+        balance = self.balances.get(agent_id, 0)
+        self.alive.discard(agent_id)
+        self.total -= balance
+        self._shift(self.votes.get(agent_id), -balance)
+
+    def on_votes_cleared(self) -> None:
+        self.yes = self.no = 0
+
+
+def _decide(total: float, yes: float, no: float) -> tuple[bool, bool]:
+    # Proposal passes if YES votes exceed 50% of total token supply
+    passed = yes > (total / 2)
+    failed = no >= (total / 2) or (yes + (total - yes - no)) <= (total / 2)
+    return passed, failed
+
+
 @dataclass
 class GovernanceSystem:
     rules: RuleSet
     pending: dict[str, Any] | None = None
     votes: dict[int, str] = field(default_factory=dict)
     proposal_counter: int = 0
+    tally: VoteTally | None = None
 
     def propose(self, actor: int, payload: dict[str, Any], turn: int) -> tuple[bool, str]:
         if self.pending is not None:
@@ -24,43 +91,67 @@ class GovernanceSystem:
             "key": payload.get("key"),
             "value": payload.get("value"),
         }
-        self.votes.clear()
+        self._clear_votes()
         return True, "proposal_registered"
 
     def vote(self, actor: int, vote: str) -> tuple[bool, str]:
         if self.pending is None:
             return False, "no_pending_proposal"
+        previous = self.votes.get(actor)
         self.votes[actor] = vote
+        if self.tally is not None:
+            self.tally.on_vote(actor, previous, vote)
         return True, "vote_recorded"
 
-    def try_resolve(self, alive_ids: list[int], turn: int, force: bool = False, token_balances: dict[int, int] = None) -> tuple[bool, str, dict[str, Any] | None]:
+    def fork(self, rules: RuleSet) -> GovernanceSystem:
+        """Copy of the pending proposal and votes, deciding against ``rules``; re-attach a tally."""
+        return GovernanceSystem(
+            rules=rules,
+            pending=dict(self.pending) if self.pending is not None else None,
+            votes=dict(self.votes),
+            proposal_counter=self.proposal_counter,
+        )
+
+    def attach_tally(self, alive_ids: Iterable[int], token_balances: dict[int, int]) -> VoteTally:
+        """Switch pass/fail checks to an incrementally maintained VoteTally."""
+        self.tally = VoteTally(votes=self.votes, balances=token_balances)
+        self.tally.bootstrap(alive_ids)
+        return self.tally
+
+    def _clear_votes(self) -> None:
+        self.votes.clear()
+        if self.tally is not None:
+            self.tally.on_votes_cleared()
+
+    def decide_by_summation(self, alive_ids: Iterable[int], token_balances: dict[int, int]) -> tuple[bool, bool]:
+        """Pass/fail check that rescans every alive agent's balance and vote."""
+        alive_ids = list(alive_ids)
+        total_token_supply = sum(token_balances.get(aid, 0) for aid in alive_ids)
+        yes_vote_weight = sum(token_balances.get(aid, 0) for aid in alive_ids if self.votes.get(aid) == "yes")
+        no_vote_weight = sum(token_balances.get(aid, 0) for aid in alive_ids if self.votes.get(aid) == "no")
+        return _decide(total_token_supply, yes_vote_weight, no_vote_weight)
+
+    def try_resolve(self, alive_ids: Collection[int], turn: int, force: bool = False, token_balances: dict[int, int] = None) -> tuple[bool, str, dict[str, Any] | None]:
         if self.pending is None:
             return False, "no_pending_proposal", None
 
         if token_balances is None:
             token_balances = {}
-        
-        total_alive = len(alive_ids)
-        if total_alive == 0:
+
+        if len(alive_ids) == 0:
             return False, "no_alive_agents", None
 
-        # Calculate total token supply of alive agents
-        total_token_supply = sum(token_balances.get(aid, 0) for aid in alive_ids)
-        
-        # Calculate YES and NO vote weights
-        yes_vote_weight = sum(token_balances.get(aid, 0) for aid in alive_ids if self.votes.get(aid) == "yes")
-        no_vote_weight = sum(token_balances.get(aid, 0) for aid in alive_ids if self.votes.get(aid) == "no")
-        
-        # Proposal passes if YES votes exceed 50% of total token supply
-        passed = yes_vote_weight > (total_token_supply / 2)
-        failed = no_vote_weight >= (total_token_supply / 2) or (yes_vote_weight + (total_token_supply - yes_vote_weight - no_vote_weight)) <= (total_token_supply / 2)
+        if self.tally is not None:
+            passed, failed = _decide(self.tally.total, self.tally.yes, self.tally.no)
+        else:
+            passed, failed = self.decide_by_summation(alive_ids, token_balances)
 
         if not force and not passed and not failed:
             return False, "awaiting_votes", None
 
         proposal = self.pending
         self.pending = None
-        self.votes.clear()
+        self._clear_votes()
 
         if not passed:
             return True, "proposal_rejected", proposal
@@ -0,0 +1,191 @@
+"""
+Per-agent time-series storage for The Cheater's Dilemma.
+Records one typed array column per metric, with every agent's value for a
+turn stored side by side, plus per-agent action outcome counters.
+"""
+
+from __future__ import annotations
+
+from array import array
+from typing import Any
+
+
+SUCCESS_OUTCOMES = frozenset({"success", "accepted"})
+FAILURE_OUTCOMES = frozenset({"failed", "blocked", "rejected"})
+
+METRIC_TYPECODES = {
+    "token_balance": "q",
+    "trust": "d",
+    "aggression": "d",
+    "health": "i",
+    "rank": "i",
+}
+
+
+def downsample(turns: list[int], values: list[float], max_points: int) -> list[dict[str, Any]]:
+    """Bucket a series into at most ``max_points`` min/max/last summaries."""
+    if not values:
+        return []
+    size = max(1, -(-len(values) // max(1, max_points)))
+    buckets = []
+    for start in range(0, len(values), size):
+        chunk = values[start:start + size]
+        buckets.append(
+            {
+                "turn": turns[min(start + size, len(values)) - 1],
+                "min": min(chunk),
+                "max": max(chunk),
+                "last": chunk[-1],
+            }
+        )
+    return buckets
+
+
+class AgentHistory:
+    """Compact per-turn history of every agent's state.
+
+    With a ``capacity`` the history thins itself like ``SeriesBuffer``: once
+    more than ``capacity`` turns are held, only turns on a doubled stride are
+    kept, plus the latest turn, so long runs stay within a fixed size.
+
+    ``fork`` seals the rows recorded so far into a chunk that the original
+    and the fork both read but neither writes again; each keeps appending to
+    its own live columns.
+    """
+
+    def __init__(self, agent_ids: list[int], capacity: int | None = None) -> None:
+        if capacity is not None and capacity < 2:
+            raise ValueError("capacity must be at least 2")
+        self.agent_ids = list(agent_ids)
+        self.capacity = capacity
+        self.stride = 1
+        self._latest_off_stride = False
+        self._index = {aid: i for i, aid in enumerate(self.agent_ids)}
+        # Sealed (turns, columns, rows) chunks shared with forks, oldest first.
+        self._chunks: tuple[tuple[array, dict[str, array], int], ...] = ()
+        self._sealed_rows = 0
+        self.turns = array("i")
+        self.columns: dict[str, array] = {name: array(code) for name, code in METRIC_TYPECODES.items()}
+        self.successes: dict[int, int] = dict.fromkeys(self.agent_ids, 0)
+        self.failures: dict[int, int] = dict.fromkeys(self.agent_ids, 0)
+        self.total_actions: dict[int, int] = dict.fromkeys(self.agent_ids, 0)
+
+    def __contains__(self, agent_id: int) -> bool:
+        return agent_id in self._index
+
+    @property
+    def row_count(self) -> int:
+        return self._sealed_rows + len(self.turns)
+
+    def record_turn(
+        self,
+        turn: int,
+        *,
+        token_balances: dict[int, int],
+        trust: dict[int, float],
+        aggression: dict[int, float],
+        health: dict[int, int],
+        alive: set[int],
+    ) -> None:
+        ordered = sorted(alive, key=lambda aid: (-token_balances[aid], aid))
+        ranks = {aid: rank for rank, aid in enumerate(ordered, start=1)}
+        if self._latest_off_stride:
+            # The previous turn was only kept as the latest value.
+            del self.turns[-1]
+            for column in self.columns.values():
+                del column[-len(self.agent_ids):]
+        self.turns.append(turn)
+        self.columns["token_balance"].extend(token_balances[aid] for aid in self.agent_ids)
+        self.columns["trust"].extend(trust[aid] for aid in self.agent_ids)
+        self.columns["aggression"].extend(aggression[aid] for aid in self.agent_ids)
+        self.columns["health"].extend(health.get(aid, 0) for aid in self.agent_ids)
+        self.columns["rank"].extend(ranks.get(aid, 0) for aid in self.agent_ids)
+        self._latest_off_stride = turn % self.stride != 0
+        if self.capacity is not None and self.row_count > self.capacity:
+            self._thin()
+
+    def _all_turns(self) -> list[int]:
+        turns: list[int] = []
+        for chunk_turns, _, rows in self._chunks:
+            turns.extend(chunk_turns[:rows])
+        turns.extend(self.turns)
+        return turns
+
+    def _thin(self) -> None:
+        self.stride *= 2
+        width = len(self.agent_ids)
+        sources = [*self._chunks, (self.turns, self.columns, len(self.turns))]
+        last = self.row_count - 1
+        turns = array("i")
+        columns = {name: array(column.typecode) for name, column in self.columns.items()}
+        offset = 0
+        for chunk_turns, chunk_columns, rows in sources:
+            for row in range(rows):
+                turn = chunk_turns[row]
+                if turn % self.stride == 0 or offset + row == last:
+                    turns.append(turn)
+                    for name, column in columns.items():
+                        column.extend(chunk_columns[name][row * width:(row + 1) * width])
+            offset += rows
+        self._chunks, self._sealed_rows = (), 0
+        self.turns, self.columns = turns, columns
+        self._latest_off_stride = self.turns[-1] % self.stride != 0
+
+    def _seal(self) -> None:
+        """Move the live rows into a shared chunk, keeping an off-stride latest row live."""
+        rows = len(self.turns)
+        sealed = rows - 1 if self._latest_off_stride and rows else rows
+        if sealed:
+            self._chunks += ((self.turns, self.columns, sealed),)
+            self._sealed_rows += sealed
+        width = len(self.agent_ids)
+        self.turns = array("i", self.turns[sealed:])
+        self.columns = {name: array(column.typecode, column[sealed * width:]) for name, column in self.columns.items()}
+
+    def fork(self) -> AgentHistory:
+        """An independent history sharing every row recorded so far."""
+        self._seal()
+        forked = AgentHistory.__new__(AgentHistory)
+        forked.agent_ids = self.agent_ids
+        forked.capacity = self.capacity
+        forked.stride = self.stride
+        forked._latest_off_stride = self._latest_off_stride
+        forked._index = self._index
+        forked._chunks = self._chunks
+        forked._sealed_rows = self._sealed_rows
+        forked.turns = array("i", self.turns)
+        forked.columns = {name: array(column.typecode, column) for name, column in self.columns.items()}
+        forked.successes = dict(self.successes)
+        forked.failures = dict(self.failures)
+        forked.total_actions = dict(self.total_actions)
+        return forked
+
+    def record_outcome(self, agent_id: int, outcome: str) -> None:
+        if agent_id not in self._index:
+            return
+        self.total_actions[agent_id] += 1
+        if outcome in SUCCESS_OUTCOMES:
+            self.successes[agent_id] += 1
+        elif outcome in FAILURE_OUTCOMES:
+            self.failures[agent_id] += 1
+
+    def series(self, agent_id: int, metric: str) -> list[float]:
+        stride = len(self.agent_ids)
+        index = self._index[agent_id]
+        values: list[float] = []
+        for _, columns, rows in self._chunks:
+            values.extend(columns[metric][index:rows * stride:stride])
+        values.extend(self.columns[metric][index::stride])
+        return values
+
+    def latest(self, agent_id: int, metric: str) -> float | None:
+        stride = len(self.agent_ids)
+        if self.turns:
+            return self.columns[metric][(len(self.turns) - 1) * stride + self._index[agent_id]]
+        if self._chunks:
+            _, columns, rows = self._chunks[-1]
+            return columns[metric][(rows - 1) * stride + self._index[agent_id]]
+        return None
+
+    def downsampled(self, agent_id: int, metric: str, max_points: int = 300) -> list[dict[str, Any]]:
+        return downsample(self._all_turns(), self.series(agent_id, metric), max_points)
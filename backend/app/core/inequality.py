@@ -0,0 +1,186 @@
+"""
+Incremental inequality tracking for The Cheater's Dilemma.
+Maintains Gini, HHI and top-k share as token balances change, instead of
+re-sorting every balance on every turn.
+"""
+
+from __future__ import annotations
+
+from bisect import bisect_left, bisect_right, insort
+from dataclasses import dataclass, field, replace
+from typing import Any
+
+
+class SortedBalances:
+    """Sorted multiset of non-negative balances with running sums.
+
+    Besides the running total it keeps the pairwise absolute difference sum
+    D = sum_{i<j} |x_i - x_j|, which gives Gini = D / (n * total).
+    Moving one value from ``a`` to ``b`` only has to look at the elements lying
+    strictly between the two, so small balance changes stay cheap.
+    """
+
+    def __init__(self) -> None:
+        self._values: list[int] = []
+        self.total: int = 0
+        self.pair_diff_sum: int = 0
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def fork(self) -> SortedBalances:
+        forked = SortedBalances()
+        forked._values = list(self._values)
+        forked.total = self.total
+        forked.pair_diff_sum = self.pair_diff_sum
+        return forked
+
+    def add(self, value: int) -> None:
+        self.pair_diff_sum += sum(abs(value - x) for x in self._values)
+        insort(self._values, value)
+        self.total += value
+
+    def remove(self, value: int) -> None:
+        idx = bisect_left(self._values, value)
+        if idx >= len(self._values) or self._values[idx] != value:
+            raise KeyError(value)
+        del self._values[idx]
+        self.pair_diff_sum -= sum(abs(value - x) for x in self._values)
+        self.total -= value
+
+    def replace(self, old: int, new: int) -> None:
+        if old == new:
+            return
+        idx = bisect_left(self._values, old)
+        if idx >= len(self._values) or self._values[idx] != old:
+            raise KeyError(old)
+        del self._values[idx]
+
+        lo, hi = (old, new) if old < new else (new, old)
+        lo_idx = bisect_right(self._values, lo)
+        hi_idx = bisect_left(self._values, hi)
+        delta = (new - old) * lo_idx + (old - new) * (len(self._values) - hi_idx)
+        for x in self._values[lo_idx:hi_idx]:
+            delta += abs(new - x) - abs(old - x)
+        self.pair_diff_sum += delta
+
+        insort(self._values, new)
+        self.total += new - old
+
+    def top_sum(self, k: int) -> int:
+        return sum(self._values[-k:]) if k > 0 else 0
+
+    def gini(self) -> float:
+        n = len(self._values)
+        if n == 0 or self.total == 0:
+            return 0.0
+        return round(self.pair_diff_sum / (n * self.total), 6)
+
+
+@dataclass
+class SeriesBuffer:
+    """Fixed-capacity buffer of per-turn samples.
+
+    When the buffer fills up, every other sample is dropped and the sampling
+    stride doubles, so a run of any length keeps evenly spaced coverage from
+    turn 0 to the latest turn in at most ``capacity`` points.
+    """
+
+    capacity: int = 512
+    stride: int = 1
+    samples: list[dict[str, Any]] = field(default_factory=list)
+    last: dict[str, Any] | None = None
+
+    def append(self, sample: dict[str, Any]) -> None:
+        self.last = sample
+        if sample["turn"] % self.stride != 0:
+            return
+        if len(self.samples) >= self.capacity:
+            self.samples = self.samples[::2]
+            self.stride *= 2
+            if sample["turn"] % self.stride != 0:
+                return
+        self.samples.append(sample)
+
+    def points(self) -> list[dict[str, Any]]:
+        """Return the retained samples plus the latest one if it was skipped."""
+        points = list(self.samples)
+        if self.last is not None and (not points or points[-1]["turn"] != self.last["turn"]):
+            points.append(self.last)
+        return points
+
+
+class InequalityTracker:
+    """Per-turn Gini/HHI/top-k series fed by the world's token balances."""
+
+    def __init__(self, capacity: int = 512) -> None:
+        self.balances = SortedBalances()
+        self.series = SeriesBuffer(capacity=capacity)
+        self._known: dict[int, int] = {}
+        self._all_total: int = 0
+        self._all_sum_squares: int = 0
+
+    def fork(self) -> InequalityTracker:
+        forked = InequalityTracker(self.series.capacity)
+        forked.balances = self.balances.fork()
+        # Samples are never modified once appended, so the copy can share them.
+        forked.series = replace(self.series, samples=list(self.series.samples))
+        forked._known = dict(self._known)
+        forked._all_total = self._all_total
+        forked._all_sum_squares = self._all_sum_squares
+        return forked
+
+    def bootstrap(self, token_balances: dict[int, int]) -> None:
+        for aid, value in token_balances.items():
+            self._set(aid, int(value))
+        self.series.append(self.sample(0))
+
+    def observe(self, turn: int, token_balances: dict[int, int]) -> dict[str, Any]:
+        for aid, value in token_balances.items():
+            if self._known.get(aid) != value:
+                self._set(aid, int(value))
+        sample = self.sample(turn)
+        self.series.append(sample)
+        return sample
+
+    def _set(self, aid: int, value: int) -> None:
+        # Gini ignores negative balances, mirroring MetricsService.calculate_gini;
+        # HHI is taken over every balance.
+        old = self._known.get(aid)
+        if old is not None:
+            self._all_total -= old
+            self._all_sum_squares -= old * old
+        self._all_total += value
+        self._all_sum_squares += value * value
+        self._known[aid] = value
+
+        old_in = old is not None and old >= 0
+        new_in = value >= 0
+        if old_in and new_in:
+            self.balances.replace(old, value)
+        elif old_in:
+            self.balances.remove(old)
+        elif new_in:
+            self.balances.add(value)
+
+    def hhi(self) -> float:
+        if self._all_total <= 0:
+            return 0.0
+        return round(self._all_sum_squares * 10000.0 / (self._all_total * self._all_total), 3)
+
+    def top_share(self, k: int) -> float:
+        if self._all_total <= 0:
+            return 0.0
+        return round(self.balances.top_sum(k) / self._all_total, 6)
+
+    def sample(self, turn: int) -> dict[str, Any]:
+        return {
+            "turn": turn,
+            "gini": self.balances.gini(),
+            "hhi": self.hhi(),
+            "top1_share": self.top_share(1),
+            "top3_share": self.top_share(3),
+        }
+
+    def points(self) -> list[dict[str, Any]]:
+        return self.series.points()
@@ -3,17 +3,118 @@ from __future__ import annotations
 import hashlib
 import json
 from dataclasses import dataclass, field
-from typing import Any
+from typing import Any, Iterable, Iterator
+
+from .sharing import PrefixList
 
 
 EXTERNAL_ACTION_LABELS = {
     "ATTACK": "ELIMINATE",
 }
 
+# "full" records every event. "aggregate" folds routine events (successful
+# WORK and REST, and noops such as DO_NOTHING) into one TURN_SUMMARY per turn.
+# "significant" also folds everything except resolved conflicts, accepted
+# proposals and governance results. The digest of a level is the digest of
+# its own stream, which equals project_events(full_events, level).
+VERBOSITY_LEVELS = ("full", "aggregate", "significant")
+SUMMARY_ACTION = "TURN_SUMMARY"
+SUMMED_DETAILS = {"WORK": "gain", "REST": "heal"}  # per-actor sums kept for folded successes
+CONFLICT_ACTIONS = frozenset({"STEAL", "ATTACK", "ELIMINATE", "COALITION_ATTACK"})
+GOVERNANCE_RESULTS = frozenset({"RULE_CHANGE", "RULE_VOTE_RESULT"})
+
+
+def encode_event(entry: dict[str, Any]) -> bytes:
+    """Canonical bytes of one event, as EventLogger.digest() serializes it."""
+    return json.dumps(entry, sort_keys=True, separators=(",", ":")).encode("utf-8")
+
+
+def keeps_event(level: str, action: str, outcome: str) -> bool:
+    """Whether ``level`` records this event individually rather than folding it."""
+    if level == "full":
+        return True
+    if level == "aggregate":
+        return not (outcome == "noop" or (outcome == "success" and action in SUMMED_DETAILS))
+    if action in CONFLICT_ACTIONS:
+        return outcome in ("success", "failed")
+    if action == "PROPOSE_RULE":
+        return outcome == "accepted"
+    return action in GOVERNANCE_RESULTS
+
+
+class TurnFold:
+    """Counters and per-actor sums for the events folded out of one turn."""
+
+    __slots__ = ("counts", "sums")
+
+    def __init__(self) -> None:
+        self.counts: dict[str, int] = {}
+        self.sums: dict[str, dict[int, list[int]]] = {}
+
+    def add(self, action: str, outcome: str, actor: int, details: dict[str, Any]) -> None:
+        key = f"{action}/{outcome}"
+        self.counts[key] = self.counts.get(key, 0) + 1
+        summed = SUMMED_DETAILS.get(action)
+        if summed is not None and outcome == "success":
+            row = self.sums.setdefault(action, {}).setdefault(actor, [0, 0])
+            row[0] += 1
+            row[1] += int(details.get(summed, 0))
+
+    def entry(self, turn: int, level: str) -> dict[str, Any]:
+        details: dict[str, Any] = {"counts": dict(sorted(self.counts.items()))}
+        for action, per_actor in sorted(self.sums.items()):
+            # Rows are [actor, folded events, summed detail].
+            details[f"{action.lower()}_{SUMMED_DETAILS[action]}"] = [
+                [actor, count, total] for actor, (count, total) in sorted(per_actor.items())
+            ]
+        return {
+            "turn": turn,
+            "actor": -1,
+            "action": SUMMARY_ACTION,
+            "target": None,
+            "outcome": "aggregated",
+            "rule_justification": f"verbosity_{level}",
+            "details": details,
+        }
+
+
+def project_events(events: Iterable[dict[str, Any]], level: str) -> Iterator[dict[str, Any]]:
+    """The stream a ``level`` logger would have recorded, given a full-verbosity stream."""
+    if level not in VERBOSITY_LEVELS:
+        raise ValueError(f"verbosity must be one of {VERBOSITY_LEVELS}")
+    if level == "full":
+        yield from events
+        return
+    fold, turn = TurnFold(), None
+    for event in events:
+        if event["turn"] != turn:
+            if fold.counts:
+                yield fold.entry(turn, level)
+                fold = TurnFold()
+            turn = event["turn"]
+        if keeps_event(level, event["action"], event["outcome"]):
+            yield event
+        else:
+            fold.add(event["action"], event["outcome"], event["actor"], event["details"])
+    if fold.counts:
+        yield fold.entry(turn, level)
+
 
 @dataclass
 class EventLogger:
     events: list[dict[str, Any]] = field(default_factory=list)
+    verbosity: str = "full"
+    _fold: TurnFold = field(default_factory=TurnFold, init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        if self.verbosity not in VERBOSITY_LEVELS:
+            raise ValueError(f"verbosity must be one of {VERBOSITY_LEVELS}")
+
+    def keeps(self, action: str, outcome: str) -> bool:
+        """Whether ``log`` would record this event rather than fold it."""
+        if self.verbosity == "full":
+            return True
+        return keeps_event(self.verbosity, EXTERNAL_ACTION_LABELS.get(action, action), outcome)
 
     def log(
         self,
@@ -26,17 +127,46 @@ class EventLogger:
         rule_justification: str,
         details: dict[str, Any] | None = None,
     ) -> None:
+        label = EXTERNAL_ACTION_LABELS.get(action, action)
+        if self.verbosity != "full" and not keeps_event(self.verbosity, label, outcome):
+            self._fold.add(label, outcome, actor, details or {})
+            return
         entry = {
             "turn": turn,
             "actor": actor,
-            "action": EXTERNAL_ACTION_LABELS.get(action, action),
+            "action": label,
             "target": target,
             "outcome": outcome,
             "rule_justification": rule_justification,
             "details": details or {},
         }
+        self._append(entry)
+
+    def _append(self, entry: dict[str, Any]) -> None:
         self.events.append(entry)
 
+    def end_turn(self, turn: int) -> None:
+        """Record the TURN_SUMMARY for ``turn`` if anything was folded out of it."""
+        if self._fold.counts:
+            self._append(self._fold.entry(turn, self.verbosity))
+            self._fold = TurnFold()
+
+    def flush(self) -> None:
+        """Persist buffered events; the in-memory logger has nothing to do."""
+
+    def fork(self) -> EventLogger:
+        """A logger that shares this log's events so far and records its own after them."""
+        return EventLogger(events=PrefixList(self.events), verbosity=self.verbosity)
+
     def digest(self) -> str:
-        payload = json.dumps(self.events, sort_keys=True, separators=(",", ":"))
-        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+        if isinstance(self.events, list):
+            payload = json.dumps(self.events, sort_keys=True, separators=(",", ":"))
+            return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+        # Shared-prefix logs hash entry by entry; the bytes match json.dumps of the list.
+        hasher = hashlib.sha256(b"[")
+        for i, entry in enumerate(self.events):
+            if i:
+                hasher.update(b",")
+            hasher.update(encode_event(entry))
+        hasher.update(b"]")
+        return hasher.hexdigest()
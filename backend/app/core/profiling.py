@@ -0,0 +1,190 @@
+"""
+Per-phase turn profiling for The Cheater's Dilemma.
+Accumulates nanosecond phase timers and action counters while World.step
+runs, folds them into fixed-bucket histograms at the end of every turn and
+renders everything in the Prometheus text exposition format.
+"""
+
+from __future__ import annotations
+
+from bisect import bisect_left
+from time import perf_counter_ns
+from typing import Iterable, Mapping
+
+PHASES = ("observe", "decide", "validate", "resolve", "log", "governance", "record")
+
+# Seconds; turns of a 5-20 agent world take well under a millisecond.
+DURATION_BUCKETS = (
+    0.00001, 0.000025, 0.00005, 0.0001, 0.00025, 0.0005,
+    0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5,
+)
+RATE_BUCKETS = (100.0, 1_000.0, 10_000.0, 100_000.0, 1_000_000.0, 10_000_000.0)
+
+
+class Histogram:
+    """Cumulative-on-render histogram with fixed upper bounds."""
+
+    __slots__ = ("bounds", "counts", "sum", "count")
+
+    def __init__(self, bounds: tuple[float, ...]) -> None:
+        self.bounds = bounds
+        self.counts = [0] * (len(bounds) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(self.bounds, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def cumulative(self) -> list[tuple[str, int]]:
+        rows, running = [], 0
+        for bound, n in zip(self.bounds, self.counts):
+            running += n
+            rows.append((_format_value(bound), running))
+        rows.append(("+Inf", running + self.counts[-1]))
+        return rows
+
+
+class StepStats:
+    """Aggregated turn profile of one world, or of the whole process."""
+
+    def __init__(self) -> None:
+        self.turn = Histogram(DURATION_BUCKETS)
+        self.phases = {phase: Histogram(DURATION_BUCKETS) for phase in PHASES}
+        self.events_per_second = Histogram(RATE_BUCKETS)
+        self.actions: dict[tuple[str, str], int] = {}
+        self.turns = 0
+        self.events = 0
+
+    def record_turn(self, total_ns: int, phase_ns: Mapping[str, int], events: int) -> None:
+        self.turns += 1
+        self.events += events
+        self.turn.observe(total_ns / 1e9)
+        for phase, ns in phase_ns.items():
+            self.phases[phase].observe(ns / 1e9)
+        if total_ns > 0:
+            self.events_per_second.observe(events * 1e9 / total_ns)
+
+    def record_actions(self, counts: Mapping[tuple[str, str], int]) -> None:
+        for key, n in counts.items():
+            self.actions[key] = self.actions.get(key, 0) + n
+
+
+PROCESS_STATS = StepStats()
+
+
+class TurnProfiler:
+    """Phase timers for one World; attach as ``World.profiler``.
+
+    ``add`` and ``count`` only touch plain dicts, so the instrumented paths
+    stay cheap; the histograms are updated once per turn in ``end_turn``.
+    Time not claimed by another phase is booked as ``resolve``.
+    """
+
+    def __init__(self, parent: StepStats | None = PROCESS_STATS) -> None:
+        self.stats = StepStats()
+        self.parent = parent
+        self._phase_ns = dict.fromkeys(PHASES, 0)
+        self._actions: dict[tuple[str, str], int] = {}
+        self._started = 0
+        self._events_before = 0
+
+    def start_turn(self, event_count: int) -> None:
+        self._phase_ns = dict.fromkeys(PHASES, 0)
+        self._actions = {}
+        self._events_before = event_count
+        self._started = perf_counter_ns()
+
+    def add(self, phase: str, ns: int) -> None:
+        self._phase_ns[phase] += ns
+
+    def count(self, kind: str, outcome: str) -> None:
+        key = (kind, outcome)
+        self._actions[key] = self._actions.get(key, 0) + 1
+
+    def end_turn(self, event_count: int) -> int:
+        """Close the turn; returns its total duration in nanoseconds."""
+        total = perf_counter_ns() - self._started
+        phases = self._phase_ns
+        phases["resolve"] = max(0, total - sum(ns for phase, ns in phases.items() if phase != "resolve"))
+        events = event_count - self._events_before
+        for stats in (self.stats, self.parent):
+            if stats is not None:
+                stats.record_turn(total, phases, events)
+                stats.record_actions(self._actions)
+        return total
+
+
+def _format_value(value: float) -> str:
+    return str(int(value)) if value >= 1 and value == int(value) else repr(float(value))
+
+
+def _labels(pairs: Iterable[tuple[str, str]]) -> str:
+    body = ",".join(f'{k}="{_escape(v)}"' for k, v in pairs)
+    return "{" + body + "}" if body else ""
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _histogram_lines(name: str, hist: Histogram, labels: tuple[tuple[str, str], ...]) -> list[str]:
+    lines = [f"{name}_bucket{_labels(labels + (('le', le),))} {n}" for le, n in hist.cumulative()]
+    lines.append(f"{name}_sum{_labels(labels)} {hist.sum!r}")
+    lines.append(f"{name}_count{_labels(labels)} {hist.count}")
+    return lines
+
+
+def _family(lines: list[str], name: str, kind: str, help_text: str) -> None:
+    lines.append(f"# HELP {name} {help_text}")
+    lines.append(f"# TYPE {name} {kind}")
+
+
+def _stats_lines(lines: list[str], prefix: str, entries: list[tuple[tuple[tuple[str, str], ...], StepStats]]) -> None:
+    name = f"{prefix}_turn_duration_seconds"
+    _family(lines, name, "histogram", "Wall time of World.step turns.")
+    for labels, stats in entries:
+        lines.extend(_histogram_lines(name, stats.turn, labels))
+
+    name = f"{prefix}_phase_duration_seconds"
+    _family(lines, name, "histogram", "Per-turn time spent in each World.step phase.")
+    for labels, stats in entries:
+        for phase in PHASES:
+            lines.extend(_histogram_lines(name, stats.phases[phase], labels + (("phase", phase),)))
+
+    name = f"{prefix}_turn_events_per_second"
+    _family(lines, name, "histogram", "Events logged per second of turn wall time.")
+    for labels, stats in entries:
+        lines.extend(_histogram_lines(name, stats.events_per_second, labels))
+
+    name = f"{prefix}_turns_total"
+    _family(lines, name, "counter", "Profiled turns.")
+    for labels, stats in entries:
+        lines.append(f"{name}{_labels(labels)} {stats.turns}")
+
+    name = f"{prefix}_events_total"
+    _family(lines, name, "counter", "Events logged during profiled turns.")
+    for labels, stats in entries:
+        lines.append(f"{name}{_labels(labels)} {stats.events}")
+
+    name = f"{prefix}_actions_total"
+    _family(lines, name, "counter", "Resolved actions by kind and outcome.")
+    for labels, stats in entries:
+        for (kind, outcome), n in sorted(stats.actions.items()):
+            lines.append(f"{name}{_labels(labels + (('kind', kind), ('outcome', outcome)))} {n}")
+
+
+def render_prometheus(simulations: Mapping[str, StepStats | None], process: StepStats = PROCESS_STATS) -> str:
+    """Prometheus text format for the process totals and each simulation.
+
+    ``simulations`` maps simulation id to its world's stats, or None for a
+    world running without a profiler; those still count as live.
+    """
+    lines: list[str] = []
+    _family(lines, "cheaters_live_simulations", "gauge", "Simulations held by this process.")
+    lines.append(f"cheaters_live_simulations {len(simulations)}")
+    _stats_lines(lines, "cheaters_process", [((), process)])
+    entries = [((("simulation", sim_id),), stats) for sim_id, stats in simulations.items() if stats is not None]
+    _stats_lines(lines, "cheaters_simulation", entries)
+    return "\n".join(lines) + "\n"
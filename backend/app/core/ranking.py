@@ -0,0 +1,47 @@
+"""
+Token balance ranking for The Cheater's Dilemma.
+Keeps alive agents ordered by (-balance, agent_id) so rank lookups are a
+binary search instead of a sort of every alive agent.
+"""
+
+from __future__ import annotations
+
+from bisect import bisect_left, insort
+from typing import Iterable
+
+
+class RankIndex:
+    """Sorted ``(-balance, agent_id)`` keys of the ranked agents.
+
+    Rank 1 is the richest agent, ties going to the lower id, which is the
+    order ``sorted(alive, key=lambda aid: (-balances[aid], aid))`` gives.
+    ``on_balance_change`` is a TrackedBalances listener; agents are dropped
+    with ``remove`` when they leave the game.
+    """
+
+    def __init__(self, token_balances: dict[int, int], agent_ids: Iterable[int]) -> None:
+        self._balance: dict[int, int] = {aid: token_balances[aid] for aid in agent_ids}
+        self._order: list[tuple[int, int]] = sorted((-bal, aid) for aid, bal in self._balance.items())
+
+    def __len__(self) -> int:
+        return len(self._order)
+
+    def rank(self, agent_id: int) -> int:
+        return bisect_left(self._order, (-self._balance[agent_id], agent_id)) + 1
+
+    def ranks(self) -> dict[int, int]:
+        return {aid: rank for rank, (_, aid) in enumerate(self._order, start=1)}
+
+    def on_balance_change(self, agent_id: int, old: int, new: int) -> None:
+        if agent_id not in self._balance or old == new:
+            return
+        old_key = (-self._balance[agent_id], agent_id)
+        del self._order[bisect_left(self._order, old_key)]
+        self._balance[agent_id] = new
+        insort(self._order, (-new, agent_id))
+
+    def remove(self, agent_id: int) -> None:
+        balance = self._balance.pop(agent_id, None)
+        if balance is None:
+            return
+        del self._order[bisect_left(self._order, (-balance, agent_id))]
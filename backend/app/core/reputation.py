@@ -1,19 +1,121 @@
 from __future__ import annotations
 
+from array import array
 from dataclasses import dataclass, field
+from typing import Iterable, Iterator
+
+
+class ReputationColumn:
+    """Per-agent float score stored in an array indexed by agent id.
+
+    Each entry remembers the turn it was last written. With a non-zero
+    ``rate`` the score relaxes towards ``baseline`` by that fraction per turn,
+    applied lazily: a read returns the value decayed to the current turn, and a
+    write stores a fresh value stamped with the current turn. Reads never
+    modify the stored value, so observing the book cannot change a run. With
+    ``rate == 0`` stored values are returned untouched.
+    """
+
+    __slots__ = ("baseline", "rate", "now", "_keep", "_values", "_stamps", "_present")
+
+    def __init__(self, baseline: float, rate: float = 0.0) -> None:
+        if not 0.0 <= rate < 1.0:
+            raise ValueError("decay rate must be in [0, 1)")
+        self.baseline = baseline
+        self.rate = rate
+        self.now = 0
+        self._keep = 1.0 - rate
+        self._values = array("d")
+        self._stamps = array("q")
+        self._present = bytearray()
+
+    def _grow(self, agent_id: int) -> None:
+        extra = agent_id + 1 - len(self._present)
+        if extra > 0:
+            self._values.extend([self.baseline] * extra)
+            self._stamps.extend([0] * extra)
+            self._present.extend(bytes(extra))
+
+    def __contains__(self, agent_id: object) -> bool:
+        return isinstance(agent_id, int) and 0 <= agent_id < len(self._present) and bool(self._present[agent_id])
+
+    def __getitem__(self, agent_id: int) -> float:
+        if agent_id not in self:
+            raise KeyError(agent_id)
+        value = self._values[agent_id]
+        if self.rate:
+            elapsed = self.now - self._stamps[agent_id]
+            if elapsed > 0:
+                value = self.baseline + (value - self.baseline) * self._keep ** elapsed
+        return value
+
+    def __setitem__(self, agent_id: int, value: float) -> None:
+        if agent_id < 0:
+            raise KeyError(agent_id)
+        self._grow(agent_id)
+        self._values[agent_id] = value
+        self._stamps[agent_id] = self.now
+        self._present[agent_id] = 1
+
+    def get(self, agent_id: int, default: float | None = None) -> float | None:
+        return self[agent_id] if agent_id in self else default
+
+    def fork(self) -> ReputationColumn:
+        forked = ReputationColumn(self.baseline, self.rate)
+        forked.now = self.now
+        forked._values = array("d", self._values)
+        forked._stamps = array("q", self._stamps)
+        forked._present = bytearray(self._present)
+        return forked
+
+    def __iter__(self) -> Iterator[int]:
+        return (aid for aid, flag in enumerate(self._present) if flag)
+
+    def __len__(self) -> int:
+        return sum(self._present)
+
+    def keys(self) -> Iterator[int]:
+        return iter(self)
+
+    def items(self) -> Iterator[tuple[int, float]]:
+        return ((aid, self[aid]) for aid in self)
+
+    def view(self, agent_ids: Iterable[int]) -> dict[int, float]:
+        """Current values for ``agent_ids`` as a plain dict."""
+        if not self.rate:
+            values = self._values
+            return {aid: values[aid] for aid in agent_ids}
+        return {aid: self[aid] for aid in agent_ids}
 
 
 @dataclass
 class ReputationBook:
-    trust: dict[int, float] = field(default_factory=dict)
-    aggression: dict[int, float] = field(default_factory=dict)
+    decay: float = 0.0
+    trust: ReputationColumn = field(init=False)
+    aggression: ReputationColumn = field(init=False)
     last_harm_from: dict[int, int] = field(default_factory=dict)
 
+    def __post_init__(self) -> None:
+        # Trust relaxes back to neutral and aggression back to zero over time.
+        self.trust = ReputationColumn(baseline=0.5, rate=self.decay)
+        self.aggression = ReputationColumn(baseline=0.0, rate=self.decay)
+
     def bootstrap(self, agent_ids: list[int]) -> None:
         for aid in agent_ids:
             self.trust[aid] = 0.5
             self.aggression[aid] = 0.0
 
+    def fork(self) -> ReputationBook:
+        forked = ReputationBook(decay=self.decay, last_harm_from=dict(self.last_harm_from))
+        forked.trust = self.trust.fork()
+        forked.aggression = self.aggression.fork()
+        return forked
+
+    def advance(self, turn: int) -> None:
+        """Move the decay clock to ``turn``; later reads and writes use it."""
+        self.trust.now = turn
+        self.aggression.now = turn
+
     def record_work(self, actor: int) -> None:
         self.trust[actor] = min(1.0, self.trust[actor] + 0.01)
 
@@ -30,6 +132,28 @@ class ReputationBook:
         if not success:
             self.trust[target] = min(1.0, self.trust[target] + 0.02)
 
+    def apply_events(self, events: Iterable[tuple[str, int, int | None, bool]]) -> int:
+        """Apply ``(kind, actor, target, success)`` events in order.
+
+        ``kind`` is ``"work"``, ``"steal"`` or ``"attack"``. The result is the
+        same as calling the matching ``record_*`` method for each event; this
+        entry point lets batch engines hand over a whole turn at once.
+        Returns the number of events applied.
+        """
+        handlers = {
+            "work": lambda actor, target, success: self.record_work(actor),
+            "steal": self.record_steal,
+            "attack": self.record_attack,
+        }
+        applied = 0
+        for kind, actor, target, success in events:
+            handler = handlers.get(kind)
+            if handler is None:
+                raise ValueError(f"unknown_reputation_event:{kind}")
+            handler(actor, target, success)
+            applied += 1
+        return applied
+
     def governance_signal(self, proposer: int) -> float:
         # Lower trust and higher aggression reduce support for governance changes.
         return self.trust[proposer] - self.aggression[proposer] * 0.4
@@ -1,10 +1,12 @@
 """
 Deterministic Random Number Generator for The Cheater's Dilemma.
-Ensures reproducible simulations.
+Ensures reproducible simulations, either from one shared generator or from
+independent counter-based streams.
 """
 
 from __future__ import annotations
 import random
+import zlib
 from typing import Optional
 
 
@@ -65,4 +67,85 @@ def reset_rng() -> None:
     """Reset the global RNG instance."""
     global _rng_instance
     if _rng_instance:
-        _rng_instance.reset()
\ No newline at end of file
+        _rng_instance.reset()
+
+_MASK64 = (1 << 64) - 1
+_GAMMA = 0x9E3779B97F4A7C15
+
+RNG_MODES = ("legacy", "streams")
+
+
+def _scramble64(z: int) -> int:
+    """SplitMix64 output function: a bijective 64-bit avalanche mix."""
+    z = ((z ^ (z >> 30)) * 0xBF58476D1CE4E5B9) & _MASK64
+    z = ((z ^ (z >> 27)) * 0x94D049BB133111EB) & _MASK64
+    return z ^ (z >> 31)
+
+
+def stream_key(seed: int, *parts: int | str) -> int:
+    """Fold a seed and any ints/strings into one 64-bit stream key."""
+    key = _scramble64((seed + _GAMMA) & _MASK64)
+    for part in parts:
+        if isinstance(part, str):
+            part = zlib.crc32(part.encode("utf-8"))
+        key = _scramble64(((key ^ (part & _MASK64)) + _GAMMA) & _MASK64)
+    return key
+
+
+class CounterRNG(random.Random):
+    """``random.Random`` whose n-th 64-bit word is a pure function of (key, n).
+
+    Nothing is carried from one draw to the next except the counter, so a
+    stream's values never depend on draws made from any other stream. All of
+    ``Random``'s helpers (randint, choice, shuffle, ...) work on top of it.
+    """
+
+    def __init__(self, key: int = 0) -> None:
+        self._key = key & _MASK64
+        self._counter = 0
+        super().__init__(key)
+
+    def seed(self, a=None, version: int = 2) -> None:
+        """Restart the stream, re-keying it if ``a`` is an int."""
+        if isinstance(a, int):
+            self._key = a & _MASK64
+        self._counter = 0
+        self.gauss_next = None
+
+    def _next64(self) -> int:
+        self._counter += 1
+        return _scramble64((self._key + self._counter * _GAMMA) & _MASK64)
+
+    def random(self) -> float:
+        return (self._next64() >> 11) * (1.0 / (1 << 53))
+
+    def getrandbits(self, k: int) -> int:
+        if k < 0:
+            raise ValueError("number of bits must be non-negative")
+        value, bits = 0, 0
+        while bits < k:
+            value = (value << 64) | self._next64()
+            bits += 64
+        return value >> (bits - k)
+
+    def getstate(self) -> tuple[int, int, float | None]:
+        return (self._key, self._counter, self.gauss_next)
+
+    def setstate(self, state: tuple[int, int, float | None]) -> None:
+        self._key, self._counter, self.gauss_next = state
+
+
+class RngStreams:
+    """Independent counter-based streams keyed by (seed, turn, agent, purpose).
+
+    Purposes used by the engine are ``"init"`` (turn 0, initial endowments),
+    ``"decide"`` (an agent's decision) and ``"resolve"`` (resolving that
+    agent's action). Asking for the same key twice gives the same stream from
+    its start, whatever else was drawn in between or in which order.
+    """
+
+    def __init__(self, seed: int) -> None:
+        self.seed = seed
+
+    def stream(self, turn: int, agent_id: int, purpose: str) -> CounterRNG:
+        return CounterRNG(stream_key(self.seed, turn, agent_id, purpose))
@@ -1,68 +1,468 @@
 from __future__ import annotations
 
+import json
+import zlib
+from bisect import bisect_right
+from collections.abc import Mapping, MutableMapping
 from dataclasses import dataclass, field
-from typing import Any
+from pathlib import Path
+from typing import Any, Callable, Iterator, TypeVar
 
 from ..domain.actions import Action, ActionType
+from .sharing import PrefixList
+
+
+_MISSING = object()
+RULES_SPILL_NAME = "rules.jsonl"
+T = TypeVar("T")
+
+
+def _read_only(self, *args, **kwargs):
+    raise TypeError("base rules are read-only; mutate the world's RuleSet instead")
+
+
+class FrozenDict(dict):
+    """dict that refuses mutation, so nested base rule values stay shared safely."""
+
+    __setitem__ = __delitem__ = clear = pop = popitem = setdefault = update = __ior__ = _read_only
+
+    def __reduce__(self):
+        return FrozenDict, (dict(self),)
+
+
+class FrozenList(list):
+    """list that refuses mutation; compares and serializes like the list it wraps."""
+
+    __setitem__ = __delitem__ = __iadd__ = __imul__ = _read_only
+    append = extend = insert = pop = remove = clear = sort = reverse = _read_only
+
+    def __reduce__(self):
+        return FrozenList, (list(self),)
+
+
+def freeze(value: Any) -> Any:
+    if isinstance(value, Mapping):
+        return FrozenDict({key: freeze(item) for key, item in value.items()})
+    if isinstance(value, (list, tuple)):
+        return FrozenList(freeze(item) for item in value)
+    return value
+
+
+class FrozenRules(Mapping):
+    """Immutable base rules shared by every world built from the same config.
+
+    Holds the deep-frozen values, their PersistentMap and a cache of objects
+    derived from them (compiled validators, resolver tables), so worlds that
+    have not changed a rule share all of it.
+    """
+
+    __slots__ = ("_values", "versioned", "_derived")
+
+    def __init__(self, values: Mapping[str, Any]) -> None:
+        self._values = {str(key): freeze(value) for key, value in values.items()}
+        self.versioned = PersistentMap.from_dict(self._values)
+        self._derived: dict[Any, Any] = {}
+
+    def __getitem__(self, key: str) -> Any:
+        return self._values[key]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._values)
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def derived(self, key: Any, factory: Callable[[], T]) -> T:
+        value = self._derived.get(key)
+        if value is None:
+            value = self._derived.setdefault(key, factory())
+        return value
+
+
+class RuleOverlay(MutableMapping):
+    """Copy-on-write rules of one world: writes land in ``local``, reads fall back to ``base``."""
+
+    __slots__ = ("base", "local")
+
+    def __init__(self, base: FrozenRules, local: dict[str, Any] | None = None) -> None:
+        self.base = base
+        self.local: dict[str, Any] = local if local is not None else {}
+
+    def __getitem__(self, key: str) -> Any:
+        local = self.local
+        if key in local:
+            return local[key]
+        return self.base[key]
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        self.local[key] = value
+
+    def __delitem__(self, key: str) -> None:
+        raise TypeError("rule keys cannot be removed")
+
+    def __iter__(self) -> Iterator[str]:
+        yield from self.base
+        for key in self.local:
+            if key not in self.base:
+                yield key
+
+    def __len__(self) -> int:
+        return len(self.base) + sum(1 for key in self.local if key not in self.base)
+
+    def __repr__(self) -> str:
+        return f"RuleOverlay({dict(self)!r})"
+
+    def copy(self) -> RuleOverlay:
+        return RuleOverlay(self.base, dict(self.local))
+
+
+class PersistentMap:
+    """Immutable string-keyed map whose versions share unchanged buckets.
+
+    Keys are spread over a fixed number of buckets by a stable hash; ``set``
+    copies the root and the one bucket it touches, so each rules version
+    costs a handful of references instead of a full dict copy, and ``diff``
+    skips every bucket two versions still share.
+    """
+
+    __slots__ = ("_buckets",)
+    WIDTH = 16
+
+    def __init__(self, buckets: tuple[tuple[tuple[str, Any], ...], ...] | None = None) -> None:
+        self._buckets = buckets if buckets is not None else ((),) * self.WIDTH
+
+    @classmethod
+    def from_dict(cls, values: dict[str, Any]) -> PersistentMap:
+        pmap = cls()
+        for key, value in values.items():
+            pmap = pmap.set(key, value)
+        return pmap
+
+    @classmethod
+    def _slot(cls, key: str) -> int:
+        return zlib.crc32(str(key).encode("utf-8")) % cls.WIDTH
+
+    def get(self, key: str, default: Any = None) -> Any:
+        for k, v in self._buckets[self._slot(key)]:
+            if k == key:
+                return v
+        return default
+
+    def set(self, key: str, value: Any) -> PersistentMap:
+        slot = self._slot(key)
+        bucket = tuple((k, v) for k, v in self._buckets[slot] if k != key) + ((key, value),)
+        return PersistentMap(self._buckets[:slot] + (bucket,) + self._buckets[slot + 1:])
+
+    def items(self) -> Iterator[tuple[str, Any]]:
+        for bucket in self._buckets:
+            yield from bucket
+
+    def to_dict(self) -> dict[str, Any]:
+        return dict(self.items())
+
+    def diff(self, other: PersistentMap) -> dict[str, dict[str, Any]]:
+        changes: dict[str, dict[str, Any]] = {}
+        for mine, theirs in zip(self._buckets, other._buckets):
+            if mine is theirs:
+                continue
+            old = dict(mine)
+            new = dict(theirs)
+            for key in old.keys() | new.keys():
+                before = old.get(key, _MISSING)
+                after = new.get(key, _MISSING)
+                if before is not after and before != after:
+                    changes[key] = {
+                        "old": None if before is _MISSING else before,
+                        "new": None if after is _MISSING else after,
+                    }
+        return dict(sorted(changes.items()))
+
+
+@dataclass(frozen=True)
+class RuleParams:
+    """Typed view of the rule values the validator needs, cast once per version."""
+
+    allow_steal: bool
+    allow_attack: bool
+    allow_proposals: bool
+    allow_votes: bool
+    steal_min_token_balance: int
+    attack_cost: int
+    mutable_keys: frozenset[str]
+
+    @classmethod
+    def from_values(cls, values: Mapping[str, Any]) -> RuleParams:
+        return cls(
+            allow_steal=bool(values.get("allow_steal", True)),
+            allow_attack=bool(values.get("allow_attack", True)),
+            allow_proposals=bool(values.get("allow_proposals", True)),
+            allow_votes=bool(values.get("allow_votes", True)),
+            steal_min_token_balance=int(values.get("steal_min_token_balance", 0)),
+            attack_cost=int(values.get("attack_cost", 0)),
+            mutable_keys=frozenset(values.get("mutable_keys", [])),
+        )
+
+
+class CompiledValidator:
+    """Action validator specialised to one rules version.
+
+    Built from a RuleSet's values whenever its version changes; each action
+    kind maps straight to a check that only reads the precomputed params.
+    """
+
+    VOTES = frozenset({"yes", "no"})
+
+    def __init__(self, values: Mapping[str, Any], version: int) -> None:
+        self.version = version
+        self.params = RuleParams.from_values(values)
+        self._dispatch = {
+            ActionType.WORK: self._work,
+            ActionType.DO_NOTHING: self._do_nothing,
+            ActionType.STEAL: self._steal,
+            ActionType.ATTACK: self._attack,
+            ActionType.PROPOSE_RULE: self._propose,
+            ActionType.VOTE_RULE: self._vote,
+            ActionType.FORM_ALLIANCE: self._alliance,
+            ActionType.BREAK_ALLIANCE: self._alliance,
+            ActionType.TRADE: self._trade,
+            ActionType.MOVE: self._move,
+            ActionType.REST: self._rest,
+            ActionType.COALITION_ATTACK: self._coalition_attack,
+        }
+
+    def validate(self, action: Action, token_balance: int) -> tuple[bool, str]:
+        check = self._dispatch.get(action.kind)
+        if check is None:
+            return False, "unknown_action"
+        return check(action, token_balance)
+
+    def _work(self, action: Action, token_balance: int) -> tuple[bool, str]:
+        return True, "work_always_allowed"
+
+    def _do_nothing(self, action: Action, token_balance: int) -> tuple[bool, str]:
+        return True, "idle_allowed"
+
+    def _steal(self, action: Action, token_balance: int) -> tuple[bool, str]:
+        if not self.params.allow_steal:
+            return False, "rule_disallows_steal"
+        if action.target is None:
+            return False, "steal_requires_target"
+        if token_balance < self.params.steal_min_token_balance:
+            return False, "insufficient_resources_for_steal"
+        return True, "steal_allowed_by_rules"
+
+    def _attack(self, action: Action, token_balance: int) -> tuple[bool, str]:
+        if not self.params.allow_attack:
+            return False, "rule_disallows_attack"
+        if action.target is None:
+            return False, "attack_requires_target"
+        if token_balance < self.params.attack_cost:
+            return False, "insufficient_resources_for_attack"
+        return True, "attack_allowed_by_rules"
+
+    def _propose(self, action: Action, token_balance: int) -> tuple[bool, str]:
+        if not self.params.allow_proposals:
+            return False, "rule_disallows_proposals"
+        if not action.payload:
+            return False, "proposal_payload_required"
+        if action.payload.get("key") not in self.params.mutable_keys:
+            return False, "proposal_key_not_mutable"
+        return True, "proposal_allowed"
+
+    def _vote(self, action: Action, token_balance: int) -> tuple[bool, str]:
+        if not self.params.allow_votes:
+            return False, "rule_disallows_voting"
+        if action.payload.get("vote") not in self.VOTES:
+            return False, "vote_must_be_yes_or_no"
+        return True, "vote_allowed"
+
+    def _alliance(self, action: Action, token_balance: int) -> tuple[bool, str]:
+        if action.target is None:
+            return False, "alliance_requires_target"
+        return True, "alliance_action_allowed"
+
+    def _trade(self, action: Action, token_balance: int) -> tuple[bool, str]:
+        if action.target is None:
+            return False, "trade_requires_target"
+        offer = action.payload.get("offer", 0)
+        request = action.payload.get("request", 0)
+        if not isinstance(offer, int) or not isinstance(request, int) or offer < 0 or request < 0:
+            return False, "trade_terms_invalid"
+        return True, "trade_allowed"
+
+    def _move(self, action: Action, token_balance: int) -> tuple[bool, str]:
+        return True, "move_allowed"
+
+    def _rest(self, action: Action, token_balance: int) -> tuple[bool, str]:
+        return True, "rest_allowed"
+
+    def _coalition_attack(self, action: Action, token_balance: int) -> tuple[bool, str]:
+        if not self.params.allow_attack:
+            return False, "rule_disallows_attack"
+        if action.target is None:
+            return False, "attack_requires_target"
+        if token_balance < self.params.attack_cost:
+            return False, "insufficient_resources_for_attack"
+        return True, "coalition_attack_allowed_by_rules"
 
 
 @dataclass
 class RuleSet:
-    values: dict[str, Any]
+    values: MutableMapping[str, Any]  # a Mapping or FrozenRules on input; a RuleOverlay after init
     version: int = 1
     history: list[dict[str, Any]] = field(default_factory=list)
+    _versions: list[PersistentMap] = field(default_factory=list, init=False, repr=False, compare=False)
+    _version_turns: list[int] = field(default_factory=list, init=False, repr=False, compare=False)
+    _base_version: int = field(default=1, init=False, repr=False, compare=False)
+    _initial_version: int = field(default=1, init=False, repr=False, compare=False)
+    _window: int | None = field(default=None, init=False, repr=False, compare=False)
+    _spill_path: Path | None = field(default=None, init=False, repr=False, compare=False)
+    _validator: CompiledValidator | None = field(default=None, init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        if not isinstance(self.values, RuleOverlay):
+            base = self.values if isinstance(self.values, FrozenRules) else FrozenRules(self.values)
+            self.values = RuleOverlay(base)
+        # Version v lives at _versions[v - 1]; _version_turns holds the turn it took effect.
+        values = self.values
+        self._versions.append(values.base.versioned if not values.local else PersistentMap.from_dict(values))
+        self._version_turns.append(0)
+        self._base_version = self._initial_version = self.version
+        self._validator = self.derived("validator", lambda: CompiledValidator(self.values, self.version))
+
+    @property
+    def initial_version(self) -> int:
+        return self._initial_version
+
+    def spill_to(self, path: str | Path, window: int) -> None:
+        """Keep about ``window`` recent versions in memory and append older history entries to ``path``.
+
+        Entries are written as sorted JSON lines once ``2 * window`` versions
+        are held, so trimming is amortised; ``full_history`` reads them back.
+        Snapshots of spilled versions are dropped and ``snapshot``/``version_at``
+        raise KeyError for them.
+        """
+        if window < 1:
+            raise ValueError("window must be positive")
+        path = Path(path)
+        if path.exists() and path.stat().st_size:
+            raise ValueError(f"rules spill file already exists: {path}")
+        self._window = window
+        self._spill_path = path
+
+    def full_history(self) -> Iterator[dict[str, Any]]:
+        """Every change since the initial version: spilled entries, then those still in memory."""
+        if self._base_version > self._initial_version and self._spill_path is not None:
+            with self._spill_path.open("r", encoding="utf-8") as f:
+                for line in f:
+                    entry = json.loads(line)
+                    # A fork shares its parent's file, which may run past the fork point.
+                    if entry["version"] > self._base_version:
+                        break
+                    yield entry
+        yield from self.history
+
+    def derived(self, key: Any, factory: Callable[[], T]) -> T:
+        """``factory()`` for the current version, shared with other worlds while no rule has changed."""
+        if self.values.local:
+            return factory()
+        return self.values.base.derived((key, self.version), factory)
+
+    def version_at(self, turn: int) -> int:
+        idx = bisect_right(self._version_turns, turn) - 1
+        if idx < 0 and self._base_version > self._initial_version:
+            raise KeyError(f"rules_version_spilled:turn_{turn}")
+        return self._base_version + max(0, idx)
+
+    def snapshot(self, version: int) -> PersistentMap:
+        idx = version - self._base_version
+        if not 0 <= idx < len(self._versions):
+            raise KeyError(f"unknown_rules_version:{version}")
+        return self._versions[idx]
+
+    def rules_at(self, turn: int) -> dict[str, Any]:
+        return self.snapshot(self.version_at(turn)).to_dict()
+
+    def diff(self, version_a: int, version_b: int) -> dict[str, dict[str, Any]]:
+        return self.snapshot(version_a).diff(self.snapshot(version_b))
 
     def validate_action(self, action: Action, actor_state: dict[str, Any]) -> tuple[bool, str]:
-        if action.kind == ActionType.WORK:
-            return True, "work_always_allowed"
-
-        if action.kind == ActionType.DO_NOTHING:
-            return True, "idle_allowed"
-
-        if action.kind == ActionType.STEAL:
-            if not self.values.get("allow_steal", True):
-                return False, "rule_disallows_steal"
-            if action.target is None:
-                return False, "steal_requires_target"
-            if actor_state["token_balance"] < int(self.values.get("steal_min_token_balance", 0)):
-                return False, "insufficient_resources_for_steal"
-            return True, "steal_allowed_by_rules"
-
-        if action.kind == ActionType.ATTACK:
-            if not self.values.get("allow_attack", True):
-                return False, "rule_disallows_attack"
-            if action.target is None:
-                return False, "attack_requires_target"
-            cost = int(self.values.get("attack_cost", 0))
-            if actor_state["token_balance"] < cost:
-                return False, "insufficient_resources_for_attack"
-            return True, "attack_allowed_by_rules"
-
-        if action.kind == ActionType.PROPOSE_RULE:
-            if not self.values.get("allow_proposals", True):
-                return False, "rule_disallows_proposals"
-            if not action.payload:
-                return False, "proposal_payload_required"
-            key = action.payload.get("key")
-            if key not in set(self.values.get("mutable_keys", [])):
-                return False, "proposal_key_not_mutable"
-            return True, "proposal_allowed"
-
-        if action.kind == ActionType.VOTE_RULE:
-            if not self.values.get("allow_votes", True):
-                return False, "rule_disallows_voting"
-            vote = action.payload.get("vote")
-            if vote not in {"yes", "no"}:
-                return False, "vote_must_be_yes_or_no"
-            return True, "vote_allowed"
-
-        return False, "unknown_action"
+        validator = self._validator
+        if validator is None or validator.version != self.version:
+            validator = self._validator = self.derived("validator", lambda: CompiledValidator(self.values, self.version))
+        return validator.validate(action, actor_state["token_balance"])
+
+    def fork(self) -> RuleSet:
+        """An independent RuleSet at this version that shares the versions and history so far."""
+        forked = RuleSet.__new__(RuleSet)
+        forked.values = self.values.copy()
+        forked.version = self.version
+        forked.history = PrefixList(self.history)
+        forked._versions = PrefixList(self._versions)
+        forked._version_turns = PrefixList(self._version_turns)
+        forked._base_version = self._base_version
+        forked._initial_version = self._initial_version
+        # Forks keep their own versions in memory; they only read the parent's spill file.
+        forked._window = None
+        forked._spill_path = self._spill_path
+        forked._validator = self._validator
+        return forked
+
+    def _add_version(self, versioned: PersistentMap, turn: int) -> None:
+        self._versions.append(versioned)
+        self._version_turns.append(turn)
+        if self._window is not None and len(self._versions) >= 2 * self._window:
+            self._spill(len(self._versions) - self._window)
+
+    def _spill(self, count: int) -> None:
+        """Drop the oldest ``count`` versions, appending their history entries to the spill file."""
+        base = self._base_version + count
+        # Entries are in version order; keep those that built the versions still held.
+        cut = bisect_right(self.history, base, key=lambda entry: entry["version"])
+        with self._spill_path.open("a", encoding="utf-8") as f:
+            for entry in self.history[:cut]:
+                f.write(json.dumps(entry, sort_keys=True, separators=(",", ":")) + "\n")
+        self.history = list(self.history[cut:])
+        self._versions = list(self._versions[count:])
+        self._version_turns = list(self._version_turns[count:])
+        self._base_version = base
+
+    def override(self, changes: Mapping[str, Any], turn: int, by_agent: int = -1) -> None:
+        """Set rule values outside governance, as one new version (what-if forks).
+
+        Any existing key may change, mutable or not, but the merged rules must
+        pass the same checks as rules.yaml; nothing changes if they do not.
+        """
+        from ..services.config_service import validate_rules  # services import the domain
+
+        unknown = sorted(set(changes) - set(self.values))
+        if unknown:
+            raise ValueError(f"unknown rule keys: {unknown}")
+        checked = validate_rules({**self.values, **changes})
+        self.version += 1
+        versioned = self._versions[-1]
+        for key in changes:
+            value = checked[key]
+            old_value = self.values.get(key)
+            self.values[key] = value
+            versioned = versioned.set(key, value)
+            self.history.append(
+                {
+                    "turn": turn,
+                    "by": by_agent,
+                    "version": self.version,
+                    "key": key,
+                    "value": value,
+                    "old_value": old_value,
+                }
+            )
+        self._add_version(versioned, turn)
+        self._validator = CompiledValidator(self.values, self.version)
 
     def apply_mutation(self, proposal: dict[str, Any], by_agent: int, turn: int) -> tuple[bool, str]:
         key = proposal.get("key")
         value = proposal.get("value")
-        mutable_keys = set(self.values.get("mutable_keys", []))
-        if key not in mutable_keys:
+        if key not in self._validator.params.mutable_keys:
             return False, "key_not_mutable"
 
         min_max = self.values.get("key_ranges", {}).get(key)
@@ -70,8 +470,10 @@ class RuleSet:
             if value < min_max.get("min", value) or value > min_max.get("max", value):
                 return False, "value_out_of_range"
 
+        old_value = self.values.get(key)
         self.values[key] = value
         self.version += 1
+        self._validator = CompiledValidator(self.values, self.version)
         self.history.append(
             {
                 "turn": turn,
@@ -79,6 +481,8 @@ class RuleSet:
                 "version": self.version,
                 "key": key,
                 "value": value,
+                "old_value": old_value,
             }
         )
+        self._add_version(self._versions[-1].set(key, value), turn)
         return True, "rule_updated"
@@ -0,0 +1,225 @@
+"""
+Disk-spilled event log for long runs of The Cheater's Dilemma.
+Keeps a recent window of events in memory and seals older events into
+JSON-lines segment files that are read back through mmap. The log digest is
+kept incrementally and equals what EventLogger.digest() would return for the
+same events.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import mmap
+from array import array
+from bisect import bisect_right
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Iterator, Sequence
+
+from .logger import VERBOSITY_LEVELS, EventLogger, TurnFold, encode_event
+
+
+SEGMENT_GLOB = "events-*.jsonl"
+MANIFEST_NAME = "manifest.json"
+
+
+@dataclass(frozen=True)
+class EventSegment:
+    name: str
+    start: int  # global index of the segment's first event
+    count: int
+    first_turn: int
+    last_turn: int
+
+
+def _lines(path: Path) -> Iterator[bytes]:
+    """Yield each line of a segment file (without the newline) via mmap."""
+    with path.open("rb") as f:
+        if f.seek(0, 2) == 0:
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            pos = 0
+            while True:
+                end = mm.find(b"\n", pos)
+                if end == -1:
+                    return
+                yield mm[pos:end]
+                pos = end + 1
+
+
+class SegmentedEvents(Sequence):
+    """Read-only sequence over sealed segments followed by the in-memory tail.
+
+    Iteration streams segment files in order; indexing opens the segment that
+    holds the event and keeps that segment's line offsets for the next lookup.
+    """
+
+    def __init__(self, directory: Path, segments: list[EventSegment], tail: list[dict[str, Any]]) -> None:
+        self.directory = directory
+        self.segments = segments
+        self.tail = tail
+        self._starts: list[int] = []
+        self._offsets: tuple[str, array] | None = None
+
+    @property
+    def sealed_count(self) -> int:
+        last = self.segments[-1] if self.segments else None
+        return last.start + last.count if last else 0
+
+    def __len__(self) -> int:
+        return self.sealed_count + len(self.tail)
+
+    def __iter__(self) -> Iterator[dict[str, Any]]:
+        for segment in list(self.segments):
+            for line in _lines(self.directory / segment.name):
+                yield json.loads(line)
+        yield from list(self.tail)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        size = len(self)
+        if index < 0:
+            index += size
+        if not 0 <= index < size:
+            raise IndexError("event index out of range")
+        sealed = self.sealed_count
+        if index >= sealed:
+            return self.tail[index - sealed]
+        if len(self._starts) != len(self.segments):
+            self._starts = [segment.start for segment in self.segments]
+        segment = self.segments[bisect_right(self._starts, index) - 1]
+        return self._read(segment, index - segment.start)
+
+    def _read(self, segment: EventSegment, row: int) -> dict[str, Any]:
+        with (self.directory / segment.name).open("rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            if self._offsets is None or self._offsets[0] != segment.name:
+                offsets = array("q", [0])
+                pos = mm.find(b"\n")
+                while pos != -1:
+                    offsets.append(pos + 1)
+                    pos = mm.find(b"\n", pos + 1)
+                self._offsets = (segment.name, offsets)
+            offsets = self._offsets[1]
+            return json.loads(mm[offsets[row]:offsets[row + 1] - 1])
+
+    def since_turn(self, turn: int) -> Iterator[dict[str, Any]]:
+        """Events with ``event["turn"] >= turn``, skipping older segments unread."""
+        for segment in list(self.segments):
+            if segment.last_turn < turn:
+                continue
+            for line in _lines(self.directory / segment.name):
+                event = json.loads(line)
+                if event["turn"] >= turn:
+                    yield event
+        for event in list(self.tail):
+            if event["turn"] >= turn:
+                yield event
+
+
+class SegmentedEventLogger(EventLogger):
+    """EventLogger that keeps ``window`` recent events and spills the rest.
+
+    Once ``window + segment_events`` events are held, the oldest
+    ``segment_events`` are written to ``events-NNNNNN.jsonl`` in
+    ``directory`` and hashed into the running digest. ``events`` is a
+    ``SegmentedEvents`` view, so ``len`` and indexing work over the whole log.
+    ``flush`` seals the tail as well and writes ``manifest.json``.
+    """
+
+    def __init__(
+        self,
+        directory: str | Path,
+        window: int = 10_000,
+        segment_events: int = 10_000,
+        verbosity: str = "full",
+    ) -> None:
+        if window < 0 or segment_events < 1:
+            raise ValueError("window must be >= 0 and segment_events >= 1")
+        if verbosity not in VERBOSITY_LEVELS:
+            raise ValueError(f"verbosity must be one of {VERBOSITY_LEVELS}")
+        self.verbosity = verbosity
+        self._fold = TurnFold()
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        if any(self.directory.glob(SEGMENT_GLOB)):
+            raise ValueError(f"spill directory already holds event segments: {self.directory}")
+        self.window = window
+        self.segment_events = segment_events
+        self._segments: list[EventSegment] = []
+        self._tail: list[dict[str, Any]] = []
+        self._hasher = hashlib.sha256(b"[")
+        self._view = SegmentedEvents(self.directory, self._segments, self._tail)
+
+    @property
+    def events(self) -> SegmentedEvents:
+        return self._view
+
+    def _append(self, entry: dict[str, Any]) -> None:
+        self._tail.append(entry)
+        if len(self._tail) >= self.window + self.segment_events:
+            self._seal(self.segment_events)
+
+    def _seal(self, count: int) -> None:
+        chunk = self._tail[:count]
+        lines = [encode_event(entry) for entry in chunk]
+        name = f"events-{len(self._segments):06d}.jsonl"
+        with (self.directory / name).open("wb") as f:
+            f.write(b"\n".join(lines) + b"\n")
+        start = self._view.sealed_count
+        for i, line in enumerate(lines):
+            if start or i:
+                self._hasher.update(b",")
+            self._hasher.update(line)
+        self._segments.append(EventSegment(name, start, count, chunk[0]["turn"], chunk[-1]["turn"]))
+        del self._tail[:count]
+
+    def digest(self) -> str:
+        hasher = self._hasher.copy()
+        first = self._view.sealed_count == 0
+        for entry in self._tail:
+            if not first:
+                hasher.update(b",")
+            first = False
+            hasher.update(encode_event(entry))
+        hasher.update(b"]")
+        return hasher.hexdigest()
+
+    def flush(self) -> None:
+        if self._tail:
+            self._seal(len(self._tail))
+        manifest = {
+            "events": len(self._view),
+            "log_digest": self.digest(),
+            "segments": [asdict(segment) for segment in self._segments],
+        }
+        (self.directory / MANIFEST_NAME).write_text(json.dumps(manifest, indent=1) + "\n", encoding="utf-8")
+
+
+def open_segments(directory: str | Path) -> tuple[SegmentedEvents, dict[str, Any]]:
+    """Read-only view of a flushed spill directory, plus its manifest."""
+    directory = Path(directory)
+    manifest = json.loads((directory / MANIFEST_NAME).read_text(encoding="utf-8"))
+    segments = [EventSegment(**segment) for segment in manifest["segments"]]
+    return SegmentedEvents(directory, segments, []), manifest
+
+
+def segment_lines(directory: str | Path) -> Iterator[bytes]:
+    """Every event line of a flushed spill directory, undecoded, one segment file at a time."""
+    _, manifest = open_segments(directory)
+    for segment in manifest["segments"]:
+        yield from _lines(Path(directory) / segment["name"])
+
+
+def digest_segments(directory: str | Path) -> str:
+    """Recompute the log digest from the segment files' bytes alone."""
+    hasher = hashlib.sha256(b"[")
+    first = True
+    for line in segment_lines(directory):
+        if not first:
+            hasher.update(b",")
+        first = False
+        hasher.update(line)
+    hasher.update(b"]")
+    return hasher.hexdigest()
@@ -0,0 +1,63 @@
+"""
+Append-only containers that a world shares with its forks.
+A fork sees its parent's entries up to the fork point and appends its own
+after them, without copying the prefix; the parent keeps appending to its
+own container and the fork never sees those entries.
+"""
+
+from __future__ import annotations
+
+from itertools import islice
+from typing import Any, Iterable, Iterator, Sequence
+
+
+class PrefixList(Sequence):
+    """The first ``length`` items of a shared sequence followed by a private list.
+
+    The shared sequence must only ever be appended to, which holds for event
+    logs, rule histories and alliance archives.
+    """
+
+    __slots__ = ("_prefix", "_length", "_own")
+
+    def __init__(self, prefix: Sequence[Any], length: int | None = None) -> None:
+        self._prefix = prefix
+        self._length = len(prefix) if length is None else length
+        self._own: list[Any] = []
+
+    def __len__(self) -> int:
+        return self._length + len(self._own)
+
+    def __iter__(self) -> Iterator[Any]:
+        yield from islice(self._prefix, self._length)
+        yield from self._own
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        size = len(self)
+        if index < 0:
+            index += size
+        if not 0 <= index < size:
+            raise IndexError("index out of range")
+        if index < self._length:
+            return self._prefix[index]
+        return self._own[index - self._length]
+
+    def __reduce__(self):
+        # Pickle only the visible entries, not the rest of the shared prefix.
+        return (_materialize, (list(self),))
+
+    def __repr__(self) -> str:
+        return f"PrefixList(shared={self._length}, own={len(self._own)})"
+
+    def append(self, item: Any) -> None:
+        self._own.append(item)
+
+    def extend(self, items: Iterable[Any]) -> None:
+        self._own.extend(items)
+
+
+
+def _materialize(items: list[Any]) -> PrefixList:
+    return PrefixList(items)
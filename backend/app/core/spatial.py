@@ -0,0 +1,177 @@
+"""
+Spatial index for agent positions in The Cheater's Dilemma.
+A uniform grid hash answers radius and nearest-neighbour queries by looking
+only at the cells around an agent rather than at every agent in the world.
+"""
+
+from __future__ import annotations
+
+import math
+from typing import Iterator
+
+Position = tuple[float, float]
+
+
+def parse_position(value: object) -> Position | None:
+    """Return ``value`` as an (x, y) float pair, or None if it is not one."""
+    if not isinstance(value, (list, tuple)) or len(value) != 2:
+        return None
+    x, y = value
+    if isinstance(x, bool) or isinstance(y, bool):
+        return None
+    if not isinstance(x, (int, float)) or not isinstance(y, (int, float)):
+        return None
+    if not (math.isfinite(x) and math.isfinite(y)):
+        return None
+    return (float(x), float(y))
+
+
+class SpatialHash:
+    """Uniform grid of square cells mapping cell coordinates to agent ids.
+
+    Radius queries visit the cells overlapping the query circle's bounding box;
+    nearest-neighbour queries visit rings of cells around the query cell until
+    the k-th candidate is provably closer than anything further out. When a
+    query would visit more cells than are occupied (very sparse worlds, huge
+    radii) it scans the occupied cells directly instead.
+    Results are ordered deterministically: by id for radius queries and by
+    (distance, id) for nearest-neighbour queries.
+    """
+
+    def __init__(self, cell_size: float = 1.0) -> None:
+        if cell_size <= 0:
+            raise ValueError("cell_size must be positive")
+        self.cell_size = float(cell_size)
+        self.positions: dict[int, Position] = {}
+        self._cell_of: dict[int, tuple[int, int]] = {}
+        self._cells: dict[tuple[int, int], set[int]] = {}
+
+    def __len__(self) -> int:
+        return len(self.positions)
+
+    def fork(self) -> SpatialHash:
+        forked = SpatialHash(self.cell_size)
+        forked.positions = dict(self.positions)
+        forked._cell_of = dict(self._cell_of)
+        forked._cells = {cell: set(members) for cell, members in self._cells.items()}
+        return forked
+
+    def __contains__(self, agent_id: int) -> bool:
+        return agent_id in self.positions
+
+    def _cell(self, pos: Position) -> tuple[int, int]:
+        return (math.floor(pos[0] / self.cell_size), math.floor(pos[1] / self.cell_size))
+
+    def insert(self, agent_id: int, pos: Position) -> None:
+        if agent_id in self.positions:
+            self.move(agent_id, pos)
+            return
+        cell = self._cell(pos)
+        self.positions[agent_id] = pos
+        self._cell_of[agent_id] = cell
+        self._cells.setdefault(cell, set()).add(agent_id)
+
+    def move(self, agent_id: int, pos: Position) -> None:
+        cell = self._cell(pos)
+        old = self._cell_of[agent_id]
+        self.positions[agent_id] = pos
+        if cell == old:
+            return
+        self._discard(agent_id, old)
+        self._cell_of[agent_id] = cell
+        self._cells.setdefault(cell, set()).add(agent_id)
+
+    def remove(self, agent_id: int) -> None:
+        if agent_id not in self.positions:
+            return
+        del self.positions[agent_id]
+        self._discard(agent_id, self._cell_of.pop(agent_id))
+
+    def _discard(self, agent_id: int, cell: tuple[int, int]) -> None:
+        members = self._cells[cell]
+        members.discard(agent_id)
+        if not members:
+            del self._cells[cell]
+
+    def _ring(self, cx: int, cy: int, d: int) -> Iterator[tuple[int, int]]:
+        if d == 0:
+            yield (cx, cy)
+            return
+        for x in range(cx - d, cx + d + 1):
+            yield (x, cy - d)
+            yield (x, cy + d)
+        for y in range(cy - d + 1, cy + d):
+            yield (cx - d, y)
+            yield (cx + d, y)
+
+    def _members(self, cell: tuple[int, int]) -> set[int]:
+        return self._cells.get(cell, ())
+
+    def within(self, pos: Position, radius: float, exclude: int | None = None) -> list[int]:
+        """Ids of agents whose distance to ``pos`` is at most ``radius``."""
+        if radius < 0:
+            return []
+        px, py = pos
+        r2 = radius * radius
+        size = self.cell_size
+        x0, x1 = math.floor((px - radius) / size), math.floor((px + radius) / size)
+        y0, y1 = math.floor((py - radius) / size), math.floor((py + radius) / size)
+        if (x1 - x0 + 1) * (y1 - y0 + 1) > len(self._cells):
+            cells = [c for c in self._cells if x0 <= c[0] <= x1 and y0 <= c[1] <= y1]
+        else:
+            cells = [(x, y) for x in range(x0, x1 + 1) for y in range(y0, y1 + 1)]
+        found = []
+        positions = self.positions
+        for cell in cells:
+            for agent_id in self._members(cell):
+                if agent_id == exclude:
+                    continue
+                x, y = positions[agent_id]
+                if (x - px) * (x - px) + (y - py) * (y - py) <= r2:
+                    found.append(agent_id)
+        found.sort()
+        return found
+
+    def neighbors_within(self, agent_id: int, radius: float) -> list[int]:
+        return self.within(self.positions[agent_id], radius, exclude=agent_id)
+
+    def nearest(self, pos: Position, k: int, exclude: int | None = None) -> list[int]:
+        """Ids of the ``k`` agents closest to ``pos``, nearest first."""
+        if k <= 0:
+            return []
+        px, py = pos
+        cx, cy = self._cell(pos)
+        positions = self.positions
+        available = len(positions) - (1 if exclude in positions else 0)
+        candidates: list[tuple[float, int]] = []
+        scanned = 0
+        d = 0
+        while scanned < available:
+            if 8 * d > len(self._cells):
+                # The remaining rings are mostly empty; finish with one pass.
+                for cell, members in self._cells.items():
+                    if max(abs(cell[0] - cx), abs(cell[1] - cy)) >= d:
+                        for agent_id in members:
+                            if agent_id != exclude:
+                                x, y = positions[agent_id]
+                                candidates.append(((x - px) ** 2 + (y - py) ** 2, agent_id))
+                break
+            for cell in self._ring(cx, cy, d):
+                for agent_id in self._members(cell):
+                    if agent_id == exclude:
+                        continue
+                    x, y = positions[agent_id]
+                    candidates.append(((x - px) ** 2 + (y - py) ** 2, agent_id))
+                    scanned += 1
+            # Anything outside rings 0..d lies farther than d cells away.
+            if len(candidates) >= k:
+                candidates.sort()
+                bound = d * self.cell_size
+                if candidates[k - 1][0] <= bound * bound:
+                    break
+            d += 1
+        candidates.sort()
+        return [agent_id for _, agent_id in candidates[:k]]
+
+    def k_nearest(self, agent_id: int, k: int) -> list[int]:
+        return self.nearest(self.positions[agent_id], k, exclude=agent_id)
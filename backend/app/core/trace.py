@@ -0,0 +1,175 @@
+"""
+Per-turn traces of a running world for determinism checks and replay diffs.
+Each turn is fingerprinted by every agent's state after the turn and the
+events it logged. Digests are chained, so two runs with equal digests at a
+turn agree on every turn up to it and the first divergence can be bisected.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+from dataclasses import dataclass
+from itertools import zip_longest
+from typing import Any, Iterable
+
+from .logger import encode_event
+
+
+EVENT_FIELDS = ("turn", "actor", "action", "target", "outcome", "rule_justification", "details")
+STATE_FIELDS = ("token_balance", "strength", "health", "alive", "position", "trust", "aggression")
+
+
+def turn_state(world: Any) -> dict[str, Any]:
+    """The per-agent state a trace fingerprints, in slot order."""
+    return {
+        "rules_version": world.rule_set.version,
+        "agents": [
+            {
+                "agent_id": aid,
+                "token_balance": world.token_balances[aid],
+                "strength": world.strength[aid],
+                "health": world.health[aid],
+                "alive": aid in world.alive,
+                "position": list(world.positions[aid]),
+                "trust": world.reputation.trust[aid],
+                "aggression": world.reputation.aggression[aid],
+            }
+            for aid in (slot.agent_id for slot in world.agent_slots)
+        ],
+    }
+
+
+def chain_digest(previous: str, events: Iterable[dict[str, Any]], state: dict[str, Any] | None = None) -> str:
+    """Digest of one turn chained onto the digest of the turns before it."""
+    hasher = hashlib.sha256(previous.encode("ascii"))
+    for event in events:
+        hasher.update(encode_event(event))
+    if state is not None:
+        hasher.update(json.dumps(state, sort_keys=True, separators=(",", ":")).encode("utf-8"))
+    return hasher.hexdigest()
+
+
+@dataclass
+class TurnRecord:
+    turn: int
+    digest: str
+    events: list[dict[str, Any]]
+    state: dict[str, Any] | None = None
+
+
+def trace_world(world: Any) -> list[TurnRecord]:
+    """Run ``world`` to completion, recording its state and events after every turn."""
+    records: list[TurnRecord] = []
+    digest = ""
+    events = world.logger.events
+    start = len(events)
+    try:
+        while world.step():
+            end = len(events)
+            logged = [events[i] for i in range(start, end)]
+            state = turn_state(world)
+            digest = chain_digest(digest, logged, state)
+            records.append(TurnRecord(world.turns_completed, digest, logged, state))
+            start = end
+    finally:
+        world.close()
+    return records
+
+
+def first_difference(left: Any, right: Any, path: str = "") -> tuple[str, Any, Any] | None:
+    """Dotted path and both values of the first difference between two JSON-like values."""
+    if isinstance(left, dict) and isinstance(right, dict):
+        for key in sorted(set(left) | set(right), key=str):
+            if key not in left or key not in right:
+                return f"{path}{key}", left.get(key), right.get(key)
+            found = first_difference(left[key], right[key], f"{path}{key}.")
+            if found is not None:
+                return found
+        return None
+    if isinstance(left, list) and isinstance(right, list) and len(left) == len(right):
+        for i, (a, b) in enumerate(zip(left, right)):
+            found = first_difference(a, b, f"{path}{i}.")
+            if found is not None:
+                return found
+        return None
+    return None if left == right else (path.rstrip(".") or "value", left, right)
+
+
+def event_difference(index: int, left: dict[str, Any] | None, right: dict[str, Any] | None) -> dict[str, Any]:
+    """Describe the first differing field of two events at ``index`` within a turn."""
+    event = left if left is not None else right
+    if left is None or right is None:
+        field, values = "missing", [left is not None, right is not None]
+    else:
+        # Compare in event field order so actor/action mismatches win over details.
+        field, a, b = next(
+            (first_difference(left.get(f), right.get(f), f"{f}.") for f in EVENT_FIELDS if left.get(f) != right.get(f)),
+            first_difference(left, right),
+        )
+        values = [a, b]
+    return {
+        "source": "event",
+        "index": index,
+        "actor": event["actor"],
+        "action": event["action"],
+        "field": field,
+        "values": values,
+    }
+
+
+def describe_divergence(left: TurnRecord, right: TurnRecord) -> dict[str, Any]:
+    """The first event, or failing that the first agent state field, that differs in one turn."""
+    report: dict[str, Any] = {"turn": left.turn}
+    for index, (a, b) in enumerate(zip_longest(left.events, right.events)):
+        if a != b:
+            report.update(event_difference(index, a, b))
+            return report
+    if left.state is None or right.state is None:
+        report.update(source="digest", actor=None, action=None, field=None, values=[left.digest, right.digest])
+        return report
+    if left.state["rules_version"] != right.state["rules_version"]:
+        values = [left.state["rules_version"], right.state["rules_version"]]
+        report.update(source="state", actor=None, action=None, field="rules_version", values=values)
+        return report
+    for a, b in zip(left.state["agents"], right.state["agents"]):
+        for field in STATE_FIELDS:
+            if a[field] != b[field]:
+                aid = a["agent_id"]
+                # The agent's last logged action this turn is the likeliest culprit.
+                acted = [e["action"] for e in left.events if e["actor"] == aid]
+                report.update(
+                    source="state",
+                    actor=aid,
+                    action=acted[-1] if acted else None,
+                    field=field,
+                    values=[a[field], b[field]],
+                )
+                return report
+    report.update(source="digest", actor=None, action=None, field=None, values=[left.digest, right.digest])
+    return report
+
+
+def first_divergence(left: list[TurnRecord], right: list[TurnRecord]) -> dict[str, Any] | None:
+    """Bisect two traces on their chained digests and describe the first turn that differs."""
+    shared = min(len(left), len(right))
+    low, high = 0, shared  # the first differing index lies in [low, high]
+    while low < high:
+        mid = (low + high) // 2
+        if left[mid].digest == right[mid].digest:
+            low = mid + 1
+        else:
+            high = mid
+    if low < shared:
+        return describe_divergence(left[low], right[low])
+    if len(left) != len(right):
+        longer = left if len(left) > len(right) else right
+        return {
+            "turn": longer[shared].turn,
+            "source": "length",
+            "actor": None,
+            "action": None,
+            "field": "turns_completed",
+            "values": [len(left), len(right)],
+        }
+    return None
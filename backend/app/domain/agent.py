@@ -1,8 +1,10 @@
 from __future__ import annotations
 
+import copy
 from dataclasses import dataclass
 from random import Random
-from typing import Any
+from itertools import repeat
+from typing import Any, Hashable, Sequence
 
 from .actions import Action
 
@@ -22,10 +24,51 @@ class AgentObservation:
     current_rules: dict[str, Any]
     pending_proposal: dict[str, Any] | None
     last_harm_from: int | None
+    resolver_params: Any = None  # ResolverParams for the current rules version
+    allies: tuple[int, ...] = ()  # Active alliance partners, in formation order
+    coalition: tuple[int, ...] = ()  # Sorted connected alliance component containing self
+    nearby_ids: tuple[int, ...] | None = None  # Agents within interaction radius; None = no limit
 
 
 class Agent:
     name: str = "base"
+    # Strategies that keep no per-instance state may set this so World can hand
+    # a run of consecutive slots of the same class to one decide_batch call.
+    supports_batch: bool = False
 
     def decide(self, obs: AgentObservation, rng: Random) -> Action:
         raise NotImplementedError
+
+    def fork(self) -> Agent:
+        """The brain a forked World gives this slot.
+
+        Strategies that keep no per-instance state (``supports_batch``) are
+        shared with the fork; anything else is deep-copied. Stateful brains can
+        override this (or ``__deepcopy__``) to copy only what they change.
+        """
+        return self if self.supports_batch else copy.deepcopy(self)
+
+    def snapshot_batch_key(self) -> Hashable | None:
+        """Consecutive brains with equal keys share one decide_batch call on a simultaneous snapshot.
+
+        Defaults to the class for ``supports_batch`` strategies and None (never
+        batched) otherwise. A brain whose decide_batch accepts a mixed batch,
+        such as a remote proxy, may return a wider key.
+        """
+        return type(self) if self.supports_batch else None
+
+    def decide_batch(self, observations: Sequence[AgentObservation], rng: Random | Sequence[Random]) -> list[Action]:
+        """Decide for several agents of this class, in the given order.
+
+        Must return what calling ``decide`` on each observation in turn would,
+        consuming ``rng`` in that same order, so a batch is reproducible and
+        draws exactly the numbers the sequential calls would. In RNG stream
+        mode ``rng`` is instead a sequence holding each observation's own
+        generator; ``batch_rngs`` pairs either form with the observations.
+        """
+        return [self.decide(obs, r) for obs, r in zip(observations, batch_rngs(rng))]
+
+
+def batch_rngs(rng: Random | Sequence[Random]) -> Sequence[Random] | repeat:
+    """Per-observation generators for decide_batch: one shared ``rng`` or one each."""
+    return repeat(rng) if isinstance(rng, Random) else rng
@@ -1,18 +1,106 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from collections.abc import Mapping
+from dataclasses import dataclass, field
 from random import Random
+from typing import Any
 
 from ..core.rules import RuleSet
 
 
+class ResolverParams:
+    """Rule values and success/damage tables for one rules version.
+
+    Probabilities and damage depend on the rules and on a strength difference
+    only, so they are tabulated once per version for every difference within
+    ``strength_span`` and looked up by ``diff + strength_span``. Differences
+    outside the table fall back to the same formula. Agents read these tables
+    through their observation, so their estimates match the resolver exactly.
+    """
+
+    def __init__(self, values: Mapping[str, Any], version: int, strength_span: int) -> None:
+        self.version = version
+        self.strength_span = strength_span
+
+        low, high = values.get("work_income", [2, 4])
+        self.work_income = (int(low), int(high))
+        self.steal_amount = int(values.get("steal_amount", 3))
+        self.steal_success_base = float(values.get("steal_success_base", 0.45))
+        self.steal_catch_prob = float(values.get("steal_catch_prob", 0.25))
+        self.steal_catch_penalty = int(values.get("steal_catch_penalty", 2))
+        self.steal_fail_penalty = int(values.get("steal_fail_penalty", 1))
+        self.attack_cost = int(values.get("attack_cost", 5))
+        self.attack_success_base = float(values.get("attack_success_base", 0.12))
+        self.attack_fail_penalty = int(values.get("attack_fail_penalty", 2))
+        self.attack_loot_ratio = float(values.get("attack_loot_ratio", 0.4))
+
+        diffs = range(-strength_span, strength_span + 1)
+        self._steal_success = [self._steal_success_formula(d) for d in diffs]
+        self._attack_success = [self._attack_success_formula(d) for d in diffs]
+        self._attack_damage = [self._attack_damage_formula(d) for d in diffs]
+        self._coalition_success: dict[tuple[int, int], float] = {}
+
+    def _steal_success_formula(self, diff: int) -> float:
+        return min(0.9, max(0.05, self.steal_success_base + diff * 0.03))
+
+    def _attack_success_formula(self, diff: int) -> float:
+        return min(0.75, max(0.01, self.attack_success_base + diff * 0.04))
+
+    @staticmethod
+    def _attack_damage_formula(diff: int) -> int:
+        return max(5, 20 + diff * 2)
+
+    def steal_success(self, diff: int) -> float:
+        idx = diff + self.strength_span
+        if 0 <= idx < len(self._steal_success):
+            return self._steal_success[idx]
+        return self._steal_success_formula(diff)
+
+    def attack_success(self, diff: int) -> float:
+        idx = diff + self.strength_span
+        if 0 <= idx < len(self._attack_success):
+            return self._attack_success[idx]
+        return self._attack_success_formula(diff)
+
+    def attack_damage(self, diff: int) -> int:
+        idx = diff + self.strength_span
+        if 0 <= idx < len(self._attack_damage):
+            return self._attack_damage[idx]
+        return self._attack_damage_formula(diff)
+
+    def coalition_success(self, size: int, combined_diff: int) -> float:
+        key = (size, combined_diff)
+        p = self._coalition_success.get(key)
+        if p is None:
+            p = min(0.95, self.attack_success_base + size * 0.15 + combined_diff * 0.04)
+            self._coalition_success[key] = p
+        return p
+
+    @staticmethod
+    def coalition_damage(combined_diff: int) -> int:
+        return max(10, 30 + combined_diff * 2)
+
+
 @dataclass
 class ConflictResolver:
     rules: RuleSet
+    strength_span: int = 9
+    _params: ResolverParams | None = field(default=None, init=False, repr=False)
+
+    @property
+    def params(self) -> ResolverParams:
+        params = self._params
+        if params is None or params.version != self.rules.version:
+            rules = self.rules
+            params = self._params = rules.derived(
+                ("resolver", self.strength_span),
+                lambda: ResolverParams(rules.values, rules.version, self.strength_span),
+            )
+        return params
 
     def resolve_work(self, actor: int, token_balances: dict[int, int], rng: Random) -> dict[str, object]:
-        low, high = self.rules.values.get("work_income", [2, 4])
-        gain = rng.randint(int(low), int(high))
+        low, high = self.params.work_income
+        gain = rng.randint(low, high)
         token_balances[actor] += gain
         return {"success": True, "gain": gain}
     
@@ -35,18 +123,15 @@ class ConflictResolver:
         if token_balances.get(target, 0) <= 0:
             return {"success": False, "reason": "target_has_no_resources", "amount": 0}
 
-        steal_cap = int(self.rules.values.get("steal_amount", 3))
-        take = min(steal_cap, token_balances[target])
-        base = float(self.rules.values.get("steal_success_base", 0.45))
-        catch_prob = float(self.rules.values.get("steal_catch_prob", 0.25))
-        strength_edge = (strength[actor] - strength[target]) * 0.03
-        success_p = min(0.9, max(0.05, base + strength_edge))
+        params = self.params
+        take = min(params.steal_amount, token_balances[target])
+        success_p = params.steal_success(strength[actor] - strength[target])
 
         if rng.random() < success_p:
             token_balances[target] -= take
             token_balances[actor] += take
-            if rng.random() < catch_prob:
-                penalty = min(token_balances[actor], int(self.rules.values.get("steal_catch_penalty", 2)))
+            if rng.random() < params.steal_catch_prob:
+                penalty = min(token_balances[actor], params.steal_catch_penalty)
                 token_balances[actor] -= penalty
                 return {
                     "success": True,
@@ -56,7 +141,7 @@ class ConflictResolver:
                 }
             return {"success": True, "reason": "clean_success", "amount": take}
 
-        fail_penalty = min(token_balances[actor], int(self.rules.values.get("steal_fail_penalty", 1)))
+        fail_penalty = min(token_balances[actor], params.steal_fail_penalty)
         token_balances[actor] -= fail_penalty
         return {"success": False, "reason": "failed", "amount": 0, "penalty": fail_penalty}
 
@@ -70,17 +155,13 @@ class ConflictResolver:
         health: dict[int, int],
         rng: Random,
     ) -> dict[str, object]:
-        cost = int(self.rules.values.get("attack_cost", 5))
-        token_balances[actor] -= cost
-        
-        # Calculate damage based on strength
-        base_damage = 20
-        strength_bonus = (strength[actor] - strength[target]) * 2
-        damage = max(5, base_damage + strength_bonus)
+        params = self.params
+        token_balances[actor] -= params.attack_cost
 
-        base = float(self.rules.values.get("attack_success_base", 0.12))
-        edge = (strength[actor] - strength[target]) * 0.04
-        success_p = min(0.75, max(0.01, base + edge))
+        # Damage and success chance both scale with the strength difference
+        diff = strength[actor] - strength[target]
+        damage = params.attack_damage(diff)
+        success_p = params.attack_success(diff)
 
         if rng.random() < success_p:
             # Deal damage
@@ -91,15 +172,14 @@ class ConflictResolver:
             eliminated = health[target] <= 0
             if eliminated and target in alive:
                 alive.remove(target)
-                loot_ratio = float(self.rules.values.get("attack_loot_ratio", 0.4))
-                loot = int(token_balances[target] * loot_ratio)
+                loot = int(token_balances[target] * params.attack_loot_ratio)
                 token_balances[target] -= loot
                 token_balances[actor] += loot
                 return {"success": True, "reason": "target_eliminated", "loot": loot, "damage": damage, "target_health": 0}
             
             return {"success": True, "reason": "target_damaged", "damage": damage, "target_health": health[target]}
 
-        recoil = min(token_balances[actor], int(self.rules.values.get("attack_fail_penalty", 2)))
+        recoil = min(token_balances[actor], params.attack_fail_penalty)
         token_balances[actor] -= recoil
         return {"success": False, "reason": "attack_failed", "penalty": recoil}
     
@@ -114,26 +194,16 @@ class ConflictResolver:
         rng: Random,
     ) -> dict[str, object]:
         """Resolve coalition attack - multiple agents attacking together."""
-        cost = int(self.rules.values.get("attack_cost", 5))
-        
+        params = self.params
+
         # Each actor pays cost
         for actor in actors:
-            token_balances[actor] -= cost
-        
-        # Combined strength
-        combined_strength = sum(strength[actor] for actor in actors)
-        target_strength = strength[target]
-        
-        # Higher success rate for coalition
-        base = float(self.rules.values.get("attack_success_base", 0.12))
-        coalition_bonus = len(actors) * 0.15  # +15% per additional attacker
-        edge = (combined_strength - target_strength) * 0.04
-        success_p = min(0.95, base + coalition_bonus + edge)
-        
-        # Higher damage
-        base_damage = 30
-        strength_bonus = (combined_strength - target_strength) * 2
-        damage = max(10, base_damage + strength_bonus)
+            token_balances[actor] -= params.attack_cost
+
+        # Combined strength; coalitions get +15% success per attacker and higher damage
+        combined_diff = sum(strength[actor] for actor in actors) - strength[target]
+        success_p = params.coalition_success(len(actors), combined_diff)
+        damage = params.coalition_damage(combined_diff)
         
         if rng.random() < success_p:
             current_health = health.get(target, 50)
@@ -142,8 +212,7 @@ class ConflictResolver:
             eliminated = health[target] <= 0
             if eliminated and target in alive:
                 alive.remove(target)
-                loot_ratio = float(self.rules.values.get("attack_loot_ratio", 0.4))
-                loot = int(token_balances[target] * loot_ratio)
+                loot = int(token_balances[target] * params.attack_loot_ratio)
                 token_balances[target] -= loot
                 
                 # Split loot among attackers
@@ -170,7 +239,7 @@ class ConflictResolver:
             }
         
         # Failed attack - each actor loses penalty
-        recoil = int(self.rules.values.get("attack_fail_penalty", 2))
+        recoil = params.attack_fail_penalty
         for actor in actors:
             penalty = min(token_balances[actor], recoil)
             token_balances[actor] -= penalty
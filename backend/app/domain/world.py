@@ -1,16 +1,35 @@
 from __future__ import annotations
 
+from collections import deque
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
 from dataclasses import dataclass
+from pathlib import Path
 from random import Random
-from typing import Any
+from time import perf_counter_ns
+from typing import Any, Iterator, Mapping
 
 from .actions import Action, ActionType
 from .agent import Agent, AgentObservation
+from .models import Alliance
+from ..core.alliances import AllianceIndex
+from ..core.balances import TrackedBalances
 from ..core.governance import GovernanceSystem
+from ..core.history import AgentHistory
+from ..core.inequality import InequalityTracker
 from ..core.logger import EventLogger
+from ..core.profiling import TurnProfiler
+from ..core.segments import SegmentedEventLogger
+from ..core.ranking import RankIndex
 from ..core.reputation import ReputationBook
+from ..core.rng import RNG_MODES, RngStreams
+from ..core.spatial import SpatialHash, parse_position
 from .resolver import ConflictResolver
-from ..core.rules import RuleSet
+from ..core.rules import RULES_SPILL_NAME, RuleSet
+
+
+TURN_MODES = ("sequential", "simultaneous")
+TURN_TIMING_WINDOW = 1000  # turn_timings keeps only the most recent turns
+DECISION_EXECUTORS = {"thread": ThreadPoolExecutor, "process": ProcessPoolExecutor}
 
 
 @dataclass
@@ -20,67 +39,129 @@ class AgentSlot:
     label: str
 
 
+def _decide_chunk(work: list[tuple[Agent, AgentObservation, Random]]) -> list[Action]:
+    """Decide a slice of a simultaneous turn (runs in a decision worker)."""
+    return [brain.decide(obs, rng) for brain, obs, rng in work]
+
+
 class World:
     def __init__(
         self,
         *,
         agents: list[Agent],
-        rules: dict[str, Any],
+        rules: Mapping[str, Any],  # a FrozenRules base is shared, not copied
         max_turns: int,
         seed: int,
         initial_resource_range: list[int],
         strength_range: list[int],
         enable_new_features: bool = False,  # Backward compatibility flag
+        interaction_radius: float | None = None,  # Max STEAL/ATTACK/TRADE distance; None = unlimited
+        reputation_decay: float = 0.0,  # Per-turn relaxation of trust/aggression; 0 = no decay
+        batch_decisions: bool = False,  # Decide runs of same-class slots with one decide_batch call
+        rng_mode: str = "legacy",  # "legacy": one shared Random; "streams": per (turn, agent, purpose)
+        turn_mode: str = "sequential",  # "simultaneous": everyone decides on one turn snapshot
+        decision_workers: int = 0,  # Simultaneous mode: worker pool size; 0 = decide in this thread
+        decision_executor: str = "thread",  # "thread" or "process" pool for decision_workers
+        profile: bool = False,  # Per-phase timers and action counters in self.profiler
+        event_spill_dir: str | None = None,  # Long runs: seal older events into segment files here
+        event_window: int = 10_000,  # Events kept in memory when spilling
+        rules_window: int = 1_000,  # Rule versions kept in memory when spilling; older history goes to rules.jsonl
+        history_capacity: int | None = None,  # Max AgentHistory turns kept; older turns thin out
+        event_verbosity: str = "full",  # "aggregate"/"significant" fold routine events into TURN_SUMMARY
     ) -> None:
+        if rng_mode not in RNG_MODES:
+            raise ValueError(f"rng_mode must be one of {RNG_MODES}")
+        if turn_mode not in TURN_MODES:
+            raise ValueError(f"turn_mode must be one of {TURN_MODES}")
+        if decision_executor not in DECISION_EXECUTORS:
+            raise ValueError(f"decision_executor must be one of {tuple(DECISION_EXECUTORS)}")
+        if decision_workers > 0 and rng_mode != "streams":
+            raise ValueError("parallel decisions require rng_mode='streams'")
         self.seed = seed
         self.rng = Random(seed)
+        self.rng_mode = rng_mode
+        self.streams = RngStreams(seed) if rng_mode == "streams" else None
+        self.turn_mode = turn_mode
+        self.decision_workers = decision_workers
+        self.decision_executor = decision_executor
+        self._decision_pool: Executor | None = None
+        self.turn_timings: deque[dict[str, float]] = deque(maxlen=TURN_TIMING_WINDOW)
+        self._decide_ns = 0
+        self.profiler: TurnProfiler | None = TurnProfiler() if profile else None
         self.max_turns = max_turns
         self.enable_new_features = enable_new_features
+        self.batch_decisions = batch_decisions
+        self.interaction_radius = float(interaction_radius) if interaction_radius is not None else None
 
         self.rule_set = RuleSet(values=rules)
-        self.logger = EventLogger()
-        self.reputation = ReputationBook()
+        self.logger: EventLogger = (
+            SegmentedEventLogger(event_spill_dir, window=event_window, verbosity=event_verbosity)
+            if event_spill_dir is not None
+            else EventLogger(verbosity=event_verbosity)
+        )
+        if event_spill_dir is not None:
+            self.rule_set.spill_to(Path(event_spill_dir) / RULES_SPILL_NAME, window=rules_window)
+        self.reputation = ReputationBook(decay=reputation_decay)
         self.governance = GovernanceSystem(rules=self.rule_set)
-        self.resolver = ConflictResolver(rules=self.rule_set)
+        self.resolver = ConflictResolver(
+            rules=self.rule_set,
+            strength_span=int(strength_range[1]) - int(strength_range[0]),
+        )
 
         self.agent_slots: list[AgentSlot] = [
             AgentSlot(agent_id=i, brain=agent, label=agent.name) for i, agent in enumerate(agents)
         ]
-        self.token_balances: dict[int, int] = {
-            slot.agent_id: self.rng.randint(int(initial_resource_range[0]), int(initial_resource_range[1]))
+        init_rng = {slot.agent_id: self._rng_for(0, slot.agent_id, "init") for slot in self.agent_slots}
+        self.token_balances: TrackedBalances = TrackedBalances({
+            slot.agent_id: init_rng[slot.agent_id].randint(int(initial_resource_range[0]), int(initial_resource_range[1]))
             for slot in self.agent_slots
-        }
+        })
         self.strength: dict[int, int] = {
-            slot.agent_id: self.rng.randint(int(strength_range[0]), int(strength_range[1]))
+            slot.agent_id: init_rng[slot.agent_id].randint(int(strength_range[0]), int(strength_range[1]))
             for slot in self.agent_slots
         }
         self.alive: set[int] = {slot.agent_id for slot in self.agent_slots}
         self.reputation.bootstrap(sorted(self.alive))
+        tally = self.governance.attach_tally(self.alive, self.token_balances)
+        self.token_balances.subscribe(tally.on_balance_change)
+        self.ranking = RankIndex(self.token_balances, self.alive)
+        self.token_balances.subscribe(self.ranking.on_balance_change)
 
         # New features (only if enabled)
         self.health: dict[int, int] = {slot.agent_id: 50 for slot in self.agent_slots}
         self.positions: dict[int, tuple] = {slot.agent_id: (0, 0) for slot in self.agent_slots}
-        self.alliances: list = []  # List of Alliance objects
+        self.spatial = SpatialHash(cell_size=self.interaction_radius or 1.0)
+        for aid, pos in self.positions.items():
+            self.spatial.insert(aid, pos)
+        self.alliance_index = AllianceIndex()
         self.alliance_proposals: dict[int, list] = {}  # Pending alliance proposals
 
         self.action_counts: dict[str, int] = {kind.value: 0 for kind in ActionType}
         self.turns_completed: int = 0
 
+        self.inequality = InequalityTracker()
+        self.inequality.bootstrap(self.token_balances)
+        self.history = AgentHistory([slot.agent_id for slot in self.agent_slots], capacity=history_capacity)
+        self._record_history(0)
+
+    def _rng_for(self, turn: int, agent_id: int, purpose: str) -> Random:
+        """The generator for one agent's ``purpose`` draws in ``turn``.
+
+        In legacy mode that is always the shared ``self.rng``, so results depend
+        on the order of every draw; in stream mode each (turn, agent, purpose)
+        has its own counter-based stream and ordering no longer matters.
+        """
+        if self.streams is None:
+            return self.rng
+        return self.streams.stream(turn, agent_id, purpose)
+
     def _rank_of(self, agent_id: int) -> int:
-        ordered = sorted(self.alive, key=lambda aid: (-self.token_balances[aid], aid))
-        return ordered.index(agent_id) + 1
-    
-    def _get_active_alliances_for(self, agent_id: int) -> list:
-        """Get all active alliances involving this agent."""
-        return [a for a in self.alliances if a.active and a.involves_agent(agent_id)]
+        return self.ranking.rank(agent_id)
     
     def _are_allied(self, agent1_id: int, agent2_id: int) -> bool:
         """Check if two agents are allied."""
-        for alliance in self.alliances:
-            if alliance.active and alliance.involves_agent(agent1_id) and alliance.involves_agent(agent2_id):
-                return True
-        return False
-    
+        return self.alliance_index.allied(agent1_id, agent2_id)
+
     def _form_alliance(self, agent1_id: int, agent2_id: int, turn: int) -> tuple[bool, str]:
         """Form an alliance between two agents."""
         if self._are_allied(agent1_id, agent2_id):
@@ -94,7 +175,6 @@ class World:
         # Combined strength
         combined_strength = self.strength[agent1_id] + self.strength[agent2_id]
         
-        from .models import Alliance
         alliance = Alliance(
             agent1_id=agent1_id,
             agent2_id=agent2_id,
@@ -103,49 +183,270 @@ class World:
             formed_turn=turn,
             active=True
         )
-        self.alliances.append(alliance)
+        self.alliance_index.form(alliance)
         return True, "alliance_formed"
     
     def _break_alliance(self, agent1_id: int, agent2_id: int, turn: int) -> tuple[bool, str]:
         """Break an alliance between two agents."""
-        for alliance in self.alliances:
-            if alliance.active and alliance.involves_agent(agent1_id) and alliance.involves_agent(agent2_id):
-                alliance.active = False
-                alliance.broken_turn = turn
-                return True, "alliance_broken"
-        return False, "no_alliance_found"
-
-    def _observation_for(self, slot: AgentSlot, turn: int) -> AgentObservation:
-        aid = slot.agent_id
+        if self.alliance_index.dissolve(agent1_id, agent2_id, turn) is None:
+            return False, "no_alliance_found"
+        return True, "alliance_broken"
+
+    def _shared_observation(self) -> dict[str, Any]:
+        """Observation fields that are the same for every agent at this moment."""
         alive_ids = tuple(sorted(self.alive))
+        return {
+            "alive_ids": alive_ids,
+            "token_balance_by_agent": {i: self.token_balances[i] for i in alive_ids},
+            "strength_by_agent": {i: self.strength[i] for i in alive_ids},
+            "trust_by_agent": self.reputation.trust.view(alive_ids),
+            "aggression_by_agent": self.reputation.aggression.view(alive_ids),
+            "current_rules": dict(self.rule_set.values),
+            "pending_proposal": dict(self.governance.pending) if self.governance.pending else None,
+            "resolver_params": self.resolver.params,
+        }
+
+    def _observation_for(self, slot: AgentSlot, turn: int, shared: dict[str, Any] | None = None) -> AgentObservation:
+        aid = slot.agent_id
         return AgentObservation(
             turn=turn,
             self_id=aid,
             self_token_balance=self.token_balances[aid],
             self_strength=self.strength[aid],
             self_rank=self._rank_of(aid),
-            alive_ids=alive_ids,
-            token_balance_by_agent={i: self.token_balances[i] for i in alive_ids},
-            strength_by_agent={i: self.strength[i] for i in alive_ids},
-            trust_by_agent={i: self.reputation.trust[i] for i in alive_ids},
-            aggression_by_agent={i: self.reputation.aggression[i] for i in alive_ids},
-            current_rules=dict(self.rule_set.values),
-            pending_proposal=dict(self.governance.pending) if self.governance.pending else None,
             last_harm_from=self.reputation.last_harm_from.get(aid),
+            allies=tuple(self.alliance_index.partners(aid)),
+            coalition=self.alliance_index.coalition(aid),
+            nearby_ids=(
+                tuple(self.spatial.neighbors_within(aid, self.interaction_radius))
+                if self.interaction_radius is not None
+                else None
+            ),
+            **(shared if shared is not None else self._shared_observation()),
         )
 
-    def _validate_target(self, actor: int, target: int | None) -> tuple[bool, str]:
+    def _decisions(self, turn: int) -> Iterator[tuple[AgentSlot, Action]]:
+        """Yield each alive slot's action for the turn, in slot order.
+
+        Normally every agent is observed right before it decides, after the
+        previous agent's action has resolved. With ``batch_decisions`` a run of
+        consecutive alive slots whose brains share a class that sets
+        ``supports_batch`` is observed once, at the start of the run, and
+        decided by one ``decide_batch`` call. The run's decisions then draw
+        from ``self.rng`` in slot order before any of its actions resolve (in
+        stream mode each member gets its own decide stream instead), and
+        members eliminated by an earlier member of the run are skipped. A run
+        of one slot behaves exactly like the sequential path.
+        """
+        slots = self.agent_slots
+        i = 0
+        while i < len(slots):
+            slot = slots[i]
+            i += 1
+            if slot.agent_id not in self.alive:
+                continue
+            if not (self.batch_decisions and slot.brain.supports_batch):
+                start = perf_counter_ns()
+                obs = self._observation_for(slot, turn)
+                observed = perf_counter_ns()
+                action = slot.brain.decide(obs, self._rng_for(turn, slot.agent_id, "decide"))
+                self._decide_ns += perf_counter_ns() - observed
+                if self.profiler is not None:
+                    self.profiler.add("observe", observed - start)
+                yield slot, action
+                continue
+
+            run = [slot]
+            while i < len(slots) and type(slots[i].brain) is type(slot.brain):
+                if slots[i].agent_id in self.alive:
+                    run.append(slots[i])
+                i += 1
+            start = perf_counter_ns()
+            shared = self._shared_observation()
+            observations = [self._observation_for(member, turn, shared) for member in run]
+            rng = self.rng if self.streams is None else [self._rng_for(turn, m.agent_id, "decide") for m in run]
+            observed = perf_counter_ns()
+            actions = slot.brain.decide_batch(observations, rng)
+            self._decide_ns += perf_counter_ns() - observed
+            if self.profiler is not None:
+                self.profiler.add("observe", observed - start)
+            for member, action in zip(run, actions):
+                if member.agent_id in self.alive:
+                    yield member, action
+
+    def _simultaneous_decisions(self, turn: int) -> Iterator[tuple[AgentSlot, Action]]:
+        """Decide every alive agent on one snapshot, then yield in resolution order.
+
+        All observations are built from the state at the start of the turn and
+        nothing updates them while actions resolve. Decisions run in slot order
+        in this thread (runs of brains with one ``snapshot_batch_key`` share a
+        ``decide_batch`` call when ``batch_decisions`` is set), or in
+        ``decision_workers`` contiguous chunks on a pool
+        (stream RNG mode only, so the result does not depend on the worker
+        count). Actions then resolve in an order shuffled by the turn's
+        ``(turn, -1, "order")`` generator; an agent eliminated before its turn
+        to resolve loses its action.
+        """
+        start = perf_counter_ns()
+        shared = self._shared_observation()
+        slots = [slot for slot in self.agent_slots if slot.agent_id in self.alive]
+        work = [
+            (slot.brain, self._observation_for(slot, turn, shared), self._rng_for(turn, slot.agent_id, "decide"))
+            for slot in slots
+        ]
+        observed = perf_counter_ns()
+        if self.profiler is not None:
+            self.profiler.add("observe", observed - start)
+        if self.decision_workers == 0 and self.batch_decisions:
+            actions = self._decide_runs(work)
+        elif self.decision_workers > 0 and len(work) > 1:
+            if self._decision_pool is None:
+                self._decision_pool = DECISION_EXECUTORS[self.decision_executor](max_workers=self.decision_workers)
+            size = -(-len(work) // self.decision_workers)
+            chunks = [work[i:i + size] for i in range(0, len(work), size)]
+            actions = [action for chunk in self._decision_pool.map(_decide_chunk, chunks) for action in chunk]
+        else:
+            actions = _decide_chunk(work)
+        self._decide_ns += perf_counter_ns() - observed
+
+        order = list(range(len(slots)))
+        self._rng_for(turn, -1, "order").shuffle(order)
+        for idx in order:
+            if slots[idx].agent_id in self.alive:
+                yield slots[idx], actions[idx]
+
+    @staticmethod
+    def _decide_runs(work: list[tuple[Agent, AgentObservation, Random]]) -> list[Action]:
+        """Decide a snapshot's work list, batching runs of brains with one snapshot_batch_key."""
+        actions: list[Action] = []
+        i = 0
+        while i < len(work):
+            brain = work[i][0]
+            j = i + 1
+            key = brain.snapshot_batch_key()
+            if key is not None:
+                while j < len(work) and work[j][0].snapshot_batch_key() == key:
+                    j += 1
+                run = work[i:j]
+                rngs = [rng for _, _, rng in run]
+                shared = rngs[0] if all(rng is rngs[0] for rng in rngs) else rngs
+                actions.extend(brain.decide_batch([obs for _, obs, _ in run], shared))
+            else:
+                actions.extend(_decide_chunk(work[i:j]))
+            i = j
+        return actions
+
+    def close(self) -> None:
+        """Shut down the decision pool, if one was started, and flush the event log."""
+        if self._decision_pool is not None:
+            self._decision_pool.shutdown()
+            self._decision_pool = None
+        self.logger.flush()
+
+    def fork(self, *, seed: int | None = None, rules: Mapping[str, Any] | None = None) -> World:
+        """An independent world at the current turn, for what-if branches.
+
+        Per-agent state is copied and brains come from ``Agent.fork`` (shared
+        when stateless or remote); everything that grows with the run (the
+        event log, rule versions and history, alliance archive, agent history)
+        is shared up to this turn and extended separately, so a fork costs
+        O(agents) however long the run has been. The fork continues from a
+        copy of the RNG state, so without ``seed`` or ``rules`` it replays the
+        same future as this world. ``seed`` restarts its randomness from a new
+        seed; ``rules`` overrides rule values as one new version, logged as a
+        ``RULE_CHANGE`` with outcome ``fork_override``.
+        """
+        turn = self.turns_completed
+        forked = World.__new__(World)
+        forked.__dict__.update(self.__dict__)  # settings and immutable values
+        forked.rng = Random()
+        forked.rng.setstate(self.rng.getstate())
+        if seed is not None:
+            forked.seed = seed
+            forked.rng = Random(seed)
+            forked.streams = RngStreams(seed) if self.streams is not None else None
+        forked._decision_pool = None
+        forked.turn_timings = deque(maxlen=TURN_TIMING_WINDOW)
+        forked._decide_ns = 0
+        forked.profiler = TurnProfiler() if self.profiler is not None else None
+
+        forked.rule_set = self.rule_set.fork()
+        forked.logger = self.logger.fork()
+        forked.reputation = self.reputation.fork()
+        forked.governance = self.governance.fork(forked.rule_set)
+        forked.resolver = ConflictResolver(rules=forked.rule_set, strength_span=self.resolver.strength_span)
+        forked.agent_slots = [
+            AgentSlot(agent_id=slot.agent_id, brain=slot.brain.fork(), label=slot.label)
+            for slot in self.agent_slots
+        ]
+        forked.token_balances = TrackedBalances(self.token_balances)
+        forked.strength = dict(self.strength)
+        forked.alive = set(self.alive)
+        tally = forked.governance.attach_tally(forked.alive, forked.token_balances)
+        forked.token_balances.subscribe(tally.on_balance_change)
+        forked.ranking = RankIndex(forked.token_balances, forked.alive)
+        forked.token_balances.subscribe(forked.ranking.on_balance_change)
+        forked.health = dict(self.health)
+        forked.positions = dict(self.positions)
+        forked.spatial = self.spatial.fork()
+        forked.alliance_index = self.alliance_index.fork()
+        forked.alliance_proposals = {aid: list(pending) for aid, pending in self.alliance_proposals.items()}
+        forked.action_counts = dict(self.action_counts)
+        forked.inequality = self.inequality.fork()
+        forked.history = self.history.fork()
+
+        if rules:
+            forked.rule_set.override(rules, turn)
+            forked.logger.log(
+                turn=turn,
+                actor=-1,
+                action="RULE_CHANGE",
+                target=None,
+                outcome="fork_override",
+                rule_justification="fork",
+                details={"changes": dict(rules), "rules_version": forked.rule_set.version},
+            )
+        return forked
+
+    def _validate_target(self, actor: int, target: int | None, check_reach: bool = False) -> tuple[bool, str]:
         if target is None:
             return False, "missing_target"
         if target == actor:
             return False, "self_target_not_allowed"
         if target not in self.alive:
             return False, "target_not_alive"
+        if check_reach and self.interaction_radius is not None:
+            ax, ay = self.spatial.positions[actor]
+            tx, ty = self.spatial.positions[int(target)]
+            if (ax - tx) ** 2 + (ay - ty) ** 2 > self.interaction_radius ** 2:
+                return False, "target_out_of_range"
         return True, "target_valid"
 
+    def _record_history(self, turn: int) -> None:
+        self.history.record_turn(
+            turn,
+            token_balances=self.token_balances,
+            trust=self.reputation.trust,
+            aggression=self.reputation.aggression,
+            health=self.health,
+            alive=self.alive,
+        )
+
+    def _on_eliminated(self, agent_id: int, turn: int) -> None:
+        """Update indexes that only track alive agents after a removal."""
+        self.governance.tally.on_removed(agent_id)
+        self.alliance_index.remove_agent(agent_id, turn)
+        self.spatial.remove(agent_id)
+        self.ranking.remove(agent_id)
+
     def _log_action(self, turn: int, action: Action, outcome: str, reason: str, details: dict[str, Any] | None = None) -> None:
+        profiler = self.profiler
+        if profiler is not None:
+            profiler.count(action.kind.value, outcome)
+            start = perf_counter_ns()
+        self.history.record_outcome(action.actor, outcome)
         payload = dict(details or {})
-        if action.actor in self.alive:
+        if action.actor in self.alive and self.logger.keeps(action.kind.value, outcome):
             payload["actor_rank"] = self._rank_of(action.actor)
         self.logger.log(
             turn=turn,
@@ -156,9 +457,15 @@ class World:
             rule_justification=reason,
             details=payload,
         )
+        if profiler is not None:
+            profiler.add("log", perf_counter_ns() - start)
 
     def _try_governance_resolution(self, turn: int, force: bool = False) -> None:
-        changed, status, proposal = self.governance.try_resolve(sorted(self.alive), turn, force=force, token_balances=self.token_balances)
+        profiler = self.profiler
+        start = perf_counter_ns() if profiler is not None else 0
+        changed, status, proposal = self.governance.try_resolve(self.alive, turn, force=force, token_balances=self.token_balances)
+        if profiler is not None:
+            profiler.add("governance", perf_counter_ns() - start)
         if not changed:
             return
         actor = int(proposal["actor"]) if proposal else -1
@@ -181,26 +488,34 @@ class World:
             return False
 
         turn = self.turns_completed + 1
+        profiler = self.profiler
+        if profiler is not None:
+            profiler.start_turn(len(self.logger.events))
+        self.reputation.advance(turn)
+        turn_start = perf_counter_ns()
+        self._decide_ns = 0
+        if self.turn_mode == "simultaneous":
+            decisions = self._simultaneous_decisions(turn)
+        else:
+            decisions = self._decisions(turn)
 
-        for slot in self.agent_slots:
+        for slot, action in decisions:
             actor = slot.agent_id
-            if actor not in self.alive:
-                continue
-
-            obs = self._observation_for(slot, turn)
-            action = slot.brain.decide(obs, self.rng)
             self.action_counts[action.kind.value] += 1
 
+            validate_start = perf_counter_ns() if profiler is not None else 0
             valid, reason = self.rule_set.validate_action(
                 action=action,
                 actor_state={"token_balance": self.token_balances[actor]},
             )
+            if profiler is not None:
+                profiler.add("validate", perf_counter_ns() - validate_start)
             if not valid:
                 self._log_action(turn, action, "blocked", reason)
                 continue
 
             if action.kind == ActionType.WORK:
-                outcome = self.resolver.resolve_work(actor, self.token_balances, self.rng)
+                outcome = self.resolver.resolve_work(actor, self.token_balances, self._rng_for(turn, actor, "resolve"))
                 self.reputation.record_work(actor)
                 self._log_action(turn, action, "success", reason, details=outcome)
                 continue
@@ -231,7 +546,7 @@ class World:
                 continue
             
             if action.kind == ActionType.TRADE and self.enable_new_features:
-                target_ok, target_reason = self._validate_target(actor, action.target)
+                target_ok, target_reason = self._validate_target(actor, action.target, check_reach=True)
                 if not target_ok:
                     self._log_action(turn, action, "blocked", target_reason)
                     continue
@@ -245,9 +560,13 @@ class World:
                 continue
             
             if action.kind == ActionType.MOVE and self.enable_new_features:
-                new_pos = action.payload.get("position", (0, 0))
+                new_pos = parse_position(action.payload.get("position", (0, 0)))
+                if new_pos is None:
+                    self._log_action(turn, action, "blocked", "invalid_position")
+                    continue
                 old_pos = self.positions[actor]
                 self.positions[actor] = new_pos
+                self.spatial.move(actor, new_pos)
                 self._log_action(turn, action, "success", reason, details={
                     "from": old_pos,
                     "to": new_pos
@@ -260,12 +579,8 @@ class World:
                     self._log_action(turn, action, "blocked", target_reason)
                     continue
                 
-                # Get allied agents
-                allies = [actor]
-                for alliance in self._get_active_alliances_for(actor):
-                    partner = alliance.get_partner(actor)
-                    if partner and partner in self.alive:
-                        allies.append(partner)
+                # Get allied agents (eliminated agents have no active alliances)
+                allies = [actor, *self.alliance_index.partners(actor)]
                 
                 if len(allies) < 2:
                     self._log_action(turn, action, "blocked", "no_allies_available")
@@ -278,14 +593,16 @@ class World:
                     self.strength,
                     self.alive,
                     self.health,
-                    self.rng,
+                    self._rng_for(turn, actor, "resolve"),
                 )
+                if result.get("reason") == "target_eliminated":
+                    self._on_eliminated(int(action.target), turn)
                 status = "success" if result["success"] else "failed"
                 self._log_action(turn, action, status, reason, details=result)
                 continue
 
             if action.kind == ActionType.STEAL:
-                target_ok, target_reason = self._validate_target(actor, action.target)
+                target_ok, target_reason = self._validate_target(actor, action.target, check_reach=True)
                 if not target_ok:
                     self._log_action(turn, action, "blocked", target_reason)
                     continue
@@ -294,7 +611,7 @@ class World:
                     target=int(action.target),
                     token_balances=self.token_balances,
                     strength=self.strength,
-                    rng=self.rng,
+                    rng=self._rng_for(turn, actor, "resolve"),
                 )
                 self.reputation.record_steal(actor, int(action.target), bool(result["success"]))
                 status = "success" if result["success"] else "failed"
@@ -302,7 +619,7 @@ class World:
                 continue
 
             if action.kind == ActionType.ATTACK:
-                target_ok, target_reason = self._validate_target(actor, action.target)
+                target_ok, target_reason = self._validate_target(actor, action.target, check_reach=True)
                 if not target_ok:
                     self._log_action(turn, action, "blocked", target_reason)
                     continue
@@ -313,8 +630,10 @@ class World:
                     strength=self.strength,
                     alive=self.alive,
                     health=self.health if self.enable_new_features else {},
-                    rng=self.rng,
+                    rng=self._rng_for(turn, actor, "resolve"),
                 )
+                if result.get("reason") == "target_eliminated":
+                    self._on_eliminated(int(action.target), turn)
                 self.reputation.record_attack(actor, int(action.target), bool(result["success"]))
                 status = "success" if result["success"] else "failed"
                 self._log_action(turn, action, status, reason, details=result)
@@ -344,12 +663,26 @@ class World:
             self._log_action(turn, action, "noop", reason)
 
         self._try_governance_resolution(turn, force=True)
+        self.logger.end_turn(turn)
+        record_start = perf_counter_ns()
+        self.inequality.observe(turn, self.token_balances)
+        self._record_history(turn)
         self.turns_completed = turn
+        end = perf_counter_ns()
+        if profiler is not None:
+            profiler.add("record", end - record_start)
+            profiler.add("decide", self._decide_ns)
+            profiler.end_turn(len(self.logger.events))
+        total, decide = (end - turn_start) / 1e9, self._decide_ns / 1e9
+        self.turn_timings.append({"turn": turn, "decide_s": decide, "resolve_s": total - decide, "total_s": total})
         return True
 
     def run(self) -> dict[str, Any]:
-        while self.step():
-            pass
+        try:
+            while self.step():
+                pass
+        finally:
+            self.close()
         return self.snapshot()
 
     def snapshot(self) -> dict[str, Any]:
@@ -376,6 +709,7 @@ class World:
             "leaderboard": leaderboard,
             "alive": sorted(self.alive),
             "action_counts": dict(self.action_counts),
+            "event_verbosity": self.logger.verbosity,
             "event_count": len(self.logger.events),
             "log_digest": self.logger.digest(),
             "events": self.logger.events,
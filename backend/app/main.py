@@ -1,9 +1,11 @@
 from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import PlainTextResponse
 
 from .api.routes import simulation, agents, rules, replay
 from .core.config import settings
+from .core.profiling import render_prometheus
 
 
 @asynccontextmanager
@@ -41,6 +43,13 @@ async def health_check():
     return {"status": "healthy", "service": "cheaters-dilemma-backend"}
 
 
+@app.get("/metrics", response_class=PlainTextResponse)
+async def metrics() -> PlainTextResponse:
+    """Prometheus scrape endpoint: turn latency, phase time and action counters."""
+    text = render_prometheus(simulation.simulation_manager.profiler_stats())
+    return PlainTextResponse(text, media_type="text/plain; version=0.0.4")
+
+
 if __name__ == "__main__":
     import uvicorn
     import sys
@@ -4,12 +4,14 @@ Contains application services that orchestrate domain logic.
 """
 
 from .analytics_service import AnalyticsService
+from .ensemble_service import EnsembleAggregator
 from .metrics_service import MetricsService
 from .replay_service import ReplayService
 from .simulation_service import SimulationService
 
 __all__ = [
     "AnalyticsService",
+    "EnsembleAggregator",
     "MetricsService",
     "ReplayService",
     "SimulationService",
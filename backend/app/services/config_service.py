@@ -0,0 +1,179 @@
+"""
+Config service for The Cheater's Dilemma.
+Parses and validates world.yaml and rules.yaml once into immutable config
+objects, and re-reads them only when either file's mtime or size changes.
+Every world built from one load shares the same FrozenRules base.
+"""
+
+from __future__ import annotations
+
+import threading
+from dataclasses import dataclass, fields
+from pathlib import Path
+from typing import Any, Mapping
+
+from ..core.logger import VERBOSITY_LEVELS
+from ..core.rng import RNG_MODES
+from ..core.rules import FrozenRules, RuleParams
+from ..domain.resolver import ResolverParams
+from ..domain.world import TURN_MODES
+
+
+CONFIG_DIR = Path(__file__).resolve().parent.parent / "config"
+WORLD_FILE = "world.yaml"
+RULES_FILE = "rules.yaml"
+
+_RULE_FLAGS = ("allow_steal", "allow_attack", "allow_proposals", "allow_votes")
+_RULE_PROBABILITIES = ("steal_success_base", "steal_catch_prob", "attack_success_base")
+
+
+def _int_range(raw: Any, name: str) -> tuple[int, int]:
+    if not isinstance(raw, (list, tuple)) or len(raw) != 2 or not all(isinstance(v, int) for v in raw):
+        raise ValueError(f"{name} must be a [low, high] pair of integers")
+    low, high = raw
+    if low > high:
+        raise ValueError(f"{name} low must not exceed high")
+    return int(low), int(high)
+
+
+@dataclass(frozen=True)
+class WorldConfig:
+    """Typed world.yaml; ``world_kwargs`` are the World arguments it supplies."""
+
+    max_turns: int
+    initial_resource_range: tuple[int, int]
+    strength_range: tuple[int, int]
+    interaction_radius: float | None = None
+    reputation_decay: float = 0.0
+    batch_decisions: bool = False
+    rng_mode: str = "legacy"
+    turn_mode: str = "sequential"
+    profile: bool = False
+    event_verbosity: str = "full"
+
+    @classmethod
+    def from_dict(cls, raw: Mapping[str, Any]) -> WorldConfig:
+        known = {f.name for f in fields(cls)}
+        unknown = sorted(set(raw) - known)
+        if unknown:
+            raise ValueError(f"unknown keys {unknown}")
+        max_turns = raw.get("max_turns")
+        if not isinstance(max_turns, int) or max_turns < 1:
+            raise ValueError("max_turns must be a positive integer")
+        radius = raw.get("interaction_radius")
+        if radius is not None and (not isinstance(radius, (int, float)) or radius <= 0):
+            raise ValueError("interaction_radius must be null or a positive number")
+        decay = float(raw.get("reputation_decay", 0.0))
+        if not 0.0 <= decay <= 1.0:
+            raise ValueError("reputation_decay must be within [0, 1]")
+        config = cls(
+            max_turns=max_turns,
+            initial_resource_range=_int_range(raw.get("initial_resource_range"), "initial_resource_range"),
+            strength_range=_int_range(raw.get("strength_range"), "strength_range"),
+            interaction_radius=float(radius) if radius is not None else None,
+            reputation_decay=decay,
+            batch_decisions=bool(raw.get("batch_decisions", False)),
+            rng_mode=raw.get("rng_mode", "legacy"),
+            turn_mode=raw.get("turn_mode", "sequential"),
+            profile=bool(raw.get("profile", False)),
+            event_verbosity=raw.get("event_verbosity", "full"),
+        )
+        for name, allowed in (
+            ("rng_mode", RNG_MODES),
+            ("turn_mode", TURN_MODES),
+            ("event_verbosity", VERBOSITY_LEVELS),
+        ):
+            if getattr(config, name) not in allowed:
+                raise ValueError(f"{name} must be one of {allowed}")
+        return config
+
+    def world_kwargs(self) -> dict[str, Any]:
+        return {f.name: getattr(self, f.name) for f in fields(self) if f.name != "max_turns"}
+
+
+def validate_rules(raw: Mapping[str, Any]) -> FrozenRules:
+    """Check rules.yaml and freeze it into the shared base for new worlds."""
+    for key in _RULE_FLAGS:
+        if key in raw and not isinstance(raw[key], bool):
+            raise ValueError(f"{key} must be true or false")
+    _int_range(raw.get("work_income", [2, 4]), "work_income")
+    for key in _RULE_PROBABILITIES:
+        value = raw.get(key, 0.0)
+        if not isinstance(value, (int, float)) or not 0.0 <= value <= 1.0:
+            raise ValueError(f"{key} must be a probability within [0, 1]")
+    mutable = raw.get("mutable_keys", [])
+    if not isinstance(mutable, list) or not all(isinstance(key, str) and key in raw for key in mutable):
+        raise ValueError("mutable_keys must list rule keys defined in this file")
+    ranges = raw.get("key_ranges", {})
+    if not isinstance(ranges, Mapping):
+        raise ValueError("key_ranges must map rule keys to {min, max}")
+    for key, bounds in ranges.items():
+        if key not in mutable:
+            raise ValueError(f"key_ranges.{key} is not a mutable key")
+        if not isinstance(bounds, Mapping) or bounds.get("min", 0) > bounds.get("max", bounds.get("min", 0)):
+            raise ValueError(f"key_ranges.{key} must be {{min, max}} with min <= max")
+        value = raw[key]
+        if isinstance(value, (int, float)) and not bounds.get("min", value) <= value <= bounds.get("max", value):
+            raise ValueError(f"{key}={value} is outside key_ranges")
+    rules = FrozenRules(raw)
+    try:
+        RuleParams.from_values(rules)
+        ResolverParams(rules, 1, 0)
+    except (TypeError, ValueError) as exc:
+        raise ValueError(f"rule value has the wrong type: {exc}") from exc
+    return rules
+
+
+@dataclass(frozen=True)
+class SimulationConfig:
+    world: WorldConfig
+    rules: FrozenRules
+    stamp: tuple[tuple[int, int], ...]  # (mtime_ns, size) of world.yaml and rules.yaml
+
+
+class ConfigService:
+    """Loads the config directory once and hands out the cached SimulationConfig."""
+
+    def __init__(self, config_dir: str | Path = CONFIG_DIR) -> None:
+        self.config_dir = Path(config_dir)
+        self._lock = threading.Lock()
+        self._config: SimulationConfig | None = None
+
+    def _stamp(self) -> tuple[tuple[int, int], ...]:
+        stats = [(self.config_dir / name).stat() for name in (WORLD_FILE, RULES_FILE)]
+        return tuple((st.st_mtime_ns, st.st_size) for st in stats)
+
+    def load(self) -> SimulationConfig:
+        """The current config, re-parsed only if a file changed since the last load."""
+        stamp = self._stamp()
+        config = self._config
+        if config is not None and config.stamp == stamp:
+            return config
+        with self._lock:
+            config = self._config
+            if config is None or config.stamp != stamp:
+                config = self._config = self._parse(stamp)
+        return config
+
+    def _parse(self, stamp: tuple[tuple[int, int], ...]) -> SimulationConfig:
+        import yaml
+
+        parsed = {}
+        for name in (WORLD_FILE, RULES_FILE):
+            with (self.config_dir / name).open("r", encoding="utf-8") as f:
+                raw = yaml.safe_load(f)
+            if not isinstance(raw, dict):
+                raise ValueError(f"{name}: expected a mapping at the top level")
+            parsed[name] = raw
+        try:
+            world = WorldConfig.from_dict(parsed[WORLD_FILE])
+        except ValueError as exc:
+            raise ValueError(f"{WORLD_FILE}: {exc}") from exc
+        try:
+            rules = validate_rules(parsed[RULES_FILE])
+        except ValueError as exc:
+            raise ValueError(f"{RULES_FILE}: {exc}") from exc
+        return SimulationConfig(world=world, rules=rules, stamp=stamp)
+
+
+config_service = ConfigService()
@@ -0,0 +1,258 @@
+"""
+Ensemble service for aggregating metrics across many simulation runs.
+Consumes compute_metrics outputs one at a time with mergeable, single-pass
+statistics so partial aggregates from parallel workers combine exactly.
+"""
+
+from __future__ import annotations
+
+import json
+import math
+from collections import Counter
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Iterable, Iterator
+
+from .metrics_service import MetricsService
+
+
+Z_95 = 1.959964
+
+
+@dataclass
+class RunningStats:
+    """Welford mean/variance accumulator with Chan's parallel merge."""
+
+    count: int = 0
+    mean: float = 0.0
+    m2: float = 0.0
+    minimum: float = math.inf
+    maximum: float = -math.inf
+
+    def add(self, value: float) -> None:
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (value - self.mean)
+        self.minimum = min(self.minimum, value)
+        self.maximum = max(self.maximum, value)
+
+    def merge(self, other: RunningStats) -> None:
+        if other.count == 0:
+            return
+        if self.count == 0:
+            self.count, self.mean, self.m2 = other.count, other.mean, other.m2
+            self.minimum, self.maximum = other.minimum, other.maximum
+            return
+        total = self.count + other.count
+        delta = other.mean - self.mean
+        self.mean += delta * other.count / total
+        self.m2 += other.m2 + delta * delta * self.count * other.count / total
+        self.count = total
+        self.minimum = min(self.minimum, other.minimum)
+        self.maximum = max(self.maximum, other.maximum)
+
+    @property
+    def variance(self) -> float:
+        return self.m2 / (self.count - 1) if self.count > 1 else 0.0
+
+    def confidence_interval(self, z: float = Z_95) -> tuple[float, float]:
+        if self.count == 0:
+            return (0.0, 0.0)
+        half = z * math.sqrt(self.variance / self.count)
+        return (self.mean - half, self.mean + half)
+
+    def to_dict(self) -> dict[str, Any]:
+        low, high = self.confidence_interval()
+        return {
+            "count": self.count,
+            "mean": round(self.mean, 6),
+            "std": round(math.sqrt(self.variance), 6),
+            "min": self.minimum if self.count else None,
+            "max": self.maximum if self.count else None,
+            "ci95": [round(low, 6), round(high, 6)],
+        }
+
+
+@dataclass
+class QuantileSketch:
+    """Log-bucketed quantile sketch for non-negative values.
+
+    Values are counted in buckets whose bounds grow geometrically by
+    ``gamma = (1 + accuracy) / (1 - accuracy)``, so every quantile estimate is
+    within ``accuracy`` relative error. Merging adds bucket counts, which makes
+    it exact and order-independent. When more than ``max_buckets`` are in use
+    the lowest buckets are collapsed together.
+    """
+
+    accuracy: float = 0.01
+    max_buckets: int = 2048
+    buckets: dict[int, int] = field(default_factory=dict)
+    zero_count: int = 0
+    count: int = 0
+
+    @property
+    def gamma(self) -> float:
+        return (1 + self.accuracy) / (1 - self.accuracy)
+
+    def _key(self, value: float) -> int:
+        return math.ceil(math.log(value) / math.log(self.gamma))
+
+    def add(self, value: float) -> None:
+        if value < 0:
+            raise ValueError("QuantileSketch only accepts non-negative values")
+        self.count += 1
+        if value == 0:
+            self.zero_count += 1
+            return
+        key = self._key(value)
+        self.buckets[key] = self.buckets.get(key, 0) + 1
+        self._collapse()
+
+    def merge(self, other: QuantileSketch) -> None:
+        if other.accuracy != self.accuracy:
+            raise ValueError("Cannot merge sketches with different accuracy")
+        for key, cnt in other.buckets.items():
+            self.buckets[key] = self.buckets.get(key, 0) + cnt
+        self.zero_count += other.zero_count
+        self.count += other.count
+        self._collapse()
+
+    def _collapse(self) -> None:
+        if len(self.buckets) <= self.max_buckets:
+            return
+        keys = sorted(self.buckets)
+        excess = keys[: len(keys) - self.max_buckets + 1]
+        merged = sum(self.buckets.pop(k) for k in excess)
+        target = excess[-1]
+        self.buckets[target] = self.buckets.get(target, 0) + merged
+
+    def quantile(self, q: float) -> float | None:
+        if self.count == 0:
+            return None
+        rank = q * (self.count - 1)
+        seen = self.zero_count
+        if rank < seen:
+            return 0.0
+        for key in sorted(self.buckets):
+            seen += self.buckets[key]
+            if rank < seen:
+                return 2 * self.gamma ** key / (self.gamma + 1)
+        return 2 * self.gamma ** max(self.buckets) / (self.gamma + 1)
+
+    def to_dict(self) -> dict[str, Any]:
+        def _q(q: float) -> float | None:
+            value = self.quantile(q)
+            return round(value, 6) if value is not None else None
+
+        return {"count": self.count, "p05": _q(0.05), "p25": _q(0.25), "p50": _q(0.5), "p75": _q(0.75), "p95": _q(0.95)}
+
+
+def wilson_interval(successes: int, trials: int, z: float = Z_95) -> tuple[float, float]:
+    """Wilson score interval for a binomial proportion."""
+    if trials == 0:
+        return (0.0, 0.0)
+    p = successes / trials
+    denom = 1 + z * z / trials
+    centre = (p + z * z / (2 * trials)) / denom
+    half = z * math.sqrt(p * (1 - p) / trials + z * z / (4 * trials * trials)) / denom
+    return (max(0.0, centre - half), min(1.0, centre + half))
+
+
+STAT_KEYS = (
+    "gini_token_balance",
+    "hhi_token_balance",
+    "top1_share",
+    "top3_share",
+    "alive_count",
+    "event_count",
+    "rules_version",
+)
+
+
+@dataclass
+class EnsembleAggregator:
+    """Streaming aggregate over compute_metrics outputs from many runs."""
+
+    runs: int = 0
+    stats: dict[str, RunningStats] = field(default_factory=lambda: {k: RunningStats() for k in STAT_KEYS})
+    winner_strategy: Counter = field(default_factory=Counter)
+    winner_reason: Counter = field(default_factory=Counter)
+    runs_without_removal: int = 0
+    gini_sketch: QuantileSketch = field(default_factory=QuantileSketch)
+    first_removal_sketch: QuantileSketch = field(default_factory=QuantileSketch)
+    first_removal_stats: RunningStats = field(default_factory=RunningStats)
+
+    def add(self, metrics: dict[str, Any]) -> None:
+        self.runs += 1
+        for key in STAT_KEYS:
+            value = metrics.get(key)
+            if isinstance(value, (int, float)):
+                self.stats[key].add(float(value))
+
+        winner = metrics.get("winner_analysis", {})
+        self.winner_strategy[winner.get("winner_strategy")] += 1
+        self.winner_reason[winner.get("winner_reason")] += 1
+
+        self.gini_sketch.add(float(metrics.get("gini_token_balance", 0.0)))
+        first_removal = metrics.get("timeline_markers", {}).get("first_removal_turn")
+        if first_removal is None:
+            self.runs_without_removal += 1
+        else:
+            self.first_removal_sketch.add(float(first_removal))
+            self.first_removal_stats.add(float(first_removal))
+
+    def add_all(self, metrics_stream: Iterable[dict[str, Any]]) -> EnsembleAggregator:
+        for metrics in metrics_stream:
+            self.add(metrics)
+        return self
+
+    def merge(self, other: EnsembleAggregator) -> EnsembleAggregator:
+        self.runs += other.runs
+        for key in STAT_KEYS:
+            self.stats[key].merge(other.stats[key])
+        self.winner_strategy.update(other.winner_strategy)
+        self.winner_reason.update(other.winner_reason)
+        self.runs_without_removal += other.runs_without_removal
+        self.gini_sketch.merge(other.gini_sketch)
+        self.first_removal_sketch.merge(other.first_removal_sketch)
+        self.first_removal_stats.merge(other.first_removal_stats)
+        return self
+
+    @staticmethod
+    def _shares(counter: Counter, runs: int) -> dict[str, Any]:
+        shares = {}
+        for label, wins in sorted(counter.items(), key=lambda kv: (-kv[1], str(kv[0]))):
+            low, high = wilson_interval(wins, runs)
+            shares[str(label)] = {
+                "wins": wins,
+                "share": round(wins / runs, 6) if runs else 0.0,
+                "ci95": [round(low, 6), round(high, 6)],
+            }
+        return shares
+
+    def summary(self) -> dict[str, Any]:
+        return {
+            "runs": self.runs,
+            "metrics": {key: stats.to_dict() for key, stats in self.stats.items()},
+            "winner_strategy": self._shares(self.winner_strategy, self.runs),
+            "winner_reason": self._shares(self.winner_reason, self.runs),
+            "gini_quantiles": self.gini_sketch.to_dict(),
+            "first_removal_turn": {
+                "runs_without_removal": self.runs_without_removal,
+                "stats": self.first_removal_stats.to_dict(),
+                "quantiles": self.first_removal_sketch.to_dict(),
+            },
+        }
+
+
+def iter_export_metrics(paths: Iterable[str | Path]) -> Iterator[dict[str, Any]]:
+    """Yield metrics from exported run JSON files, loading one file at a time."""
+    for path in paths:
+        with Path(path).open("r", encoding="utf-8") as f:
+            payload = json.load(f)
+        summary = payload.get("summary") or {}
+        if "metrics" in summary:
+            yield summary["metrics"]
+        else:
+            yield MetricsService.compute_metrics(payload.get("result", payload))
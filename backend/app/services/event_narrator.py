@@ -124,6 +124,13 @@ class EventNarrator:
         elif action == "DO_NOTHING":
             return f"Turn {turn}: Agent {actor} did nothing"
         
+        elif action == "TURN_SUMMARY":
+            counts = details.get("counts", {})
+            total = sum(counts.values())
+            parts = ", ".join(f"{count} {key}" for key, count in counts.items())
+            earned = sum(row[2] for row in details.get("work_gain", []))
+            return f"Turn {turn}: {total} routine actions summarized ({parts}); work earned {earned} tokens"
+        
         else:
             return f"Turn {turn}: Agent {actor} performed {action} (outcome: {outcome})"
     
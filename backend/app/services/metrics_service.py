@@ -35,6 +35,12 @@ class MetricsService:
         """Calculate share held by top k values."""
         if not values:
             return 0.0
+        total = sum(values)
+        if total <= 0:
+            return 0.0
+        top = sorted(values, reverse=True)[:k]
+        return round(sum(top) / total, 6)
+
     @staticmethod
     def calculate_strategy_frequency(leaderboard: list[dict[str, Any]]) -> dict[str, int]:
         """Calculate frequency of each strategy in the leaderboard."""
@@ -142,6 +148,10 @@ class MetricsService:
         resource_gain = 0
 
         for event in result.get("events", []):
+            if event.get("action") == "TURN_SUMMARY":
+                # Folded WORK at aggregate/significant verbosity: rows are [actor, count, gain].
+                resource_gain += sum(row[2] for row in event.get("details", {}).get("work_gain", []) if row[0] == wid)
+                continue
             if event.get("actor") != wid:
                 continue
             if event.get("action") == "RULE_CHANGE" and event.get("outcome") == "proposal_passed":
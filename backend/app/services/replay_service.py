@@ -4,13 +4,20 @@ Handles replay storage, retrieval, and analysis.
 """
 
 from __future__ import annotations
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Sequence
 from pathlib import Path
 import json
 import os
 from datetime import datetime
 
 
+def _json_default(value: Any) -> Any:
+    # Spilled and forked worlds hand out event sequences that are not lists.
+    if isinstance(value, Sequence) and not isinstance(value, (str, bytes)):
+        return list(value)
+    return str(value)
+
+
 class ReplayService:
     """Service for managing simulation replays."""
 
@@ -36,7 +43,7 @@ class ReplayService:
         }
 
         with open(replay_file, 'w') as f:
-            json.dump(replay_data, f, indent=2, default=str)
+            json.dump(replay_data, f, indent=2, default=_json_default)
 
         return replay_id
 
@@ -99,19 +106,37 @@ class ReplayService:
 
         return False
 
-    def compare_replays(self, replay_id1: str, replay_id2: str) -> Optional[Dict[str, Any]]:
-        """Compare two replays for determinism testing."""
+    def compare_replays(self, replay_id1: str, replay_id2: str, limit: int = 50) -> Optional[Dict[str, Any]]:
+        """Compare two replays for determinism testing.
+
+        Events are diffed turn by turn, aligned by (turn, actor), and only the
+        first ``limit`` differences are listed; ``event_diff`` has the totals.
+        """
+        from ..core.event_diff import diff_event_streams, encoded_lines
+
         replay1 = self.load_replay(replay_id1)
         replay2 = self.load_replay(replay_id2)
 
         if not replay1 or not replay2:
             return None
 
+        data1, data2 = replay1["data"], replay2["data"]
+        event_diff = diff_event_streams(
+            encoded_lines(data1.get("events", [])), encoded_lines(data2.get("events", [])), limit
+        )
+        differences = self._find_differences(data1, data2, limit)
+        for d in event_diff.differences[:max(0, limit - len(differences))]:
+            differences.append(
+                f"events turn {d['turn']} actor {d['actor']} {d['action']}: "
+                f"{d['kind']} {d['field']} ({d['values'][0]} vs {d['values'][1]})"
+            )
+
         return {
             "replay1_id": replay_id1,
             "replay2_id": replay_id2,
-            "identical": replay1["data"] == replay2["data"],
-            "differences": self._find_differences(replay1["data"], replay2["data"])
+            "identical": event_diff.identical and not differences,
+            "differences": differences,
+            "event_diff": event_diff.summary(),
         }
 
     def _determine_winner_strategy(self, simulation_data: Dict[str, Any]) -> Optional[str]:
@@ -133,32 +158,19 @@ class ReplayService:
         winner = max(leaderboard, key=lambda x: x.get("resources", 0))
         return winner.get("resources")
 
-    def _find_differences(self, data1: Dict[str, Any], data2: Dict[str, Any]) -> List[str]:
-        """Find differences between two data structures."""
-        differences = []
+    def _find_differences(self, data1: Dict[str, Any], data2: Dict[str, Any], limit: int) -> List[str]:
+        """First difference of each top-level field other than the event log."""
+        from ..core.trace import first_difference
 
-        def compare_dicts(d1, d2, path=""):
-            if type(d1) != type(d2):
-                differences.append(f"{path}: Type mismatch ({type(d1)} vs {type(d2)})")
-                return
-
-            if isinstance(d1, dict):
-                for key in set(d1.keys()) | set(d2.keys()):
-                    new_path = f"{path}.{key}" if path else key
-                    if key not in d1:
-                        differences.append(f"{new_path}: Missing in first")
-                    elif key not in d2:
-                        differences.append(f"{new_path}: Missing in second")
-                    else:
-                        compare_dicts(d1[key], d2[key], new_path)
-            elif isinstance(d1, list):
-                if len(d1) != len(d2):
-                    differences.append(f"{path}: Length mismatch ({len(d1)} vs {len(d2)})")
-                else:
-                    for i, (v1, v2) in enumerate(zip(d1, d2)):
-                        compare_dicts(v1, v2, f"{path}[{i}]")
-            elif d1 != d2:
-                differences.append(f"{path}: Value mismatch ({d1} vs {d2})")
-
-        compare_dicts(data1, data2)
-        return differences
\ No newline at end of file
+        differences = []
+        for key in sorted(set(data1) | set(data2)):
+            if key == "events" or len(differences) >= limit:
+                continue
+            if key not in data1 or key not in data2:
+                differences.append(f"{key}: Missing in {'first' if key not in data1 else 'second'}")
+                continue
+            found = first_difference(data1[key], data2[key], f"{key}.")
+            if found is not None:
+                path, left, right = found
+                differences.append(f"{path}: Value mismatch ({left} vs {right})")
+        return differences
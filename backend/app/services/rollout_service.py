@@ -0,0 +1,215 @@
+"""
+Rollout service for The Cheater's Dilemma.
+Estimates outcome distributions from a live simulation by forking its world
+at the current turn and running many continuations to completion, each with
+its own derived seed, across worker processes.
+"""
+
+from __future__ import annotations
+
+import os
+import pickle
+import threading
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any
+
+from ..core.logger import EventLogger
+from ..core.rng import stream_key
+from ..domain.world import World
+from .ensemble_service import RunningStats, wilson_interval
+
+
+DEFAULT_ROLLOUTS = 200
+DEFAULT_CHUNK = 25  # rollouts per worker task; convergence is checked between chunks
+DEFAULT_TOLERANCE = 0.05  # stop once every win/elimination CI95 half-width is below this
+MIN_ROLLOUTS = 50
+CACHE_SIZE = 128
+
+
+def rollout_seed(seed: int, turn: int, index: int) -> int:
+    """Seed of continuation ``index`` from ``turn`` of a run started with ``seed``."""
+    return stream_key(seed, "rollout", turn, index) >> 1
+
+
+def rollout_base(world: World) -> bytes:
+    """A pickled fork of ``world`` for workers to continue from.
+
+    Rollouts only need final balances, so the fork records events at
+    ``significant`` verbosity into a fresh log instead of carrying the
+    parent's history to every worker; verbosity does not change outcomes.
+    Forking seals the parent's open history chunk, so call this from the
+    thread that steps ``world``, never alongside a step.
+    """
+    base = world.fork()
+    base.logger = EventLogger(verbosity="significant")
+    base.profiler = None
+    return pickle.dumps(base)
+
+
+@dataclass
+class RolloutAggregate:
+    """Per-agent outcome counts over finished rollouts; merges like EnsembleAggregator."""
+
+    runs: int = 0
+    wins: dict[int, int] = field(default_factory=dict)
+    eliminations: dict[int, int] = field(default_factory=dict)
+    balances: dict[int, RunningStats] = field(default_factory=dict)
+
+    def add(self, world: World) -> None:
+        self.runs += 1
+        balances = world.token_balances
+        # Same winner as the snapshot leaderboard: highest balance, lowest id on ties.
+        winner = min(balances, key=lambda aid: (-balances[aid], aid))
+        self.wins[winner] = self.wins.get(winner, 0) + 1
+        for aid, balance in balances.items():
+            if aid not in world.alive:
+                self.eliminations[aid] = self.eliminations.get(aid, 0) + 1
+            self.balances.setdefault(aid, RunningStats()).add(float(balance))
+
+    def merge(self, other: RolloutAggregate) -> RolloutAggregate:
+        self.runs += other.runs
+        for aid, count in other.wins.items():
+            self.wins[aid] = self.wins.get(aid, 0) + count
+        for aid, count in other.eliminations.items():
+            self.eliminations[aid] = self.eliminations.get(aid, 0) + count
+        for aid, stats in other.balances.items():
+            self.balances.setdefault(aid, RunningStats()).merge(stats)
+        return self
+
+    def max_half_width(self) -> float:
+        """Widest CI95 half-width over every agent's win and elimination probability."""
+        widest = 0.0
+        for aid in self.balances:
+            for successes in (self.wins.get(aid, 0), self.eliminations.get(aid, 0)):
+                low, high = wilson_interval(successes, self.runs)
+                widest = max(widest, (high - low) / 2)
+        return widest
+
+    def summary(self) -> dict[str, Any]:
+        def _probability(successes: int) -> dict[str, Any]:
+            low, high = wilson_interval(successes, self.runs)
+            return {
+                "p": round(successes / self.runs, 6) if self.runs else 0.0,
+                "ci95": [round(low, 6), round(high, 6)],
+            }
+
+        agents = {}
+        for aid in sorted(self.balances):
+            balance = self.balances[aid].to_dict()
+            agents[aid] = {
+                "win": _probability(self.wins.get(aid, 0)),
+                "eliminated": _probability(self.eliminations.get(aid, 0)),
+                "final_balance": {"mean": balance["mean"], "std": balance["std"], "ci95": balance["ci95"]},
+            }
+        return {"runs": self.runs, "agents": agents}
+
+
+def run_rollouts(base: bytes, seeds: list[int]) -> RolloutAggregate:
+    """Run one continuation per seed from a pickled base world (runs in a worker)."""
+    world: World = pickle.loads(base)
+    aggregate = RolloutAggregate()
+    for seed in seeds:
+        rollout = world.fork(seed=seed)
+        while rollout.step():
+            pass
+        aggregate.add(rollout)
+    return aggregate
+
+
+class RolloutService:
+    """Monte Carlo outcome estimates for live simulations, cached by (simulation_id, turn, K).
+
+    Rollout ``i`` from turn ``t`` always uses ``rollout_seed(seed, t, i)`` and
+    chunks are merged in seed order, so an estimate does not depend on the
+    worker count or on which worker finishes first. Convergence is checked
+    after each merged chunk once ``min_rollouts`` have run; later chunks are
+    cancelled or discarded.
+    """
+
+    def __init__(
+        self,
+        workers: int | None = None,  # None: one per CPU; 0: run rollouts in this process
+        chunk_size: int = DEFAULT_CHUNK,
+        tolerance: float = DEFAULT_TOLERANCE,
+        min_rollouts: int = MIN_ROLLOUTS,
+        cache_size: int = CACHE_SIZE,
+    ) -> None:
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be positive")
+        self.workers = (os.cpu_count() or 1) if workers is None else workers
+        self.chunk_size = chunk_size
+        self.tolerance = tolerance
+        self.min_rollouts = min_rollouts
+        self.cache_size = cache_size
+        self._cache: OrderedDict[tuple[str, int, int], dict[str, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def estimate(self, simulation_id: str, world: World, rollouts: int = DEFAULT_ROLLOUTS) -> dict[str, Any]:
+        """Win, elimination and final-balance estimates for every agent of ``world``.
+
+        Reads and pickles ``world`` on the calling thread, so that thread must
+        own it; callers that run rollouts off-thread take the turn and base
+        themselves and hand ``estimate_base`` only the bytes.
+        """
+        turn = world.turns_completed
+        cached = self.cached(simulation_id, turn, rollouts)
+        if cached is not None:
+            return cached
+        return self.estimate_base(simulation_id, turn, world.seed, rollout_base(world), rollouts)
+
+    def cached(self, simulation_id: str, turn: int, rollouts: int) -> dict[str, Any] | None:
+        """A previous estimate for this simulation, turn and K, if still cached."""
+        if rollouts < 1:
+            raise ValueError("rollouts must be positive")
+        key = (simulation_id, turn, rollouts)
+        with self._lock:
+            cached = self._cache.get(key)
+            if cached is not None:
+                self._cache.move_to_end(key)
+            return cached
+
+    def estimate_base(self, simulation_id: str, turn: int, seed: int, base: bytes, rollouts: int) -> dict[str, Any]:
+        """Run and cache an estimate from ``rollout_base`` bytes taken at ``turn``; never touches the live world."""
+        if rollouts < 1:
+            raise ValueError("rollouts must be positive")
+        result = self._estimate(turn, seed, base, rollouts)
+        result.update(simulation_id=simulation_id, turn=turn, requested=rollouts)
+        with self._lock:
+            self._cache[(simulation_id, turn, rollouts)] = result
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+        return result
+
+    def _estimate(self, turn: int, seed: int, base: bytes, rollouts: int) -> dict[str, Any]:
+        seeds = [rollout_seed(seed, turn, i) for i in range(rollouts)]
+        chunks = [seeds[i:i + self.chunk_size] for i in range(0, rollouts, self.chunk_size)]
+        aggregate = RolloutAggregate()
+        converged = False
+
+        if self.workers <= 0:
+            for chunk in chunks:
+                aggregate.merge(run_rollouts(base, chunk))
+                if converged := self._converged(aggregate):
+                    break
+        else:
+            with ProcessPoolExecutor(max_workers=self.workers) as pool:
+                futures = [pool.submit(run_rollouts, base, chunk) for chunk in chunks]
+                for future in futures:
+                    aggregate.merge(future.result())
+                    if converged := self._converged(aggregate):
+                        for pending in futures:
+                            pending.cancel()
+                        break
+
+        summary = aggregate.summary()
+        summary["converged"] = converged
+        summary["max_ci_half_width"] = round(aggregate.max_half_width(), 6)
+        return summary
+
+    def _converged(self, aggregate: RolloutAggregate) -> bool:
+        return aggregate.runs >= self.min_rollouts and aggregate.max_half_width() <= self.tolerance
+
+
+rollout_service = RolloutService()
@@ -5,6 +5,7 @@ from ..agents.greedy import GreedyAgent
 from ..agents.politician import PoliticianAgent
 from ..agents.warlord import WarlordAgent
 from ..domain.world import World
+from .config_service import config_service
 
 
 class SimulationService:
@@ -26,27 +27,17 @@ class SimulationService:
         # Build agents
         agents = self._build_agents(agent_count)
 
-        # Load configs
-        import yaml
-        import os
-        config_dir = os.path.join(os.path.dirname(__file__), "..", "config")
+        # Load configs (parsed once, re-read when a file changes)
+        config = config_service.load()
+        max_turns = turns if turns is not None else config.world.max_turns
 
-        with open(os.path.join(config_dir, "world.yaml"), "r") as f:
-            world_cfg = yaml.safe_load(f)
-
-        with open(os.path.join(config_dir, "rules.yaml"), "r") as f:
-            rules_cfg = yaml.safe_load(f)
-
-        max_turns = turns if turns is not None else int(world_cfg["max_turns"])
-
-        # Create world
+        # Create world; every world shares the cached base rules
         world = World(
             agents=agents,
-            rules=rules_cfg,
+            rules=config.rules,
             max_turns=max_turns,
             seed=seed,
-            initial_resource_range=world_cfg["initial_resource_range"],
-            strength_range=world_cfg["strength_range"],
+            **config.world.world_kwargs(),
         )
 
         return world
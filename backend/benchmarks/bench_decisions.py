@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import yaml
+
+ROOT = Path(__file__).resolve().parent
+PARENT = ROOT.parent
+if str(PARENT) not in sys.path:
+    sys.path.insert(0, str(PARENT))
+
+from app.domain.world import World
+from app.agents import CheaterAgent, GreedyAgent, PoliticianAgent, WarlordAgent
+
+
+CONFIG_DIR = PARENT / "app" / "config"
+CLASSES = [GreedyAgent, CheaterAgent, PoliticianAgent, WarlordAgent]
+
+
+def build_world(agent_count: int, turns: int, seed: int, batch: bool) -> World:
+    with (CONFIG_DIR / "world.yaml").open("r", encoding="utf-8") as f:
+        world_cfg = yaml.safe_load(f)
+    with (CONFIG_DIR / "rules.yaml").open("r", encoding="utf-8") as f:
+        rules_cfg = yaml.safe_load(f)
+    # One contiguous block per strategy, so each block is a single batch run.
+    agents = [CLASSES[i * len(CLASSES) // agent_count]() for i in range(agent_count)]
+    return World(
+        agents=agents,
+        rules=rules_cfg,
+        max_turns=turns,
+        seed=seed,
+        initial_resource_range=world_cfg["initial_resource_range"],
+        strength_range=world_cfg["strength_range"],
+        batch_decisions=batch,
+    )
+
+
+def measure(agent_count: int, turns: int, seed: int, batch: bool) -> tuple[float, int]:
+    world = build_world(agent_count, turns, seed, batch)
+    start = time.perf_counter()
+    while world.step():
+        pass
+    elapsed = time.perf_counter() - start
+    return elapsed, sum(world.action_counts.values())
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="World.step throughput, sequential vs batched decisions")
+    parser.add_argument("--agents", type=int, nargs="+", default=[1_000, 10_000])
+    parser.add_argument("--turns", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument(
+        "--sequential-limit",
+        type=int,
+        default=2_000,
+        help="Skip the sequential mode above this many agents (it is quadratic per turn)",
+    )
+    args = parser.parse_args()
+
+    print(f"{'agents':>8} {'mode':<11} {'s/turn':>9} {'decisions/s':>12}")
+    for agent_count in args.agents:
+        modes = [True] if agent_count > args.sequential_limit else [False, True]
+        for batch in modes:
+            elapsed, decisions = measure(agent_count, args.turns, args.seed, batch)
+            mode = "batched" if batch else "sequential"
+            print(f"{agent_count:>8} {mode:<11} {elapsed / args.turns:>9.3f} {decisions / elapsed:>12.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import yaml
+
+ROOT = Path(__file__).resolve().parent
+PARENT = ROOT.parent
+if str(PARENT) not in sys.path:
+    sys.path.insert(0, str(PARENT))
+
+from app.domain.world import World
+from app.agents import BrainPool, CheaterAgent, GreedyAgent, PoliticianAgent, WarlordAgent
+
+
+CONFIG_DIR = PARENT / "app" / "config"
+CLASSES = [GreedyAgent, CheaterAgent, PoliticianAgent, WarlordAgent]
+
+
+def build_world(agents: list, turns: int, seed: int, rng_mode: str) -> World:
+    with (CONFIG_DIR / "world.yaml").open("r", encoding="utf-8") as f:
+        world_cfg = yaml.safe_load(f)
+    with (CONFIG_DIR / "rules.yaml").open("r", encoding="utf-8") as f:
+        rules_cfg = yaml.safe_load(f)
+    return World(
+        agents=agents,
+        rules=rules_cfg,
+        max_turns=turns,
+        seed=seed,
+        initial_resource_range=world_cfg["initial_resource_range"],
+        strength_range=world_cfg["strength_range"],
+        batch_decisions=True,
+        rng_mode=rng_mode,
+        turn_mode="simultaneous" if rng_mode == "streams" else "sequential",
+    )
+
+
+def measure(agent_count: int, turns: int, seed: int, rng_mode: str, workers: int) -> tuple[float, str, int]:
+    # The default interleaved roster, as SimulationService builds it.
+    brains = [CLASSES[i % len(CLASSES)]() for i in range(agent_count)]
+    pool = BrainPool(workers=workers, deadline=None) if workers else None
+    agents = pool.wrap_all(brains) if pool else brains
+    world = build_world(agents, turns, seed, rng_mode)
+    try:
+        if pool:
+            pool.start()
+        start = time.perf_counter()
+        while world.step():
+            pass
+        elapsed = time.perf_counter() - start
+    finally:
+        if pool:
+            pool.close()
+    return elapsed, world.logger.digest(), pool.stats["requests"] if pool else 0
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Per-turn cost of out-of-process brains vs in-process decide")
+    parser.add_argument("--agents", type=int, nargs="+", default=[100, 1_000])
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4])
+    parser.add_argument("--turns", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    print(f"{'agents':>8} {'rng':<8} {'brains':<11} {'s/turn':>9} {'overhead':>9} {'req/turn':>9} {'digest':>7}")
+    for agent_count in args.agents:
+        for rng_mode in ("legacy", "streams"):
+            base, digest, _ = measure(agent_count, args.turns, args.seed, rng_mode, 0)
+            print(f"{agent_count:>8} {rng_mode:<8} {'in-process':<11} {base / args.turns:>9.4f} {'':>9} {'':>9} {'':>7}")
+            for workers in args.workers:
+                elapsed, remote_digest, requests = measure(agent_count, args.turns, args.seed, rng_mode, workers)
+                overhead = (elapsed - base) / args.turns
+                same = "same" if remote_digest == digest else "DIFF"
+                label = f"{workers} worker" + ("s" if workers > 1 else "")
+                print(
+                    f"{agent_count:>8} {rng_mode:<8} {label:<11} {elapsed / args.turns:>9.4f} "
+                    f"{overhead:>+9.4f} {requests / args.turns:>9.1f} {same:>7}"
+                )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,51 @@
+from __future__ import annotations
+
+import argparse
+import sys
+import timeit
+from pathlib import Path
+
+import yaml
+
+ROOT = Path(__file__).resolve().parent
+PARENT = ROOT.parent
+if str(PARENT) not in sys.path:
+    sys.path.insert(0, str(PARENT))
+
+from app.domain.actions import Action, ActionType
+from app.core.rules import CompiledValidator, RuleSet
+
+
+CONFIG_DIR = PARENT / "app" / "config"
+
+SAMPLE_ACTIONS = {
+    ActionType.WORK: Action(actor=0, kind=ActionType.WORK),
+    ActionType.STEAL: Action(actor=0, kind=ActionType.STEAL, target=1),
+    ActionType.ATTACK: Action(actor=0, kind=ActionType.ATTACK, target=1),
+    ActionType.PROPOSE_RULE: Action(actor=0, kind=ActionType.PROPOSE_RULE, payload={"key": "attack_cost", "value": 9}),
+    ActionType.VOTE_RULE: Action(actor=0, kind=ActionType.VOTE_RULE, payload={"vote": "yes"}),
+    ActionType.TRADE: Action(actor=0, kind=ActionType.TRADE, target=1, payload={"offer": 2, "request": 1}),
+    ActionType.COALITION_ATTACK: Action(actor=0, kind=ActionType.COALITION_ATTACK, target=1),
+}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Per-action RuleSet validation cost")
+    parser.add_argument("--number", type=int, default=200_000, help="Validations per action kind")
+    args = parser.parse_args()
+
+    with (CONFIG_DIR / "rules.yaml").open("r", encoding="utf-8") as f:
+        rules = RuleSet(values=yaml.safe_load(f))
+    state = {"token_balance": 20}
+
+    print(f"{'action':<18} {'ns/validate':>12}")
+    for kind, action in SAMPLE_ACTIONS.items():
+        seconds = timeit.timeit(lambda: rules.validate_action(action, state), number=args.number)
+        print(f"{kind.value:<18} {seconds / args.number * 1e9:>12.1f}")
+
+    rebuild = timeit.timeit(lambda: CompiledValidator(rules.values, rules.version), number=args.number // 100)
+    print(f"{'rebuild':<18} {rebuild / (args.number // 100) * 1e9:>12.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from pathlib import Path
+from random import Random
+
+ROOT = Path(__file__).resolve().parent
+PARENT = ROOT.parent
+if str(PARENT) not in sys.path:
+    sys.path.insert(0, str(PARENT))
+
+import app.domain  # noqa: F401  (resolves the core/domain import order)
+from app.core.spatial import SpatialHash
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Spatial hash cost with every agent moving each turn")
+    parser.add_argument("--agents", type=int, default=10_000)
+    parser.add_argument("--turns", type=int, default=20)
+    parser.add_argument("--size", type=float, default=1000.0, help="Side length of the square world")
+    parser.add_argument("--radius", type=float, default=10.0, help="Interaction radius (also the cell size)")
+    parser.add_argument("--step", type=float, default=5.0, help="Max displacement per move")
+    parser.add_argument("--k", type=int, default=8)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    rng = Random(args.seed)
+    grid = SpatialHash(cell_size=args.radius)
+    for aid in range(args.agents):
+        grid.insert(aid, (rng.uniform(0, args.size), rng.uniform(0, args.size)))
+
+    move_s = radius_s = knn_s = 0.0
+    found = 0
+    for _ in range(args.turns):
+        start = time.perf_counter()
+        for aid in range(args.agents):
+            x, y = grid.positions[aid]
+            nx = min(args.size, max(0.0, x + rng.uniform(-args.step, args.step)))
+            ny = min(args.size, max(0.0, y + rng.uniform(-args.step, args.step)))
+            grid.move(aid, (nx, ny))
+        move_s += time.perf_counter() - start
+
+        start = time.perf_counter()
+        for aid in range(args.agents):
+            found += len(grid.neighbors_within(aid, args.radius))
+        radius_s += time.perf_counter() - start
+
+        start = time.perf_counter()
+        for aid in range(args.agents):
+            grid.k_nearest(aid, args.k)
+        knn_s += time.perf_counter() - start
+
+    ops = args.agents * args.turns
+    print(f"agents={args.agents} turns={args.turns} cells={len(grid._cells)} mean_neighbors={found / ops:.2f}")
+    print(f"{'operation':<18} {'us/op':>10} {'s/turn':>10}")
+    for name, seconds in (("move", move_s), ("neighbors_within", radius_s), (f"k_nearest(k={args.k})", knn_s)):
+        print(f"{name:<18} {seconds / ops * 1e6:>10.2f} {seconds / args.turns:>10.3f}")
+
+
+if __name__ == "__main__":
+    main()
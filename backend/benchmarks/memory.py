@@ -0,0 +1,223 @@
+from __future__ import annotations
+
+import argparse
+import enum
+import gc
+import json
+import sys
+import tracemalloc
+import types
+from pathlib import Path
+from typing import Any, Iterable
+
+ROOT = Path(__file__).resolve().parent
+PARENT = ROOT.parent
+if str(PARENT) not in sys.path:
+    sys.path.insert(0, str(PARENT))
+
+from benchmarks.suite import build_world
+from app.domain.world import World
+from app.services.simulation_service import SimulationService
+
+
+# Upper bounds enforced by --check, with headroom over the default 20-agent
+# run (about 475 bytes/event, 33 bytes/agent-turn of history, 2 KB/agent of
+# world state, 97 KB per fresh manager entry, 0.6 KB of rules per world).
+BUDGETS = {
+    "event_bytes": 1_000,  # EventLogger bytes per logged event
+    "agent_history_bytes_per_agent_turn": 64,  # AgentHistory columns
+    "rule_history_bytes_per_version": 4_096,  # RuleSet history + version snapshots
+    "reputation_bytes_per_agent": 512,  # ReputationBook
+    "alliance_bytes_per_agent": 512,  # AllianceIndex and pending proposals
+    "bounded_state_bytes": 1_048_576,  # Windowed turn timings and the inequality series
+    "world_state_bytes_per_agent": 4_096,  # World minus the components above
+    "steady_growth_bytes_per_turn": 64,  # Retained growth outside log and history, late in the run
+    "manager_entry_bytes": 256_000,  # One SimulationManager entry right after /start
+    "rules_bytes_per_world": 2_048,  # Rules, validator and resolver tables a fresh world adds
+}
+
+# Objects that are shared program state rather than owned by a component.
+_SKIP = (type, types.ModuleType, types.FunctionType, types.BuiltinFunctionType, types.MethodType, enum.Enum)
+
+
+def deep_sizeof(roots: Iterable[Any], seen: set[int]) -> int:
+    """Bytes reachable from ``roots`` that are not already in ``seen``.
+
+    Passing the same ``seen`` set to successive calls attributes shared
+    objects to the first component that reaches them.
+    """
+    total = 0
+    stack = list(roots)
+    while stack:
+        obj = stack.pop()
+        if id(obj) in seen or isinstance(obj, _SKIP):
+            continue
+        seen.add(id(obj))
+        total += sys.getsizeof(obj)
+        if isinstance(obj, dict):
+            stack.extend(obj.keys())
+            stack.extend(obj.values())
+        elif isinstance(obj, (list, tuple, set, frozenset)) or type(obj).__name__ == "deque":
+            stack.extend(obj)
+        else:
+            attrs = getattr(obj, "__dict__", None)
+            if attrs is not None:
+                stack.append(attrs)
+            for cls in type(obj).__mro__:
+                for slot in cls.__dict__.get("__slots__", ()):
+                    if hasattr(obj, slot):
+                        stack.append(getattr(obj, slot))
+    return total
+
+
+def component_bytes(world: World) -> dict[str, int]:
+    seen: set[int] = set()
+    rules = world.rule_set
+    return {
+        "event_logger": deep_sizeof([world.logger], seen),
+        "rule_history": deep_sizeof([rules.history, rules._versions, rules._version_turns], seen),
+        "reputation": deep_sizeof([world.reputation], seen),
+        "alliances": deep_sizeof([world.alliance_index, world.alliance_proposals], seen),
+        "agent_history": deep_sizeof([world.history], seen),
+        "bounded_state": deep_sizeof([world.turn_timings, world.profiler, world.inequality], seen),
+        "world_state": deep_sizeof([world], seen),
+    }
+
+
+def manager_entry_bytes(agent_count: int, seed: int, entries: int) -> float | None:
+    try:
+        from app.api.routes.simulation import SimulationManager
+    except ImportError:
+        return None
+    manager = SimulationManager()
+    gc.collect()
+    before = tracemalloc.get_traced_memory()[0]
+    for i in range(entries):
+        manager.create_simulation({"agent_count": agent_count, "seed": seed + i, "turns": None})
+    gc.collect()
+    return (tracemalloc.get_traced_memory()[0] - before) / entries
+
+
+def rules_bytes_per_world(agent_count: int, seed: int, worlds: int) -> float:
+    """Rule state each new world adds; the shared base config is counted once."""
+    service = SimulationService()
+    built = [service.create_world(agent_count=agent_count, seed=seed + i, turns=None) for i in range(worlds)]
+    seen: set[int] = set()
+    total = sum(deep_sizeof([w.rule_set, w.resolver.params], seen) for w in built)
+    return total / worlds
+
+
+def run(args: argparse.Namespace) -> dict[str, Any]:
+    tracemalloc.start(args.frames)
+    world = build_world(args.agents, args.turns, args.seed, args.new_features)
+    checkpoints = []
+    step = max(1, args.turns // args.samples)
+    midpoint = None
+    while world.step():
+        if world.turns_completed % step == 0:
+            gc.collect()
+            current, _ = tracemalloc.get_traced_memory()
+            checkpoints.append({"turn": world.turns_completed, "traced_bytes": current})
+            if midpoint is None and world.turns_completed >= args.turns // 2:
+                midpoint = {**checkpoints[-1], **component_bytes(world)}
+    gc.collect()
+    current, peak = tracemalloc.get_traced_memory()
+    parts = component_bytes(world)
+    sites = tracemalloc.take_snapshot().statistics("filename")[: args.top]
+    manager = manager_entry_bytes(min(20, max(5, args.agents)), args.seed, 20)
+    rules_per_world = rules_bytes_per_world(min(20, max(5, args.agents)), args.seed, 100)
+    tracemalloc.stop()
+
+    turns = max(1, world.turns_completed)
+    events = max(1, len(world.logger.events))
+    agents = len(world.agent_slots)
+    growing = ("event_logger", "agent_history", "rule_history")
+
+    # Retained growth over the second half of the run, net of the parts that
+    # grow by design; anything else growing per turn is a leak.
+    steady = None
+    if midpoint is not None and world.turns_completed > midpoint["turn"]:
+        end = {"turn": world.turns_completed, "traced_bytes": current, **parts}
+        outside = lambda cp: cp["traced_bytes"] - sum(cp[name] for name in growing)
+        steady = (outside(end) - outside(midpoint)) / (end["turn"] - midpoint["turn"])
+
+    ratios = {
+        "event_bytes": parts["event_logger"] / events,
+        "agent_history_bytes_per_agent_turn": parts["agent_history"] / (agents * turns),
+        "rule_history_bytes_per_version": parts["rule_history"] / world.rule_set.version,
+        "reputation_bytes_per_agent": parts["reputation"] / agents,
+        "alliance_bytes_per_agent": parts["alliances"] / agents,
+        "bounded_state_bytes": parts["bounded_state"],
+        "world_state_bytes_per_agent": parts["world_state"] / agents,
+        "steady_growth_bytes_per_turn": steady,
+        "manager_entry_bytes": manager,
+        "rules_bytes_per_world": rules_per_world,
+    }
+    return {
+        "config": {
+            "agents": agents,
+            "turns": world.turns_completed,
+            "seed": args.seed,
+            "new_features": args.new_features,
+            "events": len(world.logger.events),
+            "rules_version": world.rule_set.version,
+        },
+        "traced": {"current_bytes": current, "peak_bytes": peak},
+        "components": parts,
+        "ratios": ratios,
+        "allocation_sites": [
+            {"file": stat.traceback[0].filename, "bytes": stat.size, "blocks": stat.count} for stat in sites
+        ],
+        "checkpoints": checkpoints,
+    }
+
+
+def check(ratios: dict[str, float | None]) -> list[str]:
+    failures = []
+    for name, limit in BUDGETS.items():
+        value = ratios.get(name)
+        if value is not None and value > limit:
+            failures.append(f"{name}: {value:,.1f} > {limit:,}")
+    return failures
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="tracemalloc memory report and per-component byte budgets")
+    parser.add_argument("--agents", type=int, default=20)
+    parser.add_argument("--turns", type=int, default=20_000)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--new-features", action="store_true")
+    parser.add_argument("--samples", type=int, default=10, help="Memory checkpoints over the run")
+    parser.add_argument("--frames", type=int, default=1, help="tracemalloc traceback depth")
+    parser.add_argument("--top", type=int, default=10, help="Allocation sites to list")
+    parser.add_argument("--check", action="store_true", help="Exit 1 if any budget is exceeded")
+    parser.add_argument("--out", help="Write the full report as JSON")
+    args = parser.parse_args()
+
+    report = run(args)
+    cfg, traced = report["config"], report["traced"]
+    print(f"{cfg['agents']} agents, {cfg['turns']} turns, {cfg['events']} events, rules v{cfg['rules_version']}")
+    print(f"traced: {traced['current_bytes'] / 2**20:.1f} MiB retained, {traced['peak_bytes'] / 2**20:.1f} MiB peak")
+    print(f"\n{'component':<16} {'bytes':>14}")
+    for name, size in report["components"].items():
+        print(f"{name:<16} {size:>14,}")
+    print(f"\n{'budget':<38} {'value':>12} {'limit':>10}")
+    for name, value in report["ratios"].items():
+        shown = "n/a" if value is None else f"{value:,.1f}"
+        print(f"{name:<38} {shown:>12} {BUDGETS[name]:>10,}")
+    print(f"\n{'allocation site':<60} {'bytes':>14}")
+    for site in report["allocation_sites"]:
+        print(f"{site['file'][-60:]:<60} {site['bytes']:>14,}")
+
+    if args.out:
+        Path(args.out).write_text(json.dumps(report, indent=2) + "\n", encoding="utf-8")
+    if args.check:
+        failures = check(report["ratios"])
+        for failure in failures:
+            print(f"OVER BUDGET {failure}")
+        if failures:
+            raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,296 @@
+from __future__ import annotations
+
+import argparse
+import json
+import platform
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Iterator
+
+ROOT = Path(__file__).resolve().parent
+PARENT = ROOT.parent
+if str(PARENT) not in sys.path:
+    sys.path.insert(0, str(PARENT))
+
+from app.domain.world import World
+from app.agents import BrainPool, CheaterAgent, GreedyAgent, PoliticianAgent, WarlordAgent
+from app.services.event_narrator import EventNarrator
+from app.services.config_service import ConfigService, config_service
+from app.services.metrics_service import MetricsService
+from app.services.replay_service import ReplayService
+from app.services.simulation_service import SimulationService
+
+
+BASELINE_DIR = ROOT / "baselines"
+CLASSES = [GreedyAgent, CheaterAgent, PoliticianAgent, WarlordAgent]
+SUITE_VERSION = 1
+
+# One result: case name -> {"seconds": median seconds per op, "unit": op label, ...extra}
+Result = tuple[str, dict[str, Any]]
+
+
+def build_world(agent_count: int, turns: int, seed: int, new_features: bool = False) -> World:
+    config = config_service.load()
+    return World(
+        agents=[CLASSES[i % len(CLASSES)]() for i in range(agent_count)],
+        rules=config.rules,
+        max_turns=turns,
+        seed=seed,
+        initial_resource_range=config.world.initial_resource_range,
+        strength_range=config.world.strength_range,
+        enable_new_features=new_features,
+    )
+
+
+def run_world(agent_count: int, turns: int, seed: int) -> World:
+    world = build_world(agent_count, turns, seed)
+    while world.step():
+        pass
+    return world
+
+
+def median_time(fn: Callable[[], Any], repeats: int, number: int = 1) -> float:
+    """Median over ``repeats`` of the mean seconds per call across ``number`` calls."""
+    samples = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        for _ in range(number):
+            fn()
+        samples.append((time.perf_counter() - start) / number)
+    return statistics.median(samples)
+
+
+def bench_step(args: argparse.Namespace) -> Iterator[Result]:
+    for agent_count in args.agents:
+        # A decision costs O(agents), so scale turns by 1/agents^2 to bound each repeat.
+        turns = max(3, 20_000 // (agent_count * agent_count))
+        for new_features in (False, True):
+            samples = []
+            for rep in range(args.repeats):
+                world = build_world(agent_count, turns, args.seed + rep, new_features)
+                start = time.perf_counter()
+                done = 0
+                while world.step():
+                    done += 1
+                samples.append((time.perf_counter() - start) / max(1, done))
+            flag = "features" if new_features else "plain"
+            yield f"step/{agent_count}_agents/{flag}", {"seconds": statistics.median(samples), "unit": "turn"}
+
+
+def bench_log_growth(args: argparse.Namespace) -> Iterator[Result]:
+    world = build_world(20, max(args.log_turns), args.seed)
+    for checkpoint in sorted(args.log_turns):
+        while world.turns_completed < checkpoint and world.step():
+            pass
+        events = len(world.logger.events)
+        number = max(1, 20_000 // max(1, events))
+        yield f"snapshot/{checkpoint}_turns", {
+            "seconds": median_time(world.snapshot, args.repeats, number),
+            "unit": "call",
+            "events": events,
+        }
+        yield f"digest/{checkpoint}_turns", {
+            "seconds": median_time(world.logger.digest, args.repeats, number),
+            "unit": "call",
+            "events": events,
+        }
+
+
+def bench_analytics(args: argparse.Namespace) -> Iterator[Result]:
+    result = run_world(20, max(args.log_turns), args.seed).snapshot()
+    events = len(result["events"])
+    yield "analytics/compute_metrics", {
+        "seconds": median_time(lambda: MetricsService.compute_metrics(result), args.repeats),
+        "unit": "call",
+        "events": events,
+    }
+    yield "analytics/narrate_events", {
+        "seconds": median_time(lambda: EventNarrator.narrate_events(result["events"]), args.repeats),
+        "unit": "call",
+        "events": events,
+    }
+
+
+def bench_replays(args: argparse.Namespace) -> Iterator[Result]:
+    result = run_world(10, 200, args.seed).snapshot()
+    with tempfile.TemporaryDirectory() as tmp:
+        service = ReplayService(replay_dir=tmp)
+        yield "replay/save", {
+            "seconds": median_time(lambda: service.save_replay("sim-0", result), args.repeats, 5),
+            "unit": "call",
+            "events": len(result["events"]),
+        }
+        for i in range(1, args.replays):
+            service.save_replay(f"sim-{i}", result)
+        yield "replay/load", {
+            "seconds": median_time(lambda: service.load_replay("sim-0"), args.repeats, 5),
+            "unit": "call",
+        }
+        yield "replay/list", {
+            "seconds": median_time(service.list_replays, args.repeats),
+            "unit": "call",
+            "replays": args.replays,
+        }
+
+
+def bench_start(args: argparse.Namespace) -> Iterator[Result]:
+    """What POST /start does below the HTTP layer: build a world and take its first snapshot."""
+    service = SimulationService()
+
+    def start() -> None:
+        service.create_world(agent_count=20, seed=args.seed, turns=None).snapshot()
+
+    yield "start/create_world", {"seconds": median_time(start, args.repeats, 50), "unit": "call"}
+    yield "start/config_parse", {
+        "seconds": median_time(lambda: ConfigService().load(), args.repeats, 20),
+        "unit": "call",
+    }
+
+
+def _fork_case(world: World, repeats: int) -> dict[str, Any]:
+    tracemalloc.start()
+    forked = world.fork()
+    added, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del forked
+    return {
+        "seconds": median_time(world.fork, repeats, 20),
+        "unit": "call",
+        "events": len(world.logger.events),
+        "bytes": added,
+    }
+
+
+def bench_fork(args: argparse.Namespace) -> Iterator[Result]:
+    """World.fork at growing run lengths; time and bytes should stay flat as the log grows."""
+    world = build_world(20, max(args.log_turns), args.seed)
+    for checkpoint in sorted(args.log_turns):
+        while world.turns_completed < checkpoint and world.step():
+            pass
+        yield f"fork/{checkpoint}_turns", _fork_case(world, args.repeats)
+
+    # Brains hosted by a BrainPool are shared with the fork, not copied.
+    config = config_service.load()
+    with BrainPool(workers=2, deadline=None) as pool:
+        remote = World(
+            agents=pool.wrap_all([CLASSES[i % len(CLASSES)]() for i in range(20)]),
+            rules=config.rules,
+            max_turns=min(args.log_turns),
+            seed=args.seed,
+            initial_resource_range=config.world.initial_resource_range,
+            strength_range=config.world.strength_range,
+            batch_decisions=True,
+            rng_mode="streams",
+            turn_mode="simultaneous",
+        )
+        while remote.step():
+            pass
+        yield f"fork/remote_brains_{remote.turns_completed}_turns", _fork_case(remote, args.repeats)
+
+
+def bench_api(args: argparse.Namespace) -> Iterator[Result]:
+    try:
+        from fastapi.testclient import TestClient
+    except ImportError:
+        print("  api: skipped (fastapi test client not installed)")
+        return
+    from app.main import app
+
+    client = TestClient(app)
+    sim_id = client.post(
+        "/api/v1/simulation/start", json={"agent_count": 10, "seed": args.seed, "turns": 1000}
+    ).json()["simulation_id"]
+    yield "api/step", {
+        "seconds": median_time(
+            lambda: client.post(f"/api/v1/simulation/{sim_id}/step", json={"steps": 1}), args.repeats, 20
+        ),
+        "unit": "request",
+    }
+    yield "api/events", {
+        "seconds": median_time(lambda: client.get(f"/api/v1/simulation/{sim_id}/events"), args.repeats, 20),
+        "unit": "request",
+    }
+
+
+GROUPS: dict[str, Callable[[argparse.Namespace], Iterator[Result]]] = {
+    "step": bench_step,
+    "log": bench_log_growth,
+    "analytics": bench_analytics,
+    "replay": bench_replays,
+    "start": bench_start,
+    "fork": bench_fork,
+    "api": bench_api,
+}
+
+
+def run(args: argparse.Namespace) -> None:
+    results: dict[str, dict[str, Any]] = {}
+    for group in args.groups:
+        for name, entry in GROUPS[group](args):
+            results[name] = entry
+            print(f"  {name:<32} {entry['seconds'] * 1e3:>12.4f} ms/{entry['unit']}")
+    report = {
+        "suite_version": SUITE_VERSION,
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "machine": platform.platform(),
+        "results": results,
+    }
+    out = Path(args.out)
+    out.parent.mkdir(parents=True, exist_ok=True)
+    out.write_text(json.dumps(report, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+    print(f"wrote {out}")
+
+
+def compare(args: argparse.Namespace) -> None:
+    base = json.loads(Path(args.baseline).read_text(encoding="utf-8"))["results"]
+    new = json.loads(Path(args.current).read_text(encoding="utf-8"))["results"]
+    regressions = 0
+    print(f"{'case':<34} {'baseline ms':>12} {'current ms':>12} {'ratio':>7}")
+    for name in sorted(base.keys() | new.keys()):
+        if name not in base or name not in new:
+            print(f"{name:<34} {'only in ' + ('baseline' if name in base else 'current'):>33}")
+            continue
+        ratio = new[name]["seconds"] / base[name]["seconds"] if base[name]["seconds"] else float("inf")
+        flag = ""
+        if ratio > 1 + args.threshold:
+            flag, regressions = "  REGRESSION", regressions + 1
+        elif ratio < 1 - args.threshold:
+            flag = "  faster"
+        print(f"{name:<34} {base[name]['seconds'] * 1e3:>12.4f} {new[name]['seconds'] * 1e3:>12.4f} {ratio:>7.2f}{flag}")
+    print(f"{regressions} regression(s) beyond {args.threshold:.0%}")
+    if regressions:
+        raise SystemExit(1)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Engine, analytics, persistence and API benchmarks")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = sub.add_parser("run", help="Run the suite and write a JSON report")
+    run_parser.add_argument("--groups", nargs="+", choices=sorted(GROUPS), default=list(GROUPS))
+    run_parser.add_argument("--agents", type=int, nargs="+", default=[5, 20, 100, 1_000])
+    run_parser.add_argument("--log-turns", type=int, nargs="+", default=[100, 300, 1_000])
+    run_parser.add_argument("--replays", type=int, default=20, help="Stored replays for replay/list")
+    run_parser.add_argument("--repeats", type=int, default=5)
+    run_parser.add_argument("--seed", type=int, default=42)
+    run_parser.add_argument("--out", default=str(BASELINE_DIR / "current.json"))
+    run_parser.set_defaults(func=run)
+
+    compare_parser = sub.add_parser("compare", help="Flag cases slower than a baseline report")
+    compare_parser.add_argument("current", nargs="?", default=str(BASELINE_DIR / "current.json"))
+    compare_parser.add_argument("--baseline", default=str(BASELINE_DIR / "baseline.json"))
+    compare_parser.add_argument("--threshold", type=float, default=0.25, help="Allowed slowdown, 0.25 = 25%%")
+    compare_parser.set_defaults(func=compare)
+
+    args = parser.parse_args()
+    args.func(args)
+
+
+if __name__ == "__main__":
+    main()
@@ -24,7 +24,7 @@ sys.path.insert(0, str(BACKEND_PATH))
 from app.services.simulation_service import SimulationService
 from app.services.analytics_service import AnalyticsService
 from app.domain.world import World
-import yaml
+from app.services.config_service import config_service
 
 
 def run_demo_simulation():
@@ -34,15 +34,13 @@ def run_demo_simulation():
     print("="*60)
     
     # Load configurations
-    config_dir = BACKEND_PATH / "app" / "config"
-    world_cfg = yaml.safe_load(open(config_dir / "world.yaml"))
-    rules_cfg = yaml.safe_load(open(config_dir / "rules.yaml"))
+    world_cfg = config_service.load().world
     
     print("🔧 Initializing deterministic simulation...")
     print(f"   - Seed: 42")
     print(f"   - Agents: 8")
-    print(f"   - Max Turns: {world_cfg['max_turns']}")
-    print(f"   - Initial Token Range: {world_cfg['initial_resource_range']}")
+    print(f"   - Max Turns: {world_cfg.max_turns}")
+    print(f"   - Initial Token Range: {list(world_cfg.initial_resource_range)}")
     
     # Create simulation service and world
     service = SimulationService()
@@ -25,7 +25,7 @@ from app.agents.greedy import GreedyAgent
 from app.agents.cheater import CheaterAgent
 from app.agents.politician import PoliticianAgent
 from app.agents.warlord import WarlordAgent
-import yaml
+from app.services.config_service import config_service
 
 
 def run_simulation_with_new_features():
@@ -44,9 +44,7 @@ def run_simulation_with_new_features():
     print()
     
     # Load configurations
-    config_dir = BACKEND_PATH / "app" / "config"
-    world_cfg = yaml.safe_load(open(config_dir / "world.yaml"))
-    rules_cfg = yaml.safe_load(open(config_dir / "rules.yaml"))
+    config = config_service.load()
     
     print("🔧 Initializing simulation...")
     print(f"   - Seed: 42")
@@ -68,11 +66,11 @@ def run_simulation_with_new_features():
     # Create world with new features enabled
     world = World(
         agents=agents,
-        rules=rules_cfg,
+        rules=config.rules,
         max_turns=100,
         seed=42,
-        initial_resource_range=world_cfg['initial_resource_range'],
-        strength_range=world_cfg['strength_range'],
+        initial_resource_range=config.world.initial_resource_range,
+        strength_range=config.world.strength_range,
         enable_new_features=True  # Enable new features!
     )
     
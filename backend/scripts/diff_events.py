@@ -0,0 +1,52 @@
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent
+PARENT = ROOT.parent
+if str(PARENT) not in sys.path:
+    sys.path.insert(0, str(PARENT))
+
+import app.domain  # noqa: F401  (app.core imports resolve through app.domain)
+from app.core.event_diff import DEFAULT_LIMIT, diff_event_streams, diff_segment_dirs, encoded_lines
+
+
+def _events(path: Path) -> list:
+    """Events of an exported run, a saved replay, or a bare snapshot JSON file."""
+    with path.open("r", encoding="utf-8") as f:
+        payload = json.load(f)
+    for key in ("result", "data"):
+        if isinstance(payload.get(key), dict):
+            payload = payload[key]
+    return payload.get("events", [])
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Aligned diff of two event logs, turn by turn")
+    parser.add_argument("left", help="Spill directory (manifest + segments) or run/replay JSON file")
+    parser.add_argument("right", help="Spill directory (manifest + segments) or run/replay JSON file")
+    parser.add_argument("--limit", type=int, default=DEFAULT_LIMIT, help="Differences to list")
+    args = parser.parse_args()
+
+    left, right = Path(args.left), Path(args.right)
+    if left.is_dir() and right.is_dir():
+        diff = diff_segment_dirs(left, right, args.limit)
+    else:
+        diff = diff_event_streams(encoded_lines(_events(left)), encoded_lines(_events(right)), args.limit)
+
+    summary = diff.summary()
+    print(json.dumps({key: value for key, value in summary.items() if key != "differences"}, indent=2))
+    for d in summary["differences"]:
+        print(
+            f"turn {d['turn']:>6} actor {d['actor']:>3} {d['action']:<18} {d['kind']:<10} "
+            f"{d['field']}: {d['values'][0]} vs {d['values'][1]}"
+        )
+    if not diff.identical:
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
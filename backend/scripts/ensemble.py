@@ -0,0 +1,57 @@
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent
+PARENT = ROOT.parent
+if str(PARENT) not in sys.path:
+    sys.path.insert(0, str(PARENT))
+
+from app.services.ensemble_service import EnsembleAggregator, iter_export_metrics
+from app.services.metrics_service import MetricsService
+from app.services.simulation_service import SimulationService
+
+
+def run_chunk(seeds: list[int], agent_count: int, turns: int | None) -> EnsembleAggregator:
+    service = SimulationService()
+    aggregator = EnsembleAggregator()
+    for seed in seeds:
+        result = service.create_world(agent_count=agent_count, seed=seed, turns=turns).run()
+        aggregator.add(MetricsService.compute_metrics(result))
+    return aggregator
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Aggregate metrics across many runs of The Cheater's Dilemma")
+    parser.add_argument("--agents", type=int, default=10, help="Number of agents (5-20)")
+    parser.add_argument("--seeds", type=int, default=100, help="Number of consecutive seeds to run")
+    parser.add_argument("--seed-start", type=int, default=1, help="First seed")
+    parser.add_argument("--turns", type=int, default=None, help="Optional override for turn count")
+    parser.add_argument("--workers", type=int, default=1, help="Worker processes; partial aggregates are merged")
+    parser.add_argument("--from-exports", nargs="*", default=None, help="Aggregate exported JSON files instead of running")
+    args = parser.parse_args()
+
+    if args.from_exports is not None:
+        aggregator = EnsembleAggregator().add_all(iter_export_metrics(args.from_exports))
+    else:
+        seeds = list(range(args.seed_start, args.seed_start + args.seeds))
+        workers = max(1, args.workers)
+        chunks = [seeds[i::workers] for i in range(workers)]
+        aggregator = EnsembleAggregator()
+        if workers == 1:
+            aggregator.merge(run_chunk(seeds, args.agents, args.turns))
+        else:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                futures = [pool.submit(run_chunk, chunk, args.agents, args.turns) for chunk in chunks if chunk]
+                for future in futures:
+                    aggregator.merge(future.result())
+
+    print(json.dumps(aggregator.summary(), indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+import argparse
+import os
+import shutil
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent
+PARENT = ROOT.parent
+if str(PARENT) not in sys.path:
+    sys.path.insert(0, str(PARENT))
+
+from app.agents.cheater import CheaterAgent
+from app.agents.greedy import GreedyAgent
+from app.agents.politician import PoliticianAgent
+from app.agents.warlord import WarlordAgent
+from app.core.segments import digest_segments
+from app.domain.world import World
+from app.services.config_service import config_service
+
+
+def _rss_mib() -> float:
+    """Current resident set size, from /proc where available."""
+    try:
+        with open("/proc/self/statm", encoding="ascii") as f:
+            pages = int(f.read().split()[1])
+        return pages * os.sysconf("SC_PAGE_SIZE") / 2**20
+    except (OSError, ValueError, AttributeError):
+        import resource
+
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Bounded-memory long run with disk-spilled event segments")
+    parser.add_argument("--agents", type=int, default=20)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--turns", type=int, default=1_000_000)
+    parser.add_argument("--spill-dir", default=None, help="Keep segments here (default: a temp dir, removed after)")
+    parser.add_argument("--window", type=int, default=10_000, help="Events kept in memory")
+    parser.add_argument("--rules-window", type=int, default=1_000, help="Rule versions kept in memory")
+    parser.add_argument("--history-capacity", type=int, default=4_096, help="Per-agent history turns kept")
+    parser.add_argument("--report-every", type=int, default=100_000)
+    args = parser.parse_args()
+
+    spill_dir = Path(args.spill_dir) if args.spill_dir else Path(tempfile.mkdtemp(prefix="cheaters-events-"))
+    config = config_service.load()
+    classes = [GreedyAgent, CheaterAgent, PoliticianAgent, WarlordAgent]
+    world = World(
+        agents=[classes[i % len(classes)]() for i in range(args.agents)],
+        rules=config.rules,
+        max_turns=args.turns,
+        seed=args.seed,
+        initial_resource_range=config.world.initial_resource_range,
+        strength_range=config.world.strength_range,
+        event_spill_dir=str(spill_dir),
+        event_window=args.window,
+        rules_window=args.rules_window,
+        history_capacity=args.history_capacity,
+    )
+
+    print(f"{'turn':>10} {'events':>12} {'segments':>9} {'rules':>6} {'rss MiB':>8} {'turns/s':>8}")
+    start = last = time.perf_counter()
+    last_turn = 0
+    try:
+        while world.step():
+            turn = world.turns_completed
+            if turn % args.report_every == 0:
+                now = time.perf_counter()
+                rate = (turn - last_turn) / (now - last)
+                segments = len(world.logger.events.segments)
+                rules = len(world.rule_set.history)
+                print(f"{turn:>10} {len(world.logger.events):>12} {segments:>9} {rules:>6} {_rss_mib():>8.1f} {rate:>8.0f}")
+                last, last_turn = now, turn
+        world.close()
+        elapsed = time.perf_counter() - start
+        digest = world.logger.digest()
+        recomputed = digest_segments(spill_dir)
+        print(f"turns={world.turns_completed} events={len(world.logger.events)} elapsed={elapsed:.0f}s")
+        print(f"log_digest={digest}")
+        print(f"segments digest {'matches' if recomputed == digest else 'MISMATCH ' + recomputed}")
+        rule_set = world.rule_set
+        versions = [entry["version"] for entry in rule_set.full_history()]
+        complete = sorted(set(versions)) == list(range(rule_set.initial_version + 1, rule_set.version + 1))
+        print(
+            f"rules version={rule_set.version} changes={len(versions)} in memory={len(rule_set.history)} "
+            f"history {'complete' if complete else 'INCOMPLETE'}"
+        )
+        if recomputed != digest or not complete:
+            raise SystemExit(1)
+    finally:
+        if args.spill_dir is None:
+            shutil.rmtree(spill_dir, ignore_errors=True)
+        else:
+            print(f"segments and manifest in {spill_dir}")
+
+
+if __name__ == "__main__":
+    main()
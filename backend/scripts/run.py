@@ -6,8 +6,6 @@ import sys
 from pathlib import Path
 from typing import Any
 
-import yaml
-
 ROOT = Path(__file__).resolve().parent
 PARENT = ROOT.parent
 if str(PARENT) not in sys.path:
@@ -19,14 +17,7 @@ from app.agents.politician import PoliticianAgent
 from app.agents.warlord import WarlordAgent
 from app.services.analytics_service import AnalyticsService
 from app.domain.world import World
-
-
-CONFIG_DIR = PARENT / "app" / "config"
-
-
-def _load_yaml(path: Path) -> dict[str, Any]:
-    with path.open("r", encoding="utf-8") as f:
-        return yaml.safe_load(f)
+from app.services.config_service import config_service
 
 
 def _build_agents(count: int):
@@ -38,17 +29,16 @@ def run_simulation(agent_count: int, seed: int, turns: int | None = None) -> dic
     if not (5 <= agent_count <= 20):
         raise ValueError("agent_count must be within [5, 20]")
 
-    world_cfg = _load_yaml(CONFIG_DIR / "world.yaml")
-    rules_cfg = _load_yaml(CONFIG_DIR / "rules.yaml")
-    max_turns = turns if turns is not None else int(world_cfg["max_turns"])
+    config = config_service.load()
+    max_turns = turns if turns is not None else config.world.max_turns
 
     world = World(
         agents=_build_agents(agent_count),
-        rules=rules_cfg,
+        rules=config.rules,
         max_turns=max_turns,
         seed=seed,
-        initial_resource_range=world_cfg["initial_resource_range"],
-        strength_range=world_cfg["strength_range"],
+        initial_resource_range=config.world.initial_resource_range,
+        strength_range=config.world.strength_range,
     )
     return world.run()
 
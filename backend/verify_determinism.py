@@ -2,185 +2,132 @@
 """
 Determinism Verification Script
 
-This script runs the simulation multiple times with the same seed
-and verifies that the results are identical every time.
-
-This proves that:
-1. The simulation is deterministic
-2. Same seed = same results
-3. No external randomness or async operations
-4. Reproducible for verification
+Runs every cell of a seeds x agent counts x feature flags matrix several
+times, each replicate in its own freshly spawned process, and records a
+chained hash of agent state plus logged events after every turn. Replicates
+of a cell must agree at every turn; when they do not, the first divergent
+turn is found by bisecting the per-turn hashes and reported with the actor,
+action and field that differ.
+
+Spawned workers get their own string hash seed (unless PYTHONHASHSEED is
+set), so set-iteration-order bugs show up as divergences too.
 """
 
+import argparse
 import json
+import multiprocessing
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Dict, Any
-import hashlib
+from typing import Any, Dict, List, Tuple
 
 # Add backend to path
 BACKEND_PATH = Path(__file__).parent
 sys.path.insert(0, str(BACKEND_PATH))
 
-from app.services.simulation_service import SimulationService
-
-
-def compute_result_hash(result: Dict[str, Any]) -> str:
-    """Compute a hash of the simulation result for comparison."""
-    # Extract deterministic fields
-    hash_data = {
-        "seed": result.get("seed"),
-        "turns_completed": result.get("turns_completed"),
-        "rules_version": result.get("rules_version"),
-        "leaderboard": result.get("leaderboard"),
-        "alive": result.get("alive"),
-        "action_counts": result.get("action_counts"),
-        "event_count": result.get("event_count"),
-    }
-    
-    # Create deterministic JSON string
-    json_string = json.dumps(hash_data, sort_keys=True, separators=(',', ':'))
-    
-    # Compute SHA256 hash
-    hash_bytes = hashlib.sha256(json_string.encode()).digest()
-    
-    return hash_bytes.hex()
-
-
-def run_simulation(seed: int, agent_count: int, turns: int) -> Dict[str, Any]:
-    """Run a single simulation and return results."""
-    service = SimulationService()
-    world = service.create_world(
-        agent_count=agent_count,
+from app.agents import CheaterAgent, GreedyAgent, PoliticianAgent, WarlordAgent
+from app.core.trace import TurnRecord, first_divergence, trace_world
+from app.domain.world import World
+from app.services.config_service import config_service
+
+
+CLASSES = [GreedyAgent, CheaterAgent, PoliticianAgent, WarlordAgent]
+
+# World arguments layered over world.yaml for each --flags name.
+FLAG_SETS: Dict[str, Dict[str, Any]] = {
+    "plain": {},
+    "features": {"enable_new_features": True},
+    "batch": {"batch_decisions": True},
+    "streams": {"rng_mode": "streams"},
+    "simultaneous": {"rng_mode": "streams", "turn_mode": "simultaneous"},
+    "aggregate": {"event_verbosity": "aggregate"},
+    "radius": {"interaction_radius": 3.0, "enable_new_features": True},
+}
+
+Cell = Tuple[int, int, str]  # (seed, agent count, flag set)
+
+
+def run_trace(cell: Cell, turns: int) -> List[TurnRecord]:
+    """Run one replicate of a matrix cell and return its per-turn trace (runs in a worker)."""
+    seed, agent_count, flags = cell
+    config = config_service.load()
+    world = World(
+        agents=[CLASSES[i % len(CLASSES)]() for i in range(agent_count)],
+        rules=config.rules,
+        max_turns=turns,
         seed=seed,
-        turns=turns
+        **{**config.world.world_kwargs(), **FLAG_SETS[flags]},
     )
-    return world.run()
-
-
-def verify_determinism(seed: int = 42, agent_count: int = 8, turns: int = 200, runs: int = 3):
-    """
-    Run the simulation multiple times and verify results are identical.
-    
-    Args:
-        seed: Random seed to use
-        agent_count: Number of agents
-        turns: Number of turns
-        runs: Number of times to run the simulation
-    """
-    print("="*60)
-    print("DETERMINISM VERIFICATION")
-    print("="*60)
-    print(f"\nConfiguration:")
-    print(f"  - Seed: {seed}")
-    print(f"  - Agents: {agent_count}")
-    print(f"  - Turns: {turns}")
-    print(f"  - Runs: {runs}")
-    print(f"\nRunning {runs} simulations with identical parameters...")
-    print("-"*60)
-    
-    results = []
-    hashes = []
-    
-    for i in range(runs):
-        print(f"\n🎮 Run {i+1}/{runs}...")
-        result = run_simulation(seed, agent_count, turns)
-        result_hash = compute_result_hash(result)
-        
-        results.append(result)
-        hashes.append(result_hash)
-        
-        # Print summary
-        winner = result["leaderboard"][0]
-        print(f"   ✅ Completed: {result['turns_completed']} turns")
-        print(f"   🏆 Winner: Agent {winner['agent_id']} ({winner['strategy']}) with {winner['token_balance']} tokens")
-        print(f"   📊 Alive: {len(result['alive'])}/{agent_count}")
-        print(f"   🔐 Hash: {result_hash[:16]}...")
-    
-    # Verify all hashes are identical
-    print("\n" + "="*60)
-    print("VERIFICATION RESULTS")
-    print("="*60)
-    
-    all_identical = all(h == hashes[0] for h in hashes)
-    
-    if all_identical:
-        print("\n✅ SUCCESS: All runs produced IDENTICAL results!")
-        print(f"\n   Common hash: {hashes[0]}")
-        print("\n   This proves:")
-        print("   ✅ Simulation is deterministic")
-        print("   ✅ Same seed = same results")
-        print("   ✅ No external randomness")
-        print("   ✅ Reproducible for verification")
-        
-        # Detailed comparison
-        print("\n📊 Detailed Comparison:")
-        for i in range(runs):
-            result = results[i]
-            winner = result["leaderboard"][0]
-            print(f"\n   Run {i+1}:")
-            print(f"     - Turns: {result['turns_completed']}")
-            print(f"     - Winner: Agent {winner['agent_id']} ({winner['strategy']})")
-            print(f"     - Winner Balance: {winner['token_balance']}")
-            print(f"     - Alive: {len(result['alive'])}")
-            print(f"     - Events: {result['event_count']}")
-            print(f"     - Rules Version: {result['rules_version']}")
-        
-        # Verify leaderboards are identical
-        print("\n🏆 Leaderboard Verification:")
-        for i in range(min(3, agent_count)):
-            agent_data = [r["leaderboard"][i] for r in results]
-            all_same = all(
-                a["agent_id"] == agent_data[0]["agent_id"] and
-                a["token_balance"] == agent_data[0]["token_balance"] and
-                a["alive"] == agent_data[0]["alive"]
-                for a in agent_data
-            )
-            status = "✅" if all_same else "❌"
-            print(f"   {status} Position {i+1}: Agent {agent_data[0]['agent_id']} - {agent_data[0]['token_balance']} tokens")
-        
-        print("\n" + "="*60)
-        print("✅ DETERMINISM VERIFIED")
-        print("="*60)
-        return True
-        
-    else:
-        print("\n❌ FAILURE: Runs produced DIFFERENT results!")
-        print("\n   Hashes:")
-        for i, h in enumerate(hashes):
-            print(f"   Run {i+1}: {h}")
-        
-        print("\n   This indicates:")
-        print("   ❌ Non-deterministic behavior detected")
-        print("   ❌ External randomness or async operations")
-        print("   ❌ Results are not reproducible")
-        
-        print("\n" + "="*60)
-        print("❌ DETERMINISM VERIFICATION FAILED")
-        print("="*60)
-        return False
+    return trace_world(world)
+
+
+def verify_matrix(cells: List[Cell], turns: int, replicates: int, workers: int) -> List[Dict[str, Any]]:
+    """Trace every cell ``replicates`` times in parallel and compare each replicate to the first."""
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=workers, mp_context=context) as pool:
+        futures = {
+            cell: [pool.submit(run_trace, cell, turns) for _ in range(replicates)]
+            for cell in cells
+        }
+        reports = []
+        for cell, pending in futures.items():
+            reference = pending[0].result()
+            report: Dict[str, Any] = {
+                "seed": cell[0],
+                "agents": cell[1],
+                "flags": cell[2],
+                "turns": len(reference),
+                "digest": reference[-1].digest if reference else None,
+                "divergences": [],
+            }
+            for replicate, future in enumerate(pending[1:], start=1):
+                divergence = first_divergence(reference, future.result())
+                if divergence is not None:
+                    report["divergences"].append({"replicate": replicate, **divergence})
+            reports.append(report)
+    return reports
+
+
+def format_report(report: Dict[str, Any]) -> str:
+    cell = f"seed={report['seed']:<6} agents={report['agents']:<3} flags={report['flags']:<12}"
+    if not report["divergences"]:
+        digest = (report["digest"] or "")[:16]
+        return f"  ok        {cell} turns={report['turns']:<5} digest={digest}"
+    lines = [f"  DIVERGED  {cell}"]
+    for d in report["divergences"]:
+        where = f"actor={d['actor']} action={d['action']} field={d['field']}"
+        lines.append(f"    replicate {d['replicate']}: turn {d['turn']} ({d['source']}) {where} values={d['values']}")
+    return "\n".join(lines)
 
 
 def main():
-    """Main verification function."""
-    print("\n🔬 Starting Determinism Verification...\n")
-    
-    # Test with default parameters
-    success = verify_determinism(seed=42, agent_count=8, turns=200, runs=3)
-    
-    if success:
-        print("\n🎉 All tests passed!")
-        print("\nThe simulation is proven to be deterministic.")
-        print("Same seed will always produce the same results.")
-        print("\nYou can now confidently:")
-        print("  1. Deploy tokens based on simulation results")
-        print("  2. Verify results by replaying with same seed")
-        print("  3. Trust the on-chain distribution")
-        sys.exit(0)
-    else:
-        print("\n⚠️  Determinism verification failed!")
-        print("Please investigate the source of non-determinism.")
+    parser = argparse.ArgumentParser(description="Check replicate runs agree turn by turn across a config matrix")
+    parser.add_argument("--seeds", type=int, nargs="+", default=[42], help="Seeds to run")
+    parser.add_argument("--agents", type=int, nargs="+", default=[8], help="Agent counts to run")
+    parser.add_argument("--flags", nargs="+", choices=sorted(FLAG_SETS), default=["plain"], help="Feature flag sets")
+    parser.add_argument("--turns", type=int, default=200, help="Turns per run")
+    parser.add_argument("--replicates", type=int, default=3, help="Runs per matrix cell")
+    parser.add_argument("--workers", type=int, default=None, help="Worker processes (default: one per CPU)")
+    parser.add_argument("--json", default=None, help="Also write the full report to this file")
+    args = parser.parse_args()
+
+    if args.replicates < 2:
+        parser.error("--replicates must be at least 2")
+    cells = [(seed, agents, flags) for seed in args.seeds for agents in args.agents for flags in args.flags]
+    print(f"Verifying {len(cells)} configurations x {args.replicates} replicates, {args.turns} turns each")
+
+    reports = verify_matrix(cells, args.turns, args.replicates, args.workers or multiprocessing.cpu_count())
+    for report in reports:
+        print(format_report(report))
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(reports, f, indent=2)
+
+    diverged = sum(1 for report in reports if report["divergences"])
+    if diverged:
+        print(f"FAILED: {diverged}/{len(reports)} configurations diverged")
         sys.exit(1)
+    print(f"OK: all {len(reports)} configurations are deterministic turn by turn")
 
 
 if __name__ == "__main__":
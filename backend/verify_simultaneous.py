@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+Simultaneous-Move Conformance Check
+
+Runs simultaneous-mode simulations (stream RNG) with decisions made in this
+thread and on thread and process pools of several sizes, and checks that
+every configuration produces the same event log digest and final snapshot.
+It also prints the average per-turn decide/resolve wall-clock split.
+"""
+
+import argparse
+import hashlib
+import json
+import random
+import sys
+from pathlib import Path
+
+import yaml
+
+# Add backend to path
+BACKEND_PATH = Path(__file__).parent
+sys.path.insert(0, str(BACKEND_PATH))
+
+from app.agents import CheaterAgent, GreedyAgent, PoliticianAgent, WarlordAgent, create_clear_agent
+from app.domain.world import World
+
+
+CONFIG_DIR = BACKEND_PATH / "app" / "config"
+CLEAR_TYPES = ["conservative", "aggressive", "balanced", "politician", "opportunist"]
+CONFIGS = [(0, "thread"), (1, "thread"), (2, "thread"), (4, "thread"), (2, "process"), (3, "process")]
+
+
+def build_agents(rng: random.Random) -> list:
+    classes = [GreedyAgent, CheaterAgent, PoliticianAgent, WarlordAgent]
+    agents = [rng.choice(classes)() for _ in range(rng.randint(5, 20))]
+    agents += [create_clear_agent(rng.choice(CLEAR_TYPES)) for _ in range(rng.randint(0, 4))]
+    return agents
+
+
+def run_once(seed: int, spec: dict, workers: int, executor: str, world_cfg: dict, rules_cfg: dict) -> tuple[str, World]:
+    world = World(
+        agents=build_agents(random.Random(spec["roster_seed"])),
+        rules=json.loads(json.dumps(rules_cfg)),
+        max_turns=spec["turns"],
+        seed=seed,
+        initial_resource_range=world_cfg["initial_resource_range"],
+        strength_range=world_cfg["strength_range"],
+        enable_new_features=spec["new_features"],
+        rng_mode="streams",
+        turn_mode="simultaneous",
+        decision_workers=workers,
+        decision_executor=executor,
+    )
+    result = world.run()
+    result.pop("events")
+    digest = hashlib.sha256(json.dumps(result, sort_keys=True, default=str).encode()).hexdigest()
+    return digest, world
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Check simultaneous mode is independent of the worker count")
+    parser.add_argument("--runs", type=int, default=20, help="Randomized simulations to run")
+    parser.add_argument("--seed", type=int, default=0, help="Seed for the run generator")
+    args = parser.parse_args()
+
+    with open(CONFIG_DIR / "world.yaml") as f:
+        world_cfg = yaml.safe_load(f)
+    with open(CONFIG_DIR / "rules.yaml") as f:
+        rules_cfg = yaml.safe_load(f)
+
+    rng = random.Random(args.seed)
+    decide_s = resolve_s = 0.0
+    turns = 0
+    for _ in range(args.runs):
+        seed = rng.randint(0, 10**9)
+        spec = {"roster_seed": rng.randint(0, 10**9), "turns": rng.randint(20, 120), "new_features": rng.random() < 0.5}
+        digests = {}
+        for workers, executor in CONFIGS:
+            digest, world = run_once(seed, spec, workers, executor, world_cfg, rules_cfg)
+            digests[(workers, executor)] = digest
+            if workers == 0:
+                decide_s += sum(t["decide_s"] for t in world.turn_timings)
+                resolve_s += sum(t["resolve_s"] for t in world.turn_timings)
+                turns += len(world.turn_timings)
+        if len(set(digests.values())) != 1:
+            raise AssertionError(f"seed {seed}: digests differ across worker counts: {digests}")
+
+    print(f"OK: {args.runs} simulations x {len(CONFIGS)} worker configurations agree")
+    print(f"in-thread per turn: decide {decide_s / turns * 1e3:.3f} ms, resolve {resolve_s / turns * 1e3:.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""
+Vote Tally Conformance Check
+
+Runs many randomized simulations and checks, at every governance
+resolution attempt, that the incremental VoteTally reaches the same
+pass/fail decision as rescanning every alive agent's balance and vote.
+It also fuzzes the tally directly with random balance writes, votes and
+eliminations.
+"""
+
+import argparse
+import random
+import sys
+from pathlib import Path
+
+import yaml
+
+# Add backend to path
+BACKEND_PATH = Path(__file__).parent
+sys.path.insert(0, str(BACKEND_PATH))
+
+from app.agents import CheaterAgent, GreedyAgent, PoliticianAgent, WarlordAgent, create_clear_agent
+from app.core.balances import TrackedBalances
+from app.core.governance import GovernanceSystem, _decide
+from app.domain.world import World
+
+
+CONFIG_DIR = BACKEND_PATH / "app" / "config"
+CLEAR_TYPES = ["conservative", "aggressive", "balanced", "politician", "opportunist"]
+
+
+class CheckedGovernance(GovernanceSystem):
+    """GovernanceSystem that cross-checks the tally against full summation."""
+
+    checks = 0
+
+    def try_resolve(self, alive_ids, turn, force=False, token_balances=None):
+        if self.pending is not None and alive_ids:
+            expected = self.decide_by_summation(alive_ids, token_balances or {})
+            actual = _decide(self.tally.total, self.tally.yes, self.tally.no)
+            if expected != actual:
+                raise AssertionError(f"turn {turn}: tally {actual} != summation {expected}")
+            CheckedGovernance.checks += 1
+        return super().try_resolve(alive_ids, turn, force=force, token_balances=token_balances)
+
+
+def build_world(seed: int, rng: random.Random, world_cfg: dict, rules_cfg: dict) -> World:
+    classes = [GreedyAgent, CheaterAgent, PoliticianAgent, WarlordAgent]
+    agents = [rng.choice(classes)() for _ in range(rng.randint(5, 20))]
+    agents += [create_clear_agent(rng.choice(CLEAR_TYPES)) for _ in range(rng.randint(0, 4))]
+    world = World(
+        agents=agents,
+        rules=dict(rules_cfg),
+        max_turns=rng.randint(20, 120),
+        seed=seed,
+        initial_resource_range=world_cfg["initial_resource_range"],
+        strength_range=world_cfg["strength_range"],
+        enable_new_features=rng.random() < 0.5,
+    )
+    checked = CheckedGovernance(rules=world.rule_set)
+    world.token_balances.listeners.remove(world.governance.tally.on_balance_change)
+    world.governance = checked
+    world.token_balances.subscribe(checked.attach_tally(world.alive, world.token_balances).on_balance_change)
+    return world
+
+
+def fuzz_tally(rng: random.Random, steps: int = 200) -> None:
+    ids = list(range(rng.randint(1, 15)))
+    balances = TrackedBalances({aid: rng.randint(0, 30) for aid in ids})
+    governance = GovernanceSystem(rules=None)
+    tally = governance.attach_tally(ids, balances)
+    balances.subscribe(tally.on_balance_change)
+    alive = set(ids)
+    governance.pending = {"proposal_id": 1}
+    for _ in range(steps):
+        op = rng.random()
+        aid = rng.choice(ids)
+        if op < 0.5:
+            balances[aid] += rng.randint(-5, 8)
+        elif op < 0.8:
+            governance.vote(aid, rng.choice(["yes", "no"]))
+        elif op < 0.9 and aid in alive and len(alive) > 1:
+            alive.discard(aid)
+            tally.on_removed(aid)
+        else:
+            governance._clear_votes()
+        expected = governance.decide_by_summation(alive, balances)
+        actual = _decide(tally.total, tally.yes, tally.no)
+        if expected != actual:
+            raise AssertionError(f"fuzz: tally {actual} != summation {expected}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Check VoteTally against full summation")
+    parser.add_argument("--runs", type=int, default=2000, help="Randomized simulations to run")
+    parser.add_argument("--fuzz", type=int, default=5000, help="Randomized tally fuzz sequences")
+    parser.add_argument("--seed", type=int, default=0, help="Seed for the run generator")
+    args = parser.parse_args()
+
+    with open(CONFIG_DIR / "world.yaml") as f:
+        world_cfg = yaml.safe_load(f)
+    with open(CONFIG_DIR / "rules.yaml") as f:
+        rules_cfg = yaml.safe_load(f)
+
+    rng = random.Random(args.seed)
+    for _ in range(args.runs):
+        build_world(rng.randint(0, 10**9), rng, world_cfg, rules_cfg).run()
+    for _ in range(args.fuzz):
+        fuzz_tally(rng)
+
+    print(f"OK: {args.runs} simulations ({CheckedGovernance.checks} resolution checks), {args.fuzz} fuzz sequences")
+
+
+if __name__ == "__main__":
+    main()